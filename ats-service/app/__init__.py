@@ -8,6 +8,8 @@ Architecture:
 - routes/: HTTP endpoint handlers
 - services/: Business logic (parsing, extraction, scoring)
 - utils/: Helper functions (text cleaning, etc.)
+- config.py / thread_budget.py: Settings and per-worker thread limits
+- warmup.py: Startup warmup behind GET /ready
 - models/: Data schemas and response structures
 """
 
@@ -15,6 +17,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import logging.config
+
+# Before anything imports NumPy, scikit-learn or torch (nltk already pulls
+# in NumPy), so their thread pools start at this worker's share of the
+# cores instead of one thread per core
+from app.thread_budget import apply_thread_budget
+apply_thread_budget()
+
 import nltk
 from nltk.corpus import stopwords
 
@@ -23,6 +32,9 @@ from app.config import (
     APP_DESCRIPTION,
     APP_VERSION,
     ALLOWED_ORIGINS,
+    ADMIN_TOKEN,
+    PROFILE_DIR,
+    PROFILE_SAMPLE_INTERVAL,
 )
 
 # ── Logging configuration ──────────────────────────────────────────
@@ -35,9 +47,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global state (populated by initialize_nlp_resources)
-SBERT_ENABLED = False
-sbert_model = None
+# Global state (populated by initialize_nlp_resources); the SBERT model
+# lives in app/services/similarity_backend.py
 STOP_WORDS = set()
 
 
@@ -46,30 +57,26 @@ def initialize_nlp_resources():
     Initialize NLP resources like stopwords and SBERT model.
     
     This function is called once when the application starts.
-    It downloads necessary NLTK data and attempts to load the SBERT model.
+    It downloads necessary NLTK data and starts loading the SBERT model
+    on a background thread; requests use TF-IDF until it is ready.
     
     Returns:
-        tuple: (sbert_model, SBERT_ENABLED, STOP_WORDS)
+        set: STOP_WORDS
     """
-    global sbert_model, SBERT_ENABLED, STOP_WORDS
+    global STOP_WORDS
     
     try:
         # Download stopwords if not already present
         nltk.download('stopwords', quiet=True)
         STOP_WORDS = set(stopwords.words('english'))
-
-        # SBERT model loading disabled on Windows due to Numpy compatibility issues
-        logger.info("SBERT model loading disabled on Windows (Numpy compatibility) — using TF-IDF")
-        sbert_model = None
-        SBERT_ENABLED = False
-
     except Exception as e:
-        logger.warning("Could not initialise NLP resources: %s — falling back to TF-IDF", e)
+        logger.warning("Could not load NLTK stopwords: %s — cleaning text without them", e)
         STOP_WORDS = set()
-        sbert_model = None
-        SBERT_ENABLED = False
+
+    from app.services.similarity_backend import start_default_backend
+    start_default_backend()
     
-    return sbert_model, SBERT_ENABLED, STOP_WORDS
+    return STOP_WORDS
 
 
 def create_app() -> FastAPI:
@@ -79,8 +86,12 @@ def create_app() -> FastAPI:
     This function:
     1. Creates a FastAPI instance
     2. Configures CORS middleware for cross-origin requests
-    3. Initializes NLP resources
-    4. Registers all routes
+    3. Installs the per-request profiler when an admin token is set
+    4. Initializes NLP resources
+    5. Loads the scoring rubric and starts watching its file
+    6. Registers all routes
+    7. Caps the native thread pools at this worker's thread budget
+    8. Starts the warmup that GET /ready waits for
     
     Returns:
         FastAPI: Configured FastAPI application instance
@@ -102,12 +113,39 @@ def create_app() -> FastAPI:
         allow_methods=["*"],  # Allow all HTTP methods
         allow_headers=["*"],  # Allow all headers
     )
+
+    # Opt-in per-request profiling; not installed at all without a token
+    if ADMIN_TOKEN:
+        from app.utils.profiler import ProfilingMiddleware
+        app.add_middleware(
+            ProfilingMiddleware,
+            admin_token=ADMIN_TOKEN,
+            output_dir=PROFILE_DIR,
+            interval=PROFILE_SAMPLE_INTERVAL,
+        )
     
     # Initialize NLP resources
     initialize_nlp_resources()
+
+    # Compile the scoring rubric and skill dictionary now (not on the first
+    # request) and reload them whenever their files change
+    from app.services.rubric import start_rubric_watcher
+    from app.services.skill_dictionary import start_skill_dictionary_watcher
+    start_rubric_watcher()
+    start_skill_dictionary_watcher()
     
     # Register routes
-    from app.routes import score
+    from app.routes import score, admin
     app.include_router(score.router)
+    app.include_router(admin.router)
+
+    # Cap the native thread pools loaded during startup (env variables
+    # only reach libraries that weren't imported yet)
+    apply_thread_budget()
+
+    # Push sample resumes through the pipeline in the background, so the
+    # first real request doesn't pay for cold caches (see app/warmup.py)
+    from app.warmup import start_warmup
+    start_warmup()
     
     return app
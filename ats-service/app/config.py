@@ -8,10 +8,15 @@ constants throughout the codebase.
 Usage:
     from app.config import HOST, PORT, ALLOWED_ORIGINS
 
+Storage locations can be overridden through environment variables so
+that every worker process on a host points at the same files.
+
 Do NOT place scoring algorithm constants here — those live alongside
 the logic they belong to (e.g., scoring_engine.py).
 """
 
+import os
+
 # ── Server settings ────────────────────────────────────────────────
 HOST: str = "0.0.0.0"
 PORT: int = 8000
@@ -33,9 +38,133 @@ ALLOWED_ORIGINS: list = [
 ]
 
 # ── NLP / Model settings ───────────────────────────────────────────
-# SBERT is disabled on Windows due to NumPy compatibility issues.
-# Switch to True only when running on a compatible Linux/macOS environment.
-SBERT_ENABLED: bool = False
+# Off by default: the service runs on TF-IDF unless ATS_SBERT_ENABLED=1.
+# When enabled, the SentenceTransformer loads on a background thread after
+# startup and requests use TF-IDF until it is warm (see
+# app/services/similarity_backend.py). Torch has NumPy compatibility
+# issues on Windows.
+SBERT_ENABLED: bool = os.getenv("ATS_SBERT_ENABLED", "0") == "1"
+# Model loaded at startup; stored embeddings and the ANN index must be
+# built with the same model
+SBERT_MODEL: str = os.getenv("ATS_SBERT_MODEL", os.getenv("SBERT_MODEL", "all-MiniLM-L6-v2"))
+
+# Encode resumes as section chunks that fit the model's input length and
+# pool the chunk scores: "mean", "max" or "jd-weighted" (see
+# app/services/chunked_encoding.py). 0 encodes the whole text as one input.
+SBERT_CHUNKING: bool = os.getenv("ATS_SBERT_CHUNKING", "1") != "0"
+SBERT_POOLING: str = os.getenv("ATS_SBERT_POOLING", "mean")
+
+# ── Thread budget ──────────────────────────────────────────────────
+# Worker processes sharing this host (uvicorn reads WEB_CONCURRENCY for
+# --workers too). Every native thread pool of a worker (BLAS/OpenMP,
+# torch, tokenizers) gets cores // workers threads unless
+# ATS_THREADS_PER_WORKER fixes the count (see app/thread_budget.py).
+WORKERS: int = int(os.getenv("ATS_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+THREADS_PER_WORKER: int = int(os.getenv("ATS_THREADS_PER_WORKER", "0"))
+
+# ── Extracted text cache ───────────────────────────────────────────
+# SQLite store shared by all workers, keyed by file hash + extractor
+# version. Oldest entries are evicted once the store exceeds the limit.
+TEXT_CACHE_ENABLED: bool = os.getenv("ATS_TEXT_CACHE_ENABLED", "1") != "0"
+TEXT_CACHE_PATH: str = os.getenv("ATS_TEXT_CACHE_PATH", os.path.join(".cache", "extracted_text.sqlite3"))
+TEXT_CACHE_MAX_BYTES: int = int(os.getenv("ATS_TEXT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# ── Extraction limits ─────────────────────────────────────────────
+# Each document is extracted in a killable child process. The memory
+# limit is headroom on top of the child's already-loaded interpreter.
+EXTRACTION_SANDBOX_ENABLED: bool = os.getenv("ATS_EXTRACTION_SANDBOX", "1") != "0"
+EXTRACTION_TIMEOUT_SECONDS: float = float(os.getenv("ATS_EXTRACTION_TIMEOUT", "20"))
+EXTRACTION_MEMORY_LIMIT_BYTES: int = int(os.getenv("ATS_EXTRACTION_MEMORY_LIMIT", str(512 * 1024 * 1024)))
+EXTRACTION_MAX_PAGES: int = int(os.getenv("ATS_EXTRACTION_MAX_PAGES", "50"))
+EXTRACTION_MAX_PDF_OBJECTS: int = int(os.getenv("ATS_EXTRACTION_MAX_PDF_OBJECTS", "50000"))
+EXTRACTION_MAX_DOCX_BYTES: int = int(os.getenv("ATS_EXTRACTION_MAX_DOCX_BYTES", str(100 * 1024 * 1024)))
+
+# ── Streaming extraction ───────────────────────────────────────────
+# Stop reading a document once its skills, education and experience
+# sections are closed and email and phone are found. Later pages are then
+# never parsed, so whole-text features (skill counts, project indicators,
+# relevance) only see the pages read; off by default for that reason.
+STREAMING_EARLY_STOP: bool = os.getenv("ATS_STREAMING_EARLY_STOP", "0") == "1"
+
+# ── Scoring rubric ─────────────────────────────────────────────────
+# Keyword lists and weights for heuristic scoring. Each worker polls the
+# file and recompiles it when it changes (0 disables polling).
+RUBRIC_PATH: str = os.getenv(
+    "ATS_RUBRIC_PATH", os.path.join(os.path.dirname(__file__), "data", "scoring_rubric.json")
+)
+RUBRIC_POLL_SECONDS: float = float(os.getenv("ATS_RUBRIC_POLL_SECONDS", "5"))
+
+# ── Skill dictionary ───────────────────────────────────────────────
+# Known skills and their aliases, matched against the full resume text.
+# Polled and recompiled on change like the rubric (0 disables polling).
+SKILL_DICTIONARY_PATH: str = os.getenv(
+    "ATS_SKILL_DICTIONARY_PATH", os.path.join(os.path.dirname(__file__), "data", "skills.json")
+)
+SKILL_DICTIONARY_POLL_SECONDS: float = float(os.getenv("ATS_SKILL_DICTIONARY_POLL_SECONDS", "5"))
+
+# ── Startup warmup ─────────────────────────────────────────────────
+# Each worker pushes the sample resumes in this directory (PDF and DOCX,
+# scored against job_descriptions.json) through the /parse pipeline once
+# at startup; GET /ready answers 200 only afterwards (see app/warmup.py).
+# The bundled samples come from
+# scripts/synthetic_corpus.py --out app/data/warmup --n 1 --jds 2 --seed 1
+WARMUP_ENABLED: bool = os.getenv("ATS_WARMUP", "1") != "0"
+WARMUP_DIR: str = os.getenv("ATS_WARMUP_DIR", os.path.join(os.path.dirname(__file__), "data", "warmup"))
+
+# ── Multi-JD parsing ──────────────────────────────────────────────
+# Most job descriptions one /parse-multi request may score against.
+PARSE_MULTI_MAX_JDS: int = int(os.getenv("ATS_PARSE_MULTI_MAX_JDS", "50"))
+
+# ── NDJSON streaming ───────────────────────────────────────────────
+# Records scored per step when /rescore-features streams its results;
+# each chunk is written out before the next one is scored.
+STREAM_CHUNK_SIZE: int = int(os.getenv("ATS_STREAM_CHUNK_SIZE", "256"))
+
+# ── Request coalescing ─────────────────────────────────────────────
+# Identical /parse and /parse-multi requests that arrive while the first
+# is still running (same file, JD and resume id) await its result.
+COALESCE_REQUESTS: bool = os.getenv("ATS_COALESCE_REQUESTS", "1") != "0"
+
+# ── Time budgets ───────────────────────────────────────────────────
+# Estimated stage costs used when a /parse or /parse-multi caller sends a
+# time budget (X-Time-Budget-Ms). The reserve covers sections, skills,
+# heuristics and TF-IDF relevance, which are never skipped.
+DEADLINE_RESERVE_SECONDS: float = float(os.getenv("ATS_DEADLINE_RESERVE_SECONDS", "0.05"))
+DEADLINE_SECONDS_PER_PDF_PAGE: float = float(os.getenv("ATS_DEADLINE_SECONDS_PER_PDF_PAGE", "0.08"))
+DEADLINE_SBERT_SECONDS_PER_TEXT: float = float(os.getenv("ATS_DEADLINE_SBERT_SECONDS_PER_TEXT", "0.1"))
+DEADLINE_FEEDBACK_SECONDS: float = float(os.getenv("ATS_DEADLINE_FEEDBACK_SECONDS", "0.005"))
+
+# ── Two-stage ranking ──────────────────────────────────────────────
+# With SBERT enabled, /rank lets TF-IDF pick this many candidates and
+# re-ranks only those with SBERT (never fewer than top_k; 0 = SBERT on all).
+RANK_PREFILTER: int = int(os.getenv("ATS_RANK_PREFILTER", "200"))
+
+# ── Resume store ───────────────────────────────────────────────────
+# Extracted text of parsed resumes, addressed by the backend's resume id.
+# Used by /rank to score known resumes without re-sending them.
+RESUME_STORE_PATH: str = os.getenv("ATS_RESUME_STORE_PATH", os.path.join(".cache", "resumes.sqlite3"))
+
+# ── Resume embedding store ─────────────────────────────────────────
+# Append-only matrix memory-mapped by every worker. "float16" halves the
+# size of float32; "int8" quarters it (per-row scale, small recall cost).
+# Compaction runs once this fraction of rows is garbage.
+EMBEDDING_STORE_DIR: str = os.getenv("ATS_EMBEDDING_STORE_DIR", os.path.join(".cache", "embeddings"))
+EMBEDDING_STORE_DTYPE: str = os.getenv("ATS_EMBEDDING_STORE_DTYPE", "float16")
+EMBEDDING_COMPACT_RATIO: float = float(os.getenv("ATS_EMBEDDING_COMPACT_RATIO", "0.5"))
+
+# ── ANN index over resume embeddings ──────────────────────────────
+# Built by scripts/build_ann_index.py; reloaded by workers when the file
+# changes. More lists = faster queries; more probes = better recall.
+ANN_INDEX_PATH: str = os.getenv("ATS_ANN_INDEX_PATH", os.path.join(".cache", "resume_ann_index.npz"))
+ANN_N_LISTS: int = int(os.getenv("ATS_ANN_N_LISTS", "64"))
+ANN_N_PROBE: int = int(os.getenv("ATS_ANN_N_PROBE", "8"))
+
+# ── Admin / profiling ─────────────────────────────────────────────
+# Admin endpoints and per-request profiling are disabled unless a token
+# is set. Profiled requests write .pstats + collapsed-stack files here.
+ADMIN_TOKEN: str = os.getenv("ATS_ADMIN_TOKEN", "")
+PROFILE_DIR: str = os.getenv("ATS_PROFILE_DIR", os.path.join(".cache", "profiles"))
+PROFILE_SAMPLE_INTERVAL: float = float(os.getenv("ATS_PROFILE_SAMPLE_INTERVAL", "0.005"))
 
 # ── Logging ────────────────────────────────────────────────────────
 LOG_LEVEL: str = "INFO"
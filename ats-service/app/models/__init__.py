@@ -18,7 +18,14 @@ from app.models.response_schema import (
 
 from app.models.request_schema import (
     ResumeScoreRequest,
-    ResumeTextRequest
+    ResumeTextRequest,
+    FeatureRecordItem,
+    RescoreFeaturesRequest,
+    RankResumeItem,
+    RankRequest,
+    JobDescriptionItem,
+    SimilarityMatrixRequest,
+    NearestResumesRequest
 )
 
 __all__ = [
@@ -35,4 +42,11 @@ __all__ = [
     # Request schemas
     'ResumeScoreRequest',
     'ResumeTextRequest',
+    'FeatureRecordItem',
+    'RescoreFeaturesRequest',
+    'RankResumeItem',
+    'RankRequest',
+    'JobDescriptionItem',
+    'SimilarityMatrixRequest',
+    'NearestResumesRequest',
 ]
@@ -8,6 +8,11 @@ without touching any business logic.
 Key models:
 - ResumeScoreRequest  – optional job description for the /parse endpoint
 - ResumeTextRequest   – two plain-text inputs for similarity endpoints
+- RescoreFeaturesRequest – stored feature records for /rescore-features
+- RankRequest         – job description plus candidate resumes for /rank
+- SimilarityMatrixRequest – many job descriptions for /similarity-matrix
+- JobDescriptionItem  – one entry of /parse-multi's job_descriptions list
+- NearestResumesRequest – JD text or embedding for /nearest-resumes
 
 Note: The /parse endpoint uses multipart file upload (FastAPI UploadFile),
 so these models are not wired directly into that route's signature.  They
@@ -15,7 +20,7 @@ serve as authoritative schema documentation and can be used by future
 JSON-body variants of the endpoints.
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -67,3 +72,130 @@ class ResumeTextRequest(BaseModel):
                 "text2": "We are hiring a Python backend developer with FastAPI and Docker skills.",
             }
         }
+
+
+class FeatureRecordItem(BaseModel):
+    """
+    One stored feature record, as returned by /parse.
+    """
+
+    features: Dict[str, Any] = Field(
+        ...,
+        description="Versioned feature record ('features' field of the /parse response).",
+    )
+    relevance: Optional[float] = Field(
+        None,
+        description=(
+            "Raw job-description similarity (0-1) stored with the record. "
+            "When omitted, the score is computed without a job description."
+        ),
+        ge=0.0,
+        le=1.0,
+    )
+
+
+class RescoreFeaturesRequest(BaseModel):
+    """
+    Feature records to rescore with the current scoring weights.
+
+    Used by:
+    - POST /rescore-features
+    """
+
+    records: List[FeatureRecordItem] = Field(
+        ...,
+        description="Feature records to rescore, in any order.",
+    )
+
+
+class RankResumeItem(BaseModel):
+    """
+    A resume supplied inline to /rank.
+    """
+
+    id: str = Field(..., description="Caller's identifier, echoed back in the results.")
+    text: str = Field(..., description="Resume text.")
+
+
+class RankRequest(BaseModel):
+    """
+    Job description and candidate resumes to rank against it.
+
+    Candidates can be resume ids the service already knows (stored by
+    /parse when called with resume_id), inline texts, or both.
+
+    Used by:
+    - POST /rank
+    """
+
+    job_description: str = Field(
+        ...,
+        description="Job description text to rank resumes against.",
+        min_length=1,
+    )
+    resume_ids: List[str] = Field(
+        default_factory=list,
+        description="Ids of resumes previously stored through /parse.",
+    )
+    resumes: List[RankResumeItem] = Field(
+        default_factory=list,
+        description="Resumes supplied inline.",
+    )
+    top_k: int = Field(10, description="Number of best matches to return.", ge=1, le=1000)
+    prefilter: Optional[int] = Field(
+        None,
+        description="TF-IDF candidates re-ranked with SBERT (0 scores all with SBERT; "
+                    "default ATS_RANK_PREFILTER).",
+        ge=0,
+        le=100000,
+    )
+
+
+class JobDescriptionItem(BaseModel):
+    """
+    A job description with the caller's identifier.
+    """
+
+    id: str = Field(..., description="Caller's identifier, echoed back in the results.")
+    text: str = Field(..., description="Job description text.")
+
+
+class SimilarityMatrixRequest(BaseModel):
+    """
+    Job descriptions to match against stored resumes.
+
+    Used by:
+    - POST /similarity-matrix
+    """
+
+    job_descriptions: List[JobDescriptionItem] = Field(
+        ...,
+        description="Job descriptions (one result row each).",
+        min_length=1,
+    )
+    resume_ids: Optional[List[str]] = Field(
+        None,
+        description="Restrict to these stored resume ids (default: every stored resume).",
+    )
+    top_k: int = Field(10, description="Matches to return per job description.", ge=1, le=1000)
+
+
+class NearestResumesRequest(BaseModel):
+    """
+    Query for the ANN resume index.
+
+    Supply either the job description text (encoded with SBERT) or a
+    precomputed JD embedding.
+
+    Used by:
+    - POST /nearest-resumes
+    """
+
+    job_description: Optional[str] = Field(None, description="Job description text.")
+    embedding: Optional[List[float]] = Field(None, description="Precomputed JD embedding.")
+    top_k: int = Field(10, description="Number of nearest resumes to return.", ge=1, le=1000)
+    n_probe: Optional[int] = Field(
+        None,
+        description="Index cells to scan (default from ATS_ANN_N_PROBE); higher = better recall.",
+        ge=1,
+    )
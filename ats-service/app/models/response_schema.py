@@ -72,6 +72,14 @@ class ATSScoreResponse(BaseModel):
     contact: Dict[str, Optional[str]] = Field(default_factory=dict, description="Contact information")
     similarity_method: str = Field("TF-IDF", description="Method used for similarity calculation")
     model_info: Dict[str, Any] = Field(default_factory=dict, description="Information about the model used")
+    relevance: Optional[float] = Field(None, description="Raw similarity to the job description (0-1), if one was provided")
+    sectionRelevance: Optional[Dict[str, float]] = Field(None, description="SBERT similarity of each resume section to the job description (0-1)")
+    features: Dict[str, Any] = Field(default_factory=dict, description="Versioned feature record for /rescore-features")
+    documentType: Optional[str] = Field(None, description="PDF text-layer classification: text, image_only, mixed or unknown")
+    rubricVersion: Optional[str] = Field(None, description="Version of the scoring rubric the score was computed with")
+    skillDictionaryVersion: Optional[str] = Field(None, description="Version of the skill dictionary skills were matched with")
+    timeBudgetMs: Optional[float] = Field(None, description="Time budget the caller sent, in milliseconds")
+    degradations: List[str] = Field(default_factory=list, description="Stages degraded to meet the time budget")
     
     class Config:
         schema_extra = {
@@ -157,13 +165,18 @@ class HealthResponse(BaseModel):
     status: str = Field("ok", description="Service status")
     sbert_enabled: bool = Field(False, description="Whether SBERT is enabled")
     model: str = Field("TF-IDF", description="Active model name")
+    rubricVersion: Optional[str] = Field(None, description="Active scoring rubric version")
+    skillDictionaryVersion: Optional[str] = Field(None, description="Active skill dictionary version")
+    threadBudget: Dict[str, Any] = Field(default_factory=dict, description="Per-worker native thread limits in effect")
     
     class Config:
         schema_extra = {
             "example": {
                 "status": "ok",
                 "sbert_enabled": False,
-                "model": "TF-IDF"
+                "model": "TF-IDF",
+                "rubricVersion": "2026.10.1",
+                "skillDictionaryVersion": "2026.10.1"
             }
         }
 
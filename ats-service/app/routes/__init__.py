@@ -4,6 +4,6 @@ Routes Package
 HTTP endpoint handlers for the ATS service.
 """
 
-from app.routes import score
+from app.routes import score, admin
 
-__all__ = ['score']
+__all__ = ['score', 'admin']
@@ -0,0 +1,134 @@
+"""
+Admin Routes
+
+Operator-only endpoints, gated by the `X-Admin-Token` header. They are
+disabled (404) unless ATS_ADMIN_TOKEN is set.
+
+Available Endpoints:
+- GET /admin/profiles: List saved request profiles
+- GET /admin/profiles/{name}: Download one profile file
+- GET /admin/rubric: Active scoring rubric version
+- POST /admin/rubric/reload: Recompile the rubric file now (this worker)
+- GET /admin/skills: Active skill dictionary version
+- POST /admin/skills/reload: Recompile the skill dictionary now (this worker)
+- GET /admin/sbert: Active similarity backend and any load in progress
+- POST /admin/sbert/load: Load another SBERT model version and switch to it
+"""
+
+import hmac
+import os
+import re
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.config import ADMIN_TOKEN, PROFILE_DIR, SBERT_MODEL
+from app.services.rubric import get_rubric, reload_rubric
+from app.services.similarity_backend import describe_similarity_backend, start_sbert_loader
+from app.services.skill_dictionary import get_skill_dictionary, reload_skill_dictionary
+from app.utils.profiler import list_profiles
+
+router = APIRouter(prefix='/admin')
+
+_PROFILE_NAME_RE = re.compile(r'^[0-9T]+-[0-9a-f]+\.(pstats|collapsed)$')
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Reject the request unless it carries the configured admin token.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.get('/profiles', dependencies=[Depends(require_admin)])
+def profiles() -> Dict[str, Any]:
+    """
+    List saved request profiles (see app/utils/profiler.py), newest first.
+    """
+    return {'directory': PROFILE_DIR, 'profiles': list_profiles(PROFILE_DIR)}
+
+
+@router.get('/profiles/{name}', dependencies=[Depends(require_admin)])
+def profile_file(name: str) -> FileResponse:
+    """
+    Download one profile file (.pstats or .collapsed).
+    """
+    path = os.path.join(PROFILE_DIR, name)
+    if not _PROFILE_NAME_RE.match(name) or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type='application/octet-stream', filename=name)
+
+
+@router.get('/rubric', dependencies=[Depends(require_admin)])
+def rubric() -> Dict[str, Any]:
+    """
+    Describe the scoring rubric this worker is using.
+    """
+    return get_rubric().describe()
+
+
+@router.post('/rubric/reload', dependencies=[Depends(require_admin)])
+def rubric_reload() -> Dict[str, Any]:
+    """
+    Recompile the rubric file and swap it in, without waiting for the
+    file watcher. Only the worker that receives the call reloads now;
+    the others pick the file up on their next poll.
+    """
+    previous = get_rubric().version
+    try:
+        current = reload_rubric()
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=422, detail=f"Rubric rejected, keeping {previous}: {e}")
+    return {'previousVersion': previous, **current.describe()}
+
+
+@router.get('/skills', dependencies=[Depends(require_admin)])
+def skills() -> Dict[str, Any]:
+    """
+    Describe the skill dictionary this worker is using.
+    """
+    return get_skill_dictionary().describe()
+
+
+@router.post('/skills/reload', dependencies=[Depends(require_admin)])
+def skills_reload() -> Dict[str, Any]:
+    """
+    Recompile the skill dictionary file and swap it in, without waiting
+    for the file watcher (this worker only, like /admin/rubric/reload).
+    """
+    previous = get_skill_dictionary().version
+    try:
+        current = reload_skill_dictionary()
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=422, detail=f"Skill dictionary rejected, keeping {previous}: {e}")
+    return {'previousVersion': previous, **current.describe()}
+
+
+@router.get('/sbert', dependencies=[Depends(require_admin)])
+def sbert() -> Dict[str, Any]:
+    """
+    Describe the similarity backend this worker is using.
+    """
+    return describe_similarity_backend()
+
+
+@router.post('/sbert/load', status_code=202, dependencies=[Depends(require_admin)])
+def sbert_load(model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load a SentenceTransformer (default ATS_SBERT_MODEL) in the background
+    and switch to it once it is warm; the current backend serves until
+    then. Only the worker that receives the call switches. Poll
+    GET /admin/sbert or /health for the outcome.
+
+    Stored embeddings and the ANN index are only used while
+    ATS_SBERT_MODEL is active, so finish a version rollout by changing it
+    and rebuilding them.
+    """
+    model_name = model or SBERT_MODEL
+    if not start_sbert_loader(model_name):
+        raise HTTPException(status_code=409, detail="A model load is already in progress")
+    return describe_similarity_backend()
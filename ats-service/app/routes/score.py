@@ -12,25 +12,86 @@ Key Responsibilities:
 - Handle errors gracefully
 
 Available Endpoints:
-- GET  /health: Service health check
+- GET  /health: Service health check (liveness)
+- GET  /ready: Readiness, 200 once startup warmup has finished
+- GET  /metrics: Prometheus counters for this worker
 - POST /parse: Parse and score a resume
+- POST /parse-multi: Parse a resume once, score it against several job descriptions
 - POST /semantic-similarity: Calculate similarity between two texts
 - POST /similarity: Direct similarity calculation (with metadata)
+- POST /rescore-features: Recompute scores from stored feature records
+- POST /rank: Top-k resumes for a job description
+- POST /similarity-matrix: Top-k stored resumes for every job description
+- POST /nearest-resumes: ANN search over resume embeddings
+
+/rescore-features, /rank and /similarity-matrix stream NDJSON when the
+request carries "Accept: application/x-ndjson" (see app/utils/ndjson.py).
+
+/parse and /parse-multi accept a time budget (X-Time-Budget-Ms header or
+time_budget_ms form field) and degrade optional stages to meet it (see
+app/services/deadline.py).
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, Dict, Any, List, NamedTuple, AsyncIterator
+import json
 import logging
+import math
 import traceback
 
-from app.services.resume_parser import safe_extract_text, find_section, extract_contact_info
+import numpy as np
+
+from app.services.resume_parser import find_section, extract_contact_info
+from app.services.text_cache import ExtractedDocument, cached_extract_document
+from app.services.pdf_classifier import KIND_IMAGE_ONLY, IMAGE_ONLY_FEEDBACK
+from app.services.section_segmenter import REQUIRED_SECTIONS
+from app.services import metrics
 from app.services.skill_extractor import extract_skills_from_section, extract_skills_from_resume
+from app.services.feature_extractor import (
+    FEATURE_VERSION,
+    FEATURE_FIELDS,
+    FEATURE_SOURCE_FIELDS,
+    extract_features,
+)
 from app.services.scoring_engine import (
     ats_similarity_score_sbert,
-    compute_heuristics,
+    similarity_with_sections,
+    score_features,
     normalize_score,
     generate_white_box_feedback
 )
+from app.services.batch_scorer import invalid_feature_fields, score_feature_records
+from app.services.single_flight import SingleFlight, request_key
+from app.services.deadline import (
+    Deadline, DEGRADED_EMBEDDING, DEGRADED_FEEDBACK, DEGRADED_PDF_PAGES, DEGRADED_SBERT
+)
+from app.services.rubric import Rubric, get_rubric
+from app.services.similarity_backend import (
+    SimilarityBackend, describe_similarity_backend, get_similarity_backend
+)
+from app.services.skill_dictionary import SkillDictionary, get_skill_dictionary
+from app.services.ranking import rank_resumes, embed_resumes, embed_texts, relevance_to_many
+from app.services.ann_index import get_ann_index
+from app.services.resume_store import get_resume_store
+from app.services.embedding_store import get_embedding_store
+from app.services.similarity_matrix import DEFAULT_BLOCK_SIZE, top_k_per_jd
+from app.models.request_schema import (
+    JobDescriptionItem,
+    RescoreFeaturesRequest,
+    RankRequest,
+    SimilarityMatrixRequest,
+    NearestResumesRequest
+)
+from app.config import (
+    ANN_INDEX_PATH, ANN_N_PROBE, PARSE_MULTI_MAX_JDS, STREAM_CHUNK_SIZE,
+    DEADLINE_FEEDBACK_SECONDS, DEADLINE_SBERT_SECONDS_PER_TEXT, RANK_PREFILTER, SBERT_MODEL
+)
+from app.utils.ndjson import ndjson_response, wants_ndjson
+from app.thread_budget import describe_thread_budget
+from app.warmup import describe_warmup
 
 # Import global configuration from app package
 import app
@@ -40,6 +101,10 @@ router = APIRouter()
 
 logger = logging.getLogger(__name__)
 
+# Identical /parse and /parse-multi requests in flight share one computation
+_parse_flights = SingleFlight('parse')
+_parse_multi_flights = SingleFlight('parse-multi')
+
 
 @router.get('/health')
 def health() -> Dict[str, Any]:
@@ -47,7 +112,12 @@ def health() -> Dict[str, Any]:
     Health check endpoint.
     
     This endpoint is used to verify that the service is running and
-    to check which similarity model is active (SBERT or TF-IDF).
+    to check which similarity model is active (SBERT or TF-IDF). It is a
+    liveness check and answers as soon as the worker is up; use /ready
+    to know when it is warm.
+    "similarityBackend" shows the model state: "loading" while the
+    SentenceTransformer loads in the background (TF-IDF serves meanwhile),
+    then "ready"; "failed" or "disabled" mean TF-IDF stays.
     
     Returns:
         dict: Service status and model information
@@ -56,20 +126,243 @@ def health() -> Dict[str, Any]:
         {
             "status": "ok",
             "sbert_enabled": false,
-            "model": "TF-IDF"
+            "model": "TF-IDF",
+            "similarityBackend": {"method": "TF-IDF", "model": "TF-IDF", "loadedAt": null,
+                                  "state": "loading", "loading": "all-MiniLM-L6-v2",
+                                  "lastError": null},
+            "rubricVersion": "2026.10.1",
+            "skillDictionaryVersion": "2026.10.1",
+            "threadBudget": {"cpus": 8, "workers": 4, "threadsPerWorker": 2, ...}
         }
     """
+    backend = describe_similarity_backend()
     return {
         'status': 'ok',
-        'sbert_enabled': app.SBERT_ENABLED,
-        'model': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
+        'sbert_enabled': backend['method'] == 'SBERT',
+        'model': backend['model'],
+        'similarityBackend': backend,
+        'rubricVersion': get_rubric().version,
+        'skillDictionaryVersion': get_skill_dictionary().version,
+        'threadBudget': describe_thread_budget()
+    }
+
+
+@router.get('/ready')
+def ready() -> JSONResponse:
+    """
+    Readiness check: 200 once this worker's startup warmup (see
+    app/warmup.py) has pushed the sample resumes through the pipeline,
+    503 until then.
+    
+    Example Response:
+        {
+            "ready": true,
+            "state": "done",
+            "startedAt": 1760825000.1,
+            "finishedAt": 1760825001.4,
+            "samples": [{"file": "resume_00000.docx", "ms": 412.0}, ...],
+            "errors": []
+        }
+    """
+    status = describe_warmup()
+    return JSONResponse(status, status_code=200 if status['ready'] else 503)
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+def metrics_endpoint() -> str:
+    """
+    Prometheus counters collected by this worker process.
+    """
+    return metrics.render_prometheus()
+
+
+class _ParsedResume(NamedTuple):
+    """
+    Everything /parse computes from the file alone, shared by every JD.
+    """
+    document: ExtractedDocument
+    parsed: Dict[str, Any]
+    skills: List[str]
+    contact: Dict[str, Optional[str]]
+    features: Dict[str, Any]
+    heur_score: float
+    heur_feedback: List[str]
+    heur_breakdown: Dict[str, float]
+    rubric: Rubric
+    skill_dictionary: SkillDictionary
+    backend: SimilarityBackend
+
+
+def _parse_resume_file(data: bytes, filename: str, resume_id: Optional[str],
+                       deadline: Deadline, use_cache: bool = True,
+                       relevance_texts: int = 0) -> _ParsedResume:
+    """
+    Extract, segment and heuristically score an uploaded resume
+    (steps 2-5 of /parse), storing it under resume_id if given.
+    use_cache=False bypasses the extracted text cache. relevance_texts
+    is how many texts the relevance step will encode with SBERT; the
+    embedding of a stored resume only goes ahead if they still fit.
+    """
+    # Fetched once so a model swap can't mix two models in one request
+    backend = get_similarity_backend()
+
+    # Step 2: Extract text from file (PDF or DOCX), reusing a cached
+    # extraction when the same bytes were parsed before. Scanned
+    # (image-only) PDFs are detected up front and not extracted. A long
+    # PDF is cut to the pages that fit the time budget, if any.
+    logger.info("Step 2: Extracting text from %s", filename)
+    document = cached_extract_document(data, filename, max_pages=deadline.page_cap(), use_cache=use_cache)
+    raw_text, parsing_errors = document.text, document.errors
+    if document.pages_capped:
+        deadline.record(DEGRADED_PDF_PAGES)
+    if parsing_errors:
+        logger.warning("Parsing errors encountered: %s", parsing_errors)
+
+    if resume_id:
+        get_resume_store().put(resume_id, raw_text)
+        if backend.enabled:
+            try:
+                # Only embeddings of ATS_SBERT_MODEL go into the store
+                if (not backend.uses_stored_embeddings
+                        or deadline.should_degrade(DEGRADED_EMBEDDING, DEADLINE_SBERT_SECONDS_PER_TEXT,
+                                                   reserve=DEADLINE_SBERT_SECONDS_PER_TEXT * relevance_texts)):
+                    # /rank reuses stored embeddings; drop the previous text's one
+                    get_embedding_store().delete([resume_id])
+                else:
+                    vector = embed_resumes([raw_text], backend.model, app.STOP_WORDS)
+                    get_embedding_store().put([resume_id], vector)
+            except Exception as e:
+                logger.warning("Could not store embedding for %s: %s", resume_id, e)
+
+    # Step 3: Parse resume sections. The section segmenter already found
+    # them (and the contact details) while streaming a fresh extraction;
+    # cached text is searched here instead.
+    logger.info("Step 3: Parsing resume sections")
+    if document.segments is not None:
+        sections, contact = document.segments
+    else:
+        sections = {key: find_section(raw_text, names) for key, names in REQUIRED_SECTIONS.items()}
+        contact = extract_contact_info(raw_text)
+    parsed = {
+        'skills': extract_skills_from_section(sections['skills']),
+        'education': sections['education'],
+        'experience': sections['experience'],
+    }
+    
+    # Also extract skills from full resume (used for scoring)
+    logger.info("Step 4: Extracting skills from full resume text")
+    skill_dictionary = get_skill_dictionary()
+    all_skills = extract_skills_from_resume(raw_text, skill_dictionary)
+    logger.info("Skills detected: %d", len(all_skills))
+
+    # Step 5: Extract features and compute heuristic score (resume structure quality).
+    # The rubric is fetched once so a concurrent reload can't mix versions.
+    logger.info("Step 5: Computing heuristic score")
+    rubric = get_rubric()
+    features = extract_features(raw_text, parsed, parsing_errors, rubric, skill_dictionary)
+    heur_score, heur_feedback, heur_breakdown = score_features(features, rubric)
+    logger.info("Heuristic score: %.2f/50", heur_score)
+
+    return _ParsedResume(document, parsed, all_skills, contact, features,
+                         heur_score, heur_feedback, heur_breakdown, rubric, skill_dictionary, backend)
+
+
+def _score_relevance(resume: _ParsedResume, relevance: Optional[float],
+                     deadline: Deadline, sbert_used: bool) -> Dict[str, Any]:
+    """
+    Final score, breakdown and feedback of a parsed resume for one
+    relevance value (None without a job description), steps 7-8 of /parse.
+    """
+    final_score, norm_breakdown = normalize_score(resume.heur_score, relevance)
+    logger.info("Final ATS score: %.2f", final_score)
+    
+    if deadline.should_degrade(DEGRADED_FEEDBACK, DEADLINE_FEEDBACK_SECONDS):
+        feedback = list(resume.heur_feedback)
+    else:
+        feedback = generate_white_box_feedback(
+            resume.heur_feedback,
+            relevance if relevance is not None else 0.0,
+            resume.parsed,
+            resume.contact,
+            {**resume.heur_breakdown, **norm_breakdown},
+            sbert_enabled=sbert_used
+        )
+    if resume.document.pdf_kind == KIND_IMAGE_ONLY:
+        feedback.insert(0, IMAGE_ONLY_FEEDBACK)
+    
+    return {
+        'atsScore': final_score,
+        'breakdown': {**resume.heur_breakdown, **norm_breakdown},
+        'feedback': feedback
+    }
+
+
+def _use_sbert(deadline: Deadline, texts: int, backend: SimilarityBackend) -> bool:
+    """
+    Whether relevance over texts documents may use SBERT: the model must
+    be loaded and fit the time budget, else the request degrades to TF-IDF.
+    """
+    if not backend.enabled:
+        return False
+    return not deadline.should_degrade(DEGRADED_SBERT, DEADLINE_SBERT_SECONDS_PER_TEXT * texts)
+
+
+def _time_budget(header: Optional[str], form: Optional[str]) -> Optional[float]:
+    """
+    Decode a request's time budget in milliseconds from the
+    X-Time-Budget-Ms header or the time_budget_ms form field (the header
+    wins). Returns None when neither is set.
+    """
+    raw = header if header else form
+    if not raw:
+        return None
+    try:
+        budget_ms = float(raw)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Time budget must be a number of milliseconds, got {raw!r}")
+    if not budget_ms > 0 or math.isinf(budget_ms):
+        raise HTTPException(status_code=422, detail="Time budget must be a positive number of milliseconds")
+    return budget_ms
+
+
+def _deadline_fields(deadline: Deadline) -> Dict[str, Any]:
+    """
+    The time budget fields of a /parse response.
+    """
+    return {
+        'timeBudgetMs': None if deadline.budget_seconds is None else deadline.budget_seconds * 1000,
+        'degradations': deadline.degradations
+    }
+
+
+def _resume_fields(resume: _ParsedResume) -> Dict[str, Any]:
+    """
+    The JD-independent fields of a /parse response.
+    """
+    return {
+        'rawText': resume.document.text,
+        'parsedSkills': resume.skills,  # Use full resume skills (matches scoring)
+        'parsingErrors': resume.document.errors,
+        'contact': resume.contact,
+        'similarity_method': resume.backend.method,
+        'model_info': {
+            'sbert_enabled': resume.backend.enabled,
+            'model_name': resume.backend.model_name
+        },
+        'features': resume.features,
+        'documentType': resume.document.pdf_kind,
+        'rubricVersion': resume.rubric.version,
+        'skillDictionaryVersion': resume.skill_dictionary.version
     }
 
 
 @router.post('/parse')
 async def parse_resume(
     file: UploadFile = File(...),
-    job_description: Optional[str] = Form(None)
+    job_description: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    time_budget_ms: Optional[str] = Form(None),
+    x_time_budget_ms: Optional[str] = Header(None)
 ) -> Dict[str, Any]:
     """
     Parse and score a resume file.
@@ -82,9 +375,19 @@ async def parse_resume(
     5. If job description provided, calculates relevance score
     6. Combines scores and generates feedback
     
+    The response also carries the versioned feature record and the raw
+    relevance value so callers can store them and later rescore through
+    /rescore-features without uploading the file again.
+    
     Args:
         file (UploadFile): Resume file (PDF or DOCX)
         job_description (str, optional): Job description text for relevance scoring
+        resume_id (str, optional): Caller's resume id; when given, the extracted
+            text (and, with SBERT enabled, its embedding) is stored so the
+            resume can later be ranked through /rank and /nearest-resumes
+        time_budget_ms (str, optional): Time budget in milliseconds (or the
+            X-Time-Budget-Ms header); optional stages are degraded to meet
+            it and listed in "degradations"
     
     Returns:
         dict: Complete ATS analysis including score, breakdown, and feedback
@@ -99,113 +402,198 @@ async def parse_resume(
             "feedback": [...],
             "contact": {"email": "john@example.com", "phone": "+1-555-1234"},
             "similarity_method": "TF-IDF",
-            "model_info": {"sbert_enabled": false, "model_name": "TF-IDF"}
+            "model_info": {"sbert_enabled": false, "model_name": "TF-IDF"},
+            "relevance": 0.42,
+            "features": {"version": 1, "skill_count": 14, ...},
+            "documentType": "text",
+            "rubricVersion": "2026.10.1",
+            "skillDictionaryVersion": "2026.10.1",
+            "timeBudgetMs": 300,
+            "degradations": ["sbert-to-tfidf"]
         }
     """
+    logger.info("Resume received: filename=%s, jd_provided=%s", file.filename, bool(job_description))
+    budget_ms = _time_budget(x_time_budget_ms, time_budget_ms)
+    deadline = Deadline(None if budget_ms is None else budget_ms / 1000)
+
+    # Step 1: Read file bytes
+    data = await file.read()
+
+    # Steps 2-9 run in the threadpool; an identical request already in
+    # flight (retry, double upload) is awaited instead of recomputed
+    key = request_key(data, file.filename, job_description, resume_id, budget_ms)
     try:
-        logger.info("Resume received: filename=%s, jd_provided=%s", file.filename, bool(job_description))
+        return await _parse_flights.run(key, lambda: run_in_threadpool(
+            _parse_and_score, data, file.filename, job_description, resume_id, deadline
+        ))
+    
+    except Exception as e:
+        # Log error and raise proper HTTP error (not a 200 with error body)
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
 
-        # Step 1: Read file bytes
-        data = await file.read()
 
-        # Step 2: Extract text from file (PDF or DOCX)
-        logger.info("Step 2: Extracting text from %s", file.filename)
-        raw_text, parsing_errors = safe_extract_text(data, file.filename)
-        if parsing_errors:
-            logger.warning("Parsing errors encountered: %s", parsing_errors)
+def _parse_and_score(data: bytes, filename: str, job_description: Optional[str],
+                     resume_id: Optional[str], deadline: Deadline,
+                     use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Steps 2-9 of /parse.
+    """
+    # Steps 2-5: Extraction, sections, skills and heuristic score
+    resume = _parse_resume_file(data, filename, resume_id, deadline, use_cache,
+                                relevance_texts=2 if job_description else 0)
 
-        # Step 3: Parse resume sections
-        logger.info("Step 3: Parsing resume sections")
-        parsed = {}
-        
-        # Extract skills section
-        skills_section = find_section(
-            raw_text,
-            ['skills', 'technical skills', 'skills & technologies']
-        )
-        parsed['skills'] = extract_skills_from_section(skills_section)
-        
-        # Also extract skills from full resume (used for scoring)
-        logger.info("Step 4: Extracting skills from full resume text")
-        all_skills = extract_skills_from_resume(raw_text)
-        logger.info("Skills detected: %d", len(all_skills))
-
-        # Extract education section
-        parsed['education'] = find_section(
-            raw_text,
-            ['education', 'academic', 'qualifications']
+    # Step 6: Compute relevance score (if job description provided),
+    # with TF-IDF when SBERT no longer fits the time budget
+    logger.info("Step 6: Computing relevance score (jd_provided=%s)", bool(job_description))
+    relevance = None
+    section_relevance = None
+    sbert_used = resume.backend.enabled
+    if job_description:
+        sbert_used = _use_sbert(deadline, texts=2, backend=resume.backend)
+        relevance, section_relevance = similarity_with_sections(
+            resume.document.text,
+            job_description,
+            sbert_model=resume.backend.model,
+            sbert_enabled=sbert_used,
+            stop_words=app.STOP_WORDS
         )
+        logger.info("Relevance score: %.4f", relevance)
 
-        # Extract experience section
-        parsed['experience'] = find_section(
-            raw_text,
-            ['experience', 'work experience', 'professional experience', 'employment']
-        )
+    # Steps 7-8: Normalize final score (0-100) and generate detailed feedback
+    logger.info("Step 7: Normalising final score")
+    scored = _score_relevance(resume, relevance, deadline, sbert_used)
+    
+    # Step 9: Build response
+    return {
+        **_resume_fields(resume),
+        'similarity_method': 'SBERT' if sbert_used else 'TF-IDF',
+        **scored,
+        'relevance': relevance,
+        'sectionRelevance': section_relevance,
+        **_deadline_fields(deadline)
+    }
 
-        # Step 5: Compute heuristic score (resume structure quality)
-        logger.info("Step 5: Computing heuristic score")
-        heur_score, heur_feedback, heur_breakdown = compute_heuristics(
-            raw_text,
-            parsed,
-            parsing_errors
-        )
-        logger.info("Heuristic score: %.2f/50", heur_score)
-
-        # Step 6: Compute relevance score (if job description provided)
-        logger.info("Step 6: Computing relevance score (jd_provided=%s)", bool(job_description))
-        relevance = None
-        if job_description:
-            relevance = ats_similarity_score_sbert(
-                raw_text,
-                job_description,
-                sbert_model=app.sbert_model,
-                sbert_enabled=app.SBERT_ENABLED,
-                stop_words=app.STOP_WORDS
-            )
-            logger.info("Relevance score: %.4f", relevance)
-
-        # Step 7: Normalize final score (0-100)
-        logger.info("Step 7: Normalising final score")
-        final_score, norm_breakdown = normalize_score(heur_score, relevance)
-        logger.info("Final ATS score: %.2f", final_score)
-        
-        # Step 7: Extract contact information
-        contact = extract_contact_info(raw_text)
-        
-        # Step 8: Generate detailed feedback
-        feedback = generate_white_box_feedback(
-            heur_feedback,
-            relevance if relevance is not None else 0.0,
-            parsed,
-            contact,
-            {**heur_breakdown, **norm_breakdown},
-            sbert_enabled=app.SBERT_ENABLED
-        )
-        
-        # Step 9: Build response
-        result = {
-            'rawText': raw_text,
-            'parsedSkills': all_skills,  # Use full resume skills (matches scoring)
-            'parsingErrors': parsing_errors,
-            'atsScore': final_score,
-            'breakdown': {**heur_breakdown, **norm_breakdown},
-            'feedback': feedback,
-            'contact': contact,
-            'similarity_method': 'SBERT' if app.SBERT_ENABLED else 'TF-IDF',
-            'model_info': {
-                'sbert_enabled': app.SBERT_ENABLED,
-                'model_name': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
-            }
+
+def _parse_job_descriptions(raw: str) -> List[JobDescriptionItem]:
+    """
+    Decode the job_descriptions form field of /parse-multi: a JSON list
+    of texts or of {"id": ..., "text": ...} objects.
+    """
+    try:
+        items = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"job_descriptions is not valid JSON: {e}")
+    if not isinstance(items, list) or not items:
+        raise HTTPException(status_code=422, detail="job_descriptions must be a non-empty JSON list")
+    if len(items) > PARSE_MULTI_MAX_JDS:
+        raise HTTPException(status_code=422,
+                            detail=f"At most {PARSE_MULTI_MAX_JDS} job descriptions per request")
+    try:
+        return [JobDescriptionItem(id=str(index), text=item) if isinstance(item, str)
+                else JobDescriptionItem.model_validate(item)
+                for index, item in enumerate(items)]
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid job description: {e}")
+
+
+@router.post('/parse-multi')
+async def parse_resume_multi(
+    file: UploadFile = File(...),
+    job_descriptions: str = Form(...),
+    resume_id: Optional[str] = Form(None),
+    time_budget_ms: Optional[str] = Form(None),
+    x_time_budget_ms: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """
+    Parse a resume once and score it against several job descriptions.
+    
+    Extraction, sections, skills and the heuristic score are computed a
+    single time; relevance to every JD is computed in one vectorized pass
+    (see relevance_to_many). Each result carries exactly what /parse would
+    return for that JD in atsScore, breakdown, feedback and relevance.
+    
+    Args:
+        file (UploadFile): Resume file (PDF or DOCX)
+        job_descriptions (str): JSON list of JD texts, or of
+            {"id": ..., "text": ...} objects (ids are echoed back; plain
+            texts get their list position as id)
+        resume_id (str, optional): Store the resume, as in /parse
+        time_budget_ms (str, optional): Time budget, as in /parse
+    
+    Returns:
+        dict: The JD-independent /parse fields, the shared heuristic
+        result, and one result per JD in request order
+    
+    Example Response:
+        {
+            "rawText": "...",
+            "parsedSkills": ["Python", "JavaScript"],
+            "features": {"version": 1, "skill_count": 14, ...},
+            "heuristics": {"score": 31.5, "breakdown": {...}},
+            "similarity_method": "TF-IDF",
+            "results": [
+                {"index": 0, "jdId": "backend-2024", "relevance": 0.42,
+                 "atsScore": 63.4, "breakdown": {...}, "feedback": [...]}
+            ],
+            ...
         }
-        
-        return result
+    """
+    jds = _parse_job_descriptions(job_descriptions)
+    logger.info("Resume received: filename=%s, %d job description(s)", file.filename, len(jds))
+    budget_ms = _time_budget(x_time_budget_ms, time_budget_ms)
+    deadline = Deadline(None if budget_ms is None else budget_ms / 1000)
+    data = await file.read()
+    
+    key = request_key(data, file.filename, job_descriptions, resume_id, budget_ms)
+    try:
+        return await _parse_multi_flights.run(key, lambda: run_in_threadpool(
+            _parse_and_score_multi, data, file.filename, jds, resume_id, deadline
+        ))
     
     except Exception as e:
-        # Log error and raise proper HTTP error (not a 200 with error body)
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
 
 
+def _parse_and_score_multi(data: bytes, filename: str, jds: List[JobDescriptionItem],
+                           resume_id: Optional[str], deadline: Deadline,
+                           use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Parse once, then score against every JD (the work of /parse-multi).
+    """
+    # Empty JDs are scored like /parse without a job description
+    with_text = [index for index, jd in enumerate(jds) if jd.text]
+    resume = _parse_resume_file(data, filename, resume_id, deadline, use_cache,
+                                relevance_texts=len(with_text) + 1 if with_text else 0)
+
+    relevances: List[Optional[float]] = [None] * len(jds)
+    method = resume.backend.method
+    if with_text:
+        scores, method = relevance_to_many(
+            resume.document.text,
+            [jds[index].text for index in with_text],
+            sbert_model=resume.backend.model,
+            sbert_enabled=_use_sbert(deadline, texts=len(with_text) + 1, backend=resume.backend),
+            stop_words=app.STOP_WORDS
+        )
+        for index, score in zip(with_text, scores):
+            relevances[index] = float(score)
+    logger.info("Relevance computed for %d job description(s) with %s", len(with_text), method)
+
+    return {
+        **_resume_fields(resume),
+        'similarity_method': method,
+        'heuristics': {'score': resume.heur_score, 'breakdown': resume.heur_breakdown},
+        'results': [
+            {'index': index, 'jdId': jd.id, 'relevance': relevance,
+             **_score_relevance(resume, relevance, deadline, method == 'SBERT')}
+            for index, (jd, relevance) in enumerate(zip(jds, relevances))
+        ],
+        **_deadline_fields(deadline)
+    }
+
+
 @router.post('/semantic-similarity')
 async def semantic_similarity(
     text1: str = Form(...),
@@ -233,18 +621,19 @@ async def semantic_similarity(
     """
     try:
         # Calculate similarity using SBERT or TF-IDF
+        backend = get_similarity_backend()
         similarity_score = ats_similarity_score_sbert(
             text1,
             text2,
-            sbert_model=app.sbert_model,
-            sbert_enabled=app.SBERT_ENABLED,
+            sbert_model=backend.model,
+            sbert_enabled=backend.enabled,
             stop_words=app.STOP_WORDS
         )
         
         return {
             'similarity': similarity_score,
-            'method': 'SBERT' if app.SBERT_ENABLED else 'TF-IDF',
-            'model': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
+            'method': backend.method,
+            'model': backend.model_name
         }
     
     except Exception as e:
@@ -285,18 +674,19 @@ async def calculate_similarity(
     """
     try:
         # Calculate similarity
+        backend = get_similarity_backend()
         similarity_score = ats_similarity_score_sbert(
             resume_text,
             job_description,
-            sbert_model=app.sbert_model,
-            sbert_enabled=app.SBERT_ENABLED,
+            sbert_model=backend.model,
+            sbert_enabled=backend.enabled,
             stop_words=app.STOP_WORDS
         )
         
         return {
             'similarity_score': similarity_score,
-            'method': 'SBERT' if app.SBERT_ENABLED else 'TF-IDF',
-            'model': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF',
+            'method': backend.method,
+            'model': backend.model_name,
             'resume_length': len(resume_text),
             'jd_length': len(job_description)
         }
@@ -307,3 +697,349 @@ async def calculate_similarity(
             'error': 'Failed to calculate similarity',
             'detail': str(e)
         }
+
+
+def _feature_record_error(record, rubric: Rubric, skill_dictionary: SkillDictionary) -> Optional[str]:
+    """
+    Why a stored feature record cannot be rescored (None if it can).
+    
+    Besides being well-formed, its counts must come from the active
+    rubric keyword lists and skill dictionary; only the weights may
+    have changed since it was extracted.
+    """
+    features = record.features
+    missing = [name for name in FEATURE_FIELDS + FEATURE_SOURCE_FIELDS if name not in features]
+    invalid = invalid_feature_fields(features)
+    if features.get('version') != FEATURE_VERSION:
+        error = (f"unsupported feature version {features.get('version')!r} "
+                 f"(expected {FEATURE_VERSION}) — re-parse the resume")
+    elif missing:
+        error = f"missing fields {missing}"
+    elif invalid:
+        error = f"non-numeric fields {invalid}"
+    elif features['rubric_matchers'] != rubric.matchers_digest:
+        error = (f"counted with the keyword lists of rubric {features['rubric_version']!r}, "
+                 f"which differ from rubric {rubric.version!r} — re-parse the resume")
+    elif features['skill_dictionary_version'] != skill_dictionary.version:
+        error = (f"counted with skill dictionary {features['skill_dictionary_version']!r} "
+                 f"(active: {skill_dictionary.version!r}) — re-parse the resume")
+    else:
+        return None
+    return f'Invalid feature record: {error}'
+
+
+def _rescore_envelope(rubric: Rubric, skill_dictionary: SkillDictionary) -> Dict[str, Any]:
+    return {
+        'featureVersion': FEATURE_VERSION,
+        'rubricVersion': rubric.version,
+        'skillDictionaryVersion': skill_dictionary.version,
+    }
+
+
+async def _stream_rescore(records, rubric: Rubric,
+                          skill_dictionary: SkillDictionary) -> AsyncIterator[Dict[str, Any]]:
+    yield _rescore_envelope(rubric, skill_dictionary)
+    
+    # Rejected records go out immediately; valid ones in scored chunks
+    valid_indices = []
+    for index, record in enumerate(records):
+        error = _feature_record_error(record, rubric, skill_dictionary)
+        if error:
+            yield {'index': index, 'error': error}
+        else:
+            valid_indices.append(index)
+    
+    for start in range(0, len(valid_indices), STREAM_CHUNK_SIZE):
+        chunk = valid_indices[start:start + STREAM_CHUNK_SIZE]
+        scored = await run_in_threadpool(
+            score_feature_records,
+            [records[i].features for i in chunk],
+            [records[i].relevance for i in chunk],
+            rubric
+        )
+        for index, item in zip(chunk, scored):
+            yield {'index': index, **item}
+
+
+@router.post('/rescore-features')
+def rescore_features(request: RescoreFeaturesRequest, accept: Optional[str] = Header(None)):
+    """
+    Recompute ATS scores from stored feature records.
+    
+    No text processing happens here: each record returned by /parse
+    (the 'features' and 'relevance' fields) is fed straight through the
+    current rubric weights. All valid records are scored together in one
+    vectorized pass, so a scoring change can be rolled out over the whole
+    leaderboard without re-parsing any resume.
+    
+    Records produced by a different feature version, with a missing or
+    non-numeric field, or counted with other rubric keyword lists or
+    another skill dictionary version cannot be rescored; they are
+    reported per item so the caller can re-parse just those, and the
+    rest are still scored.
+    
+    With "Accept: application/x-ndjson" the response is streamed: the
+    envelope line, then one line per record as soon as it is scored
+    (rejected records first, the rest in chunks of ATS_STREAM_CHUNK_SIZE),
+    so lines are not in request order and must be matched by 'index'.
+    
+    Args:
+        request (RescoreFeaturesRequest): Stored feature records
+        accept (str, optional): Accept header
+    
+    Returns:
+        dict: One result per record, in request order
+    
+    Example Response:
+        {
+            "featureVersion": 2,
+            "rubricVersion": "2026.10.1",
+            "skillDictionaryVersion": "2026.10.1",
+            "results": [
+                {"index": 0, "atsScore": 71.3, "breakdown": {...}},
+                {"index": 1, "error": "Invalid feature record: ..."}
+            ]
+        }
+    """
+    logger.info("Rescoring %d feature record(s)", len(request.records))
+    rubric = get_rubric()
+    skill_dictionary = get_skill_dictionary()
+    if wants_ndjson(accept):
+        return ndjson_response(_stream_rescore(request.records, rubric, skill_dictionary))
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(request.records)
+    valid_indices = []
+    for index, record in enumerate(request.records):
+        error = _feature_record_error(record, rubric, skill_dictionary)
+        if error:
+            results[index] = {'index': index, 'error': error}
+        else:
+            valid_indices.append(index)
+    
+    if valid_indices:
+        scored = score_feature_records(
+            [request.records[i].features for i in valid_indices],
+            [request.records[i].relevance for i in valid_indices],
+            rubric
+        )
+        for index, item in zip(valid_indices, scored):
+            results[index] = {'index': index, **item}
+    
+    return {**_rescore_envelope(rubric, skill_dictionary), 'results': results}
+
+
+def _stored_embedding_lookup(stored_ids: List[str]):
+    """
+    Embedding lookup for rank_resumes: stored embeddings of the resumes
+    that came from the resume store (the first len(stored_ids) texts).
+    """
+    def lookup(indices):
+        wanted = {stored_ids[i]: i for i in indices if i < len(stored_ids)}
+        if not wanted:
+            return {}
+        found, vectors = get_embedding_store().get(list(wanted))
+        return {wanted[rid]: vector for rid, vector in zip(found, vectors)}
+    return lookup
+
+
+def _rank_candidates(request: RankRequest) -> Dict[str, Any]:
+    stored = get_resume_store().get_many(request.resume_ids) if request.resume_ids else {}
+    missing = [rid for rid in request.resume_ids if rid not in stored]
+    
+    ids = list(stored.keys()) + [item.id for item in request.resumes]
+    texts = list(stored.values()) + [item.text for item in request.resumes]
+    prefilter = RANK_PREFILTER if request.prefilter is None else request.prefilter
+    logger.info("Ranking %d resume(s), %d unknown id(s)", len(ids), len(missing))
+    
+    backend = get_similarity_backend()
+    ranked, method = rank_resumes(
+        request.job_description,
+        texts,
+        request.top_k,
+        sbert_model=backend.model,
+        sbert_enabled=backend.enabled,
+        stop_words=app.STOP_WORDS,
+        prefilter=prefilter,
+        lookup=_stored_embedding_lookup(list(stored.keys())) if backend.uses_stored_embeddings else None
+    )
+    
+    return {
+        'method': method,
+        'model': backend.model_name if 'SBERT' in method else 'TF-IDF',
+        'prefilter': max(prefilter, request.top_k) if method == 'TF-IDF+SBERT' else None,
+        'candidates': len(ids),
+        'results': [
+            {'rank': position + 1, 'id': ids[index], 'score': score}
+            for position, (index, score) in enumerate(ranked)
+        ],
+        'missingIds': missing
+    }
+
+
+async def _stream_rank(request: RankRequest) -> AsyncIterator[Dict[str, Any]]:
+    response = await run_in_threadpool(_rank_candidates, request)
+    results = response.pop('results')
+    yield response
+    for item in results:
+        yield item
+
+
+@router.post('/rank')
+def rank(request: RankRequest, accept: Optional[str] = Header(None)):
+    """
+    Return the resumes that best match a job description.
+    
+    All candidates are scored together: one TF-IDF fit and one sparse
+    matrix-vector product (or one batched SBERT encode and one matmul),
+    and the top-k are selected with argpartition. With SBERT, stored
+    embeddings of known resumes are reused; when more than M resumes
+    (request "prefilter" or ATS_RANK_PREFILTER) would still have to be
+    encoded, TF-IDF picks the top-M and only those are re-ranked with
+    SBERT ("method": "TF-IDF+SBERT").
+    
+    With "Accept: application/x-ndjson" the envelope (method, model,
+    candidates, missingIds) and then each result are streamed as lines.
+    
+    Args:
+        request (RankRequest): Job description, candidate ids/texts and top_k
+        accept (str, optional): Accept header
+    
+    Returns:
+        dict: Ranked matches plus any resume ids the service doesn't know
+    
+    Example Response:
+        {
+            "method": "TF-IDF",
+            "model": "TF-IDF",
+            "prefilter": null,
+            "candidates": 250,
+            "results": [
+                {"rank": 1, "id": "64f1c0...", "score": 0.61},
+                {"rank": 2, "id": "64f1c3...", "score": 0.57}
+            ],
+            "missingIds": []
+        }
+    """
+    if wants_ndjson(accept):
+        return ndjson_response(_stream_rank(request))
+    try:
+        return _rank_candidates(request)
+    
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to rank resumes: {str(e)}")
+
+
+def _similarity_matrix_results(request: SimilarityMatrixRequest) -> List[Dict[str, Any]]:
+    store = get_resume_store()
+    jd_texts = [jd.text for jd in request.job_descriptions]
+    logger.info("Similarity matrix requested for %d JD(s)", len(jd_texts))
+    
+    per_jd = top_k_per_jd(
+        jd_texts,
+        lambda: store.iter_blocks(DEFAULT_BLOCK_SIZE, request.resume_ids),
+        request.top_k
+    )
+    return [
+        {'jdId': jd.id, 'matches': [{'id': rid, 'score': score} for rid, score in matches]}
+        for jd, matches in zip(request.job_descriptions, per_jd)
+    ]
+
+
+async def _stream_similarity_matrix(request: SimilarityMatrixRequest) -> AsyncIterator[Dict[str, Any]]:
+    yield {'method': 'TF-IDF'}
+    results = await run_in_threadpool(_similarity_matrix_results, request)
+    for index, item in enumerate(results):
+        yield {'index': index, **item}
+
+
+@router.post('/similarity-matrix')
+def similarity_matrix_top_k(request: SimilarityMatrixRequest, accept: Optional[str] = Header(None)):
+    """
+    Return the top-k stored resumes for every job description.
+    
+    Relevance for all JD x resume pairs is computed as chunked sparse
+    matrix products over blocks of stored resumes, so memory stays bounded
+    however many resumes the store holds. Uses TF-IDF only.
+    
+    With "Accept: application/x-ndjson" the envelope and then one line
+    per JD (tagged with its 'index') are streamed.
+    
+    Args:
+        request (SimilarityMatrixRequest): Job descriptions, optional resume ids, top_k
+        accept (str, optional): Accept header
+    
+    Returns:
+        dict: Per JD (in request order), the best matching resumes
+    
+    Example Response:
+        {
+            "method": "TF-IDF",
+            "results": [
+                {"jdId": "backend-2024", "matches": [{"id": "64f1c0...", "score": 0.61}]}
+            ]
+        }
+    """
+    if wants_ndjson(accept):
+        return ndjson_response(_stream_similarity_matrix(request))
+    try:
+        return {
+            'method': 'TF-IDF',
+            'results': _similarity_matrix_results(request)
+        }
+    
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Failed to compute similarity matrix: {str(e)}")
+
+
+@router.post('/nearest-resumes')
+def nearest_resumes(request: NearestResumesRequest) -> Dict[str, Any]:
+    """
+    Return the stored resumes whose SBERT embeddings are nearest to a JD.
+    
+    Searches the IVF index built by scripts/build_ann_index.py instead of
+    comparing the JD against every resume.
+    
+    Args:
+        request (NearestResumesRequest): JD text or embedding, top_k, n_probe
+    
+    Returns:
+        dict: Nearest resume ids with cosine similarity
+    
+    Example Response:
+        {
+            "method": "SBERT-ANN",
+            "indexed": 12000,
+            "results": [{"rank": 1, "id": "64f1c0...", "score": 0.71}]
+        }
+    """
+    index = get_ann_index(ANN_INDEX_PATH)
+    if index is None:
+        raise HTTPException(status_code=503, detail="Resume ANN index has not been built")
+    
+    if request.embedding is not None:
+        query = np.asarray(request.embedding, dtype=np.float32)
+    elif request.job_description:
+        backend = get_similarity_backend()
+        if not backend.enabled:
+            raise HTTPException(status_code=503, detail="SBERT is not available to encode the job description")
+        if not backend.uses_stored_embeddings:
+            raise HTTPException(status_code=503, detail=f"The index holds {SBERT_MODEL} embeddings "
+                                                        f"but {backend.model_name} is active")
+        query = embed_texts([request.job_description], backend.model, app.STOP_WORDS)[0]
+    else:
+        raise HTTPException(status_code=422, detail="Provide job_description or embedding")
+    
+    if query.shape != (index.dim,):
+        raise HTTPException(status_code=422, detail=f"Embedding must have {index.dim} dimensions")
+    
+    matches = index.search(query, request.top_k, request.n_probe or ANN_N_PROBE)
+    return {
+        'method': 'SBERT-ANN',
+        'indexed': len(index),
+        'results': [
+            {'rank': position + 1, 'id': resume_id, 'score': score}
+            for position, (resume_id, score) in enumerate(matches)
+        ]
+    }
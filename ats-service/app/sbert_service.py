@@ -2,13 +2,19 @@
 """
 Standalone SBERT Semantic Analysis Service
 Uses sentence-transformers for semantic similarity
+
+The model loads on a background thread, so the service answers at once;
+until it is ready /health reports "loading" and the similarity endpoints
+return "SBERT not available".
 """
 
 from fastapi import FastAPI, Form
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import json
+import os
 import sys
+import threading
 
 app = FastAPI(title="SBERT Semantic Analysis Service")
 
@@ -21,19 +27,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Try to load SBERT model
-try:
-    from sentence_transformers import SentenceTransformer, util
-    import torch
-    
-    print("Loading SBERT model (all-MiniLM-L6-v2)...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    SBERT_ENABLED = True
-    print("✓ SBERT model loaded successfully")
-except Exception as e:
-    print(f"✗ Failed to load SBERT: {e}")
-    SBERT_ENABLED = False
-    model = None
+MODEL_NAME = os.getenv("ATS_SBERT_MODEL", os.getenv("SBERT_MODEL", "all-MiniLM-L6-v2"))
+
+# Set by load_model() once the model is loaded and warm
+SBERT_ENABLED = False
+SBERT_STATE = 'loading'
+model = None
+util = None
+
+
+def load_model():
+    """Load and warm the SBERT model, then publish it"""
+    global SBERT_ENABLED, SBERT_STATE, model, util
+    try:
+        from sentence_transformers import SentenceTransformer, util as st_util
+        
+        print(f"Loading SBERT model ({MODEL_NAME})...")
+        loaded = SentenceTransformer(MODEL_NAME)
+        loaded.encode(['warm up'])
+        util, model = st_util, loaded
+        SBERT_ENABLED = True
+        SBERT_STATE = 'ready'
+        print("✓ SBERT model loaded successfully")
+    except Exception as e:
+        print(f"✗ Failed to load SBERT: {e}")
+        SBERT_STATE = 'failed'
+
+
+# Loading no longer blocks import or startup
+threading.Thread(target=load_model, name='sbert-loader', daemon=True).start()
 
 
 @app.get('/health')
@@ -41,7 +63,8 @@ def health():
     return {
         'status': 'ok',
         'sbert_enabled': SBERT_ENABLED,
-        'model': 'all-MiniLM-L6-v2' if SBERT_ENABLED else 'unavailable'
+        'state': SBERT_STATE,
+        'model': MODEL_NAME if SBERT_ENABLED else 'unavailable'
     }
 
 
@@ -68,7 +91,7 @@ async def semantic_similarity(text1: str = Form(...), text2: str = Form(...)):
         return {
             'similarity': similarity,
             'method': 'SBERT',
-            'model': 'all-MiniLM-L6-v2'
+            'model': MODEL_NAME
         }
     
     except Exception as e:
@@ -105,7 +128,7 @@ async def batch_similarity(text1: str = Form(...), texts2: str = Form(...)):
         return {
             'similarities': similarities,
             'method': 'SBERT',
-            'model': 'all-MiniLM-L6-v2'
+            'model': MODEL_NAME
         }
     
     except Exception as e:
@@ -119,7 +142,7 @@ if __name__ == '__main__':
     print(f"\n{'='*50}")
     print(f"SBERT Semantic Analysis Service")
     print(f"{'='*50}")
-    print(f"Status: {'✓ Ready' if SBERT_ENABLED else '✗ SBERT unavailable'}")
+    print(f"Model: {MODEL_NAME} (loads in the background)")
     print(f"Listening on: http://localhost:{port}")
     print(f"{'='*50}\n")
     
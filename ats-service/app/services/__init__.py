@@ -11,6 +11,8 @@ ATS Pipeline:
     ↓
   Skill Extraction  → skill_extractor
     ↓
+  Feature Extraction → feature_extractor
+    ↓
   Score Computation → scoring_engine
 """
 
@@ -18,7 +20,25 @@ from app.services.resume_parser import (
     safe_extract_text,
     find_section,
     extract_contact_info,
-    extract_text_from_docx_bytes
+    extract_text_from_docx_bytes,
+    iter_pdf_pages,
+    iter_docx_chunks,
+    count_pdf_pages
+)
+
+from app.services.section_segmenter import SectionSegmenter
+
+from app.services.extraction_sandbox import (
+    extract_document,
+    check_document_limits
+)
+
+from app.services.pdf_classifier import classify_pdf
+
+from app.services.text_cache import (
+    TextCache,
+    cached_extract_document,
+    get_text_cache
 )
 
 from app.services.skill_extractor import (
@@ -29,20 +49,124 @@ from app.services.skill_extractor import (
     deduplicate_skills
 )
 
+from app.services.skill_dictionary import (
+    SkillDictionary,
+    compile_skill_dictionary,
+    load_skill_dictionary,
+    get_skill_dictionary,
+    reload_skill_dictionary
+)
+
+from app.services.rubric import (
+    Rubric,
+    compile_rubric,
+    load_rubric,
+    get_rubric,
+    reload_rubric
+)
+
+from app.services.feature_extractor import (
+    FEATURE_VERSION,
+    FEATURE_FIELDS,
+    FEATURE_SOURCE_FIELDS,
+    extract_features
+)
+
 from app.services.scoring_engine import (
     compute_relevance_tfidf,
+    compute_relevance_tfidf_sklearn,
     ats_similarity_score_sbert,
+    similarity_with_sections,
     compute_heuristics,
+    score_features,
     normalize_score,
     generate_white_box_feedback
 )
 
+from app.services.batch_scorer import (
+    features_to_matrix,
+    score_feature_matrix,
+    score_feature_records
+)
+
+from app.services.single_flight import (
+    SingleFlight,
+    request_key
+)
+
+from app.services.deadline import Deadline
+
+from app.services.similarity_backend import (
+    SimilarityBackend,
+    get_similarity_backend,
+    load_sbert_backend,
+    start_sbert_loader
+)
+
+from app.services.chunked_encoding import (
+    split_sections,
+    chunk_resume,
+    chunked_relevance,
+    pooled_embeddings
+)
+
+from app.services.ranking import (
+    top_k_indices,
+    relevance_scores_tfidf,
+    rank_resumes,
+    pairwise_relevance_tfidf,
+    relevance_to_many,
+    tfidf_pair_similarity,
+    rerank_sbert,
+    embed_resumes
+)
+
+from app.services.similarity_matrix import (
+    iter_similarity_blocks,
+    top_k_per_jd,
+    similarity_matrix,
+    save_similarity_matrix
+)
+
+from app.services.ann_index import (
+    IVFIndex,
+    get_ann_index
+)
+
+from app.services.resume_store import (
+    ResumeStore,
+    get_resume_store
+)
+
+from app.services.embedding_store import (
+    EmbeddingStore,
+    get_embedding_store
+)
+
 __all__ = [
     # resume_parser
     'safe_extract_text',
     'find_section',
     'extract_contact_info',
     'extract_text_from_docx_bytes',
+    'iter_pdf_pages',
+    'iter_docx_chunks',
+    'count_pdf_pages',
+
+    # section_segmenter
+    'SectionSegmenter',
+
+    # extraction_sandbox
+    'extract_document',
+    'check_document_limits',
+
+    # pdf_classifier
+    'classify_pdf',
+
+    # text_cache
+    'TextCache',
+    'cached_extract_document',
+    'get_text_cache',
 
     # skill_extractor
     'extract_skills_from_section',
@@ -51,10 +175,85 @@ __all__ = [
     'normalize_skill',
     'deduplicate_skills',
 
+    # skill_dictionary
+    'SkillDictionary',
+    'compile_skill_dictionary',
+    'load_skill_dictionary',
+    'get_skill_dictionary',
+    'reload_skill_dictionary',
+
+    # rubric
+    'Rubric',
+    'compile_rubric',
+    'load_rubric',
+    'get_rubric',
+    'reload_rubric',
+
+    # feature_extractor
+    'FEATURE_VERSION',
+    'FEATURE_FIELDS',
+    'FEATURE_SOURCE_FIELDS',
+    'extract_features',
+
     # scoring_engine
     'compute_relevance_tfidf',
+    'compute_relevance_tfidf_sklearn',
     'ats_similarity_score_sbert',
+    'similarity_with_sections',
     'compute_heuristics',
+    'score_features',
     'normalize_score',
-    'generate_white_box_feedback'
+    'generate_white_box_feedback',
+
+    # batch_scorer
+    'features_to_matrix',
+    'score_feature_matrix',
+    'score_feature_records',
+
+    # single_flight
+    'SingleFlight',
+    'request_key',
+
+    # deadline
+    'Deadline',
+
+    # similarity_backend
+    'SimilarityBackend',
+    'get_similarity_backend',
+    'load_sbert_backend',
+    'start_sbert_loader',
+
+    # chunked_encoding
+    'split_sections',
+    'chunk_resume',
+    'chunked_relevance',
+    'pooled_embeddings',
+
+    # ranking
+    'top_k_indices',
+    'relevance_scores_tfidf',
+    'rank_resumes',
+    'pairwise_relevance_tfidf',
+    'relevance_to_many',
+    'tfidf_pair_similarity',
+    'rerank_sbert',
+    'embed_resumes',
+
+    # similarity_matrix
+    'iter_similarity_blocks',
+    'top_k_per_jd',
+    'similarity_matrix',
+    'save_similarity_matrix',
+
+    # ann_index
+    'IVFIndex',
+    'get_ann_index',
+
+    # resume_store
+    'ResumeStore',
+    'get_resume_store',
+
+    # embedding_store
+    'EmbeddingStore',
+    'get_embedding_store'
 ]
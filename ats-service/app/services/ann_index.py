@@ -0,0 +1,337 @@
+"""
+Approximate Nearest-Neighbour Index
+
+This module provides a pure-NumPy IVF (inverted file) index over SBERT
+resume embeddings, so "which resumes are closest to this JD embedding"
+does not need a brute-force comparison against every resume.
+
+How it works:
+- A k-means coarse quantizer splits the embedding space into n_lists cells
+- Every resume vector is filed under its nearest centroid
+- A query only scans the vectors in its n_probe nearest cells
+
+Key Responsibilities:
+- Train the coarse quantizer on a sample of embeddings
+- Incremental inserts (including re-inserting an existing id) and deletes
+- Save to / load from a single .npz file (written atomically)
+- Exact search fallback while the index is untrained
+
+Vectors are L2-normalised on insert, so inner product = cosine similarity.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 1024
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, seed: int) -> np.ndarray:
+    """
+    Spherical k-means (cosine) returning k unit-length centroids.
+    """
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(data.shape[0], size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(data @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, data)
+        counts = np.bincount(assign, minlength=k)
+        empty = counts == 0
+        # Re-seed empty cells with random points so every list stays usable
+        if empty.any():
+            sums[empty] = data[rng.choice(data.shape[0], size=int(empty.sum()), replace=False)]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """
+    Inverted-file ANN index with cosine similarity.
+
+    Rows are stored in one growable float32 matrix; deleted rows are
+    tombstoned and dropped by compact() (called automatically on save).
+    """
+
+    def __init__(self, dim: int, n_lists: int = 64):
+        self.dim = dim
+        self.n_lists = n_lists
+        self.centroids: Optional[np.ndarray] = None
+
+        self._vectors = np.zeros((_INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._assign = np.full(_INITIAL_CAPACITY, -1, dtype=np.int32)
+        self._alive = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._lists: List[List[int]] = []
+        self._lock = threading.RLock()
+
+    # ── Properties ────────────────────────────────────────────────
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._row_of
+
+    def ids(self) -> List[str]:
+        """
+        Return every stored id.
+        """
+        return list(self._row_of)
+
+    def stored_vectors(self) -> np.ndarray:
+        """
+        Return a copy of every stored (normalised) vector, one row per id.
+        """
+        with self._lock:
+            n = len(self._ids)
+            return self._vectors[:n][self._alive[:n]].copy()
+
+    # ── Building ──────────────────────────────────────────────────
+
+    def train(self, sample: np.ndarray, iterations: int = 20, seed: int = 0) -> None:
+        """
+        Fit the coarse quantizer and file every stored vector under a cell.
+
+        Args:
+            sample (np.ndarray): Training embeddings, at least n_lists rows
+            iterations (int): k-means iterations
+            seed (int): Random seed for centroid initialisation
+        """
+        data = _normalize(sample)
+        n_lists = min(self.n_lists, data.shape[0])
+        with self._lock:
+            self.centroids = _kmeans(data, n_lists, iterations, seed)
+            self.n_lists = n_lists
+            self._reassign()
+        logger.info("ANN index trained: %d list(s) on %d sample(s)", n_lists, data.shape[0])
+
+    def _reassign(self) -> None:
+        n = len(self._ids)
+        self._lists = [[] for _ in range(self.n_lists)]
+        rows = np.flatnonzero(self._alive[:n])
+        if rows.size:
+            self._assign[rows] = np.argmax(self._vectors[rows] @ self.centroids.T, axis=1)
+            for row in rows:
+                self._lists[self._assign[row]].append(int(row))
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        self._vectors = np.resize(self._vectors, (new_capacity, self.dim))
+        self._assign = np.resize(self._assign, new_capacity)
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:capacity] = self._alive
+        self._alive = alive
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Insert vectors; an id that already exists is replaced.
+
+        Args:
+            ids (Sequence[str]): One id per vector
+            vectors (np.ndarray): Embeddings of shape (len(ids), dim)
+        """
+        vectors = _normalize(vectors)
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(f"Expected vectors of shape ({len(ids)}, {self.dim}), got {vectors.shape}")
+
+        with self._lock:
+            self.remove([i for i in ids if i in self._row_of])
+            start = len(self._ids)
+            self._grow(start + len(ids))
+            rows = np.arange(start, start + len(ids))
+            self._vectors[rows] = vectors
+            self._alive[rows] = True
+            self._ids.extend(ids)
+            for item_id, row in zip(ids, rows):
+                self._row_of[item_id] = int(row)
+
+            if self.is_trained:
+                self._assign[rows] = np.argmax(vectors @ self.centroids.T, axis=1)
+                for row in rows:
+                    self._lists[self._assign[row]].append(int(row))
+            else:
+                self._assign[rows] = -1
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """
+        Delete ids from the index (unknown ids are ignored).
+
+        Returns:
+            int: Number of ids removed
+        """
+        removed = 0
+        with self._lock:
+            for item_id in ids:
+                row = self._row_of.pop(item_id, None)
+                if row is None:
+                    continue
+                self._alive[row] = False
+                self._ids[row] = None
+                if self.is_trained and self._assign[row] >= 0:
+                    self._lists[self._assign[row]].remove(row)
+                removed += 1
+        return removed
+
+    def compact(self) -> None:
+        """
+        Drop tombstoned rows and renumber the remaining ones.
+        """
+        with self._lock:
+            n = len(self._ids)
+            rows = np.flatnonzero(self._alive[:n])
+            if rows.size == n:
+                return
+            ids = [self._ids[r] for r in rows]
+            vectors = self._vectors[rows].copy()
+            assign = self._assign[rows].copy()
+
+            self._vectors = np.zeros((max(_INITIAL_CAPACITY, rows.size), self.dim), dtype=np.float32)
+            self._assign = np.full(self._vectors.shape[0], -1, dtype=np.int32)
+            self._alive = np.zeros(self._vectors.shape[0], dtype=bool)
+            self._vectors[:rows.size] = vectors
+            self._assign[:rows.size] = assign
+            self._alive[:rows.size] = True
+            self._ids = ids
+            self._row_of = {item_id: row for row, item_id in enumerate(ids)}
+            if self.is_trained:
+                self._reassign()
+
+    # ── Search ────────────────────────────────────────────────────
+
+    def search(self, query: np.ndarray, k: int, n_probe: int = 8) -> List[Tuple[str, float]]:
+        """
+        Return the k nearest ids to a query embedding.
+
+        Args:
+            query (np.ndarray): Query embedding of shape (dim,)
+            k (int): Number of neighbours wanted
+            n_probe (int): Cells to scan; higher = better recall, slower
+
+        Returns:
+            List[Tuple[str, float]]: (id, cosine similarity), best first
+        """
+        q = _normalize(query)[0]
+        with self._lock:
+            n = len(self._ids)
+            if not self.is_trained:
+                rows = np.flatnonzero(self._alive[:n])
+            else:
+                n_probe = max(1, min(n_probe, self.n_lists))
+                cells = np.argpartition(-(self.centroids @ q), n_probe - 1)[:n_probe]
+                rows = np.fromiter(
+                    (row for cell in cells for row in self._lists[cell]), dtype=np.int64
+                )
+            if rows.size == 0:
+                return []
+
+            scores = self._vectors[rows] @ q
+            k = min(k, rows.size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind='stable')]
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def exact_search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """
+        Brute-force search over every stored vector (for recall checks).
+        """
+        q = _normalize(query)[0]
+        with self._lock:
+            n = len(self._ids)
+            rows = np.flatnonzero(self._alive[:n])
+            if rows.size == 0:
+                return []
+            scores = self._vectors[rows] @ q
+            k = min(k, rows.size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind='stable')]
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    # ── Persistence ───────────────────────────────────────────────
+
+    def save(self, path: str) -> None:
+        """
+        Compact and write the index to a .npz file atomically.
+        """
+        with self._lock:
+            self.compact()
+            n = len(self._ids)
+            directory = os.path.dirname(path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npz')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    np.savez(
+                        fh,
+                        dim=self.dim,
+                        n_lists=self.n_lists,
+                        centroids=self.centroids if self.is_trained else np.zeros((0, self.dim), np.float32),
+                        vectors=self._vectors[:n],
+                        ids=np.array(self._ids, dtype=str),
+                    )
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        logger.info("Saved ANN index (%d vector(s)) to %s", n, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'IVFIndex':
+        """
+        Load an index written by save().
+        """
+        with np.load(path) as data:
+            index = cls(int(data['dim']), int(data['n_lists']))
+            if data['centroids'].shape[0]:
+                index.centroids = data['centroids']
+                index._reassign()
+            index.add([str(i) for i in data['ids']], data['vectors'])
+        logger.info("Loaded ANN index (%d vector(s)) from %s", len(index), path)
+        return index
+
+
+_index: Optional[IVFIndex] = None
+_index_mtime: Optional[float] = None
+_index_lock = threading.Lock()
+
+
+def get_ann_index(path: str) -> Optional[IVFIndex]:
+    """
+    Return the index stored at path, reloading it when the file changes.
+
+    Returns None when no index has been built yet.
+    """
+    global _index, _index_mtime
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    with _index_lock:
+        if _index is None or mtime != _index_mtime:
+            _index = IVFIndex.load(path)
+            _index_mtime = mtime
+        return _index
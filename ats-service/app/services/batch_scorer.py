@@ -0,0 +1,298 @@
+"""
+Batch Scorer Service
+
+This module scores many feature records at once with vectorized NumPy
+operations. It mirrors score_features() and normalize_score() in
+scoring_engine.py exactly, so results match the scalar path bit-for-bit
+after rounding.
+
+Key Responsibilities:
+- Pack feature records into a matrix (one row per resume)
+- Compute section scores, parsing penalties, heuristic totals,
+  relevance components and final scores column-wise
+- Reproduce Python's round() semantics on arrays
+
+Use this for leaderboard-wide recomputation and what-if analysis over
+stored feature records. Single resumes should keep using the scalar path,
+which also produces feedback messages.
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.feature_extractor import FEATURE_VERSION, FEATURE_FIELDS
+from app.services.rubric import (
+    DEGREE_NONE,
+    DEGREE_DIPLOMA,
+    DEGREE_BACHELOR,
+    DEGREE_MASTER,
+    DEGREE_PHD,
+    Rubric,
+    SkillTier,
+    Steps,
+    get_rubric,
+)
+
+logger = logging.getLogger(__name__)
+
+# Column index of every feature field in the matrix
+COLUMNS: Dict[str, int] = {name: i for i, name in enumerate(FEATURE_FIELDS)}
+
+# Same scaling factor as normalize_score()
+SCALING_FACTOR = 0.98
+
+
+def invalid_feature_fields(record: Dict[str, Any]) -> List[str]:
+    """
+    Names of the FEATURE_FIELDS of record that are present but not a
+    finite number or bool (a string, null, NaN, ...).
+    """
+    return [
+        name for name in FEATURE_FIELDS
+        if name in record and not (
+            isinstance(record[name], (int, float)) and math.isfinite(record[name])
+        )
+    ]
+
+
+def features_to_matrix(records: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    Pack feature records into a float64 matrix, one row per record.
+
+    Args:
+        records (Sequence[Dict[str, Any]]): Records from extract_features()
+
+    Returns:
+        np.ndarray: Matrix of shape (len(records), len(FEATURE_FIELDS))
+
+    Raises:
+        ValueError: If a record was produced by another FEATURE_VERSION
+        or has a non-numeric field
+    """
+    matrix = np.zeros((len(records), len(FEATURE_FIELDS)), dtype=np.float64)
+    for row, record in enumerate(records):
+        if record.get('version') != FEATURE_VERSION:
+            raise ValueError(
+                f"Record {row} has unsupported feature version {record.get('version')!r} "
+                f"(expected {FEATURE_VERSION})"
+            )
+        invalid = invalid_feature_fields(record)
+        if invalid:
+            raise ValueError(f"Record {row} has non-numeric fields {invalid}")
+        matrix[row] = [float(record[name]) for name in FEATURE_FIELDS]
+    return matrix
+
+
+def _py_round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Round an array exactly like Python's built-in round().
+
+    np.round scales, rounds and unscales, which can land on the wrong side
+    of a .5 tie when the scaled value is not exact. Elements whose scaled
+    value is within a hair of a tie are re-rounded with round() itself;
+    everything else takes the vectorized path.
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+
+    frac = np.abs(scaled - np.trunc(scaled))
+    near_tie = np.abs(frac - 0.5) < 1e-9 * np.maximum(1.0, np.abs(scaled))
+    for idx in np.flatnonzero(near_tie):
+        rounded.flat[idx] = round(float(values.flat[idx]), ndigits)
+    return rounded
+
+
+def _col(matrix: np.ndarray, name: str) -> np.ndarray:
+    return matrix[:, COLUMNS[name]]
+
+
+def _score_education(m: np.ndarray, w: Dict[str, float], points: Dict[int, float]) -> np.ndarray:
+    degree = _col(m, 'degree_level')
+    degree_points = np.select(
+        [degree == DEGREE_PHD, degree == DEGREE_MASTER,
+         degree == DEGREE_BACHELOR, degree == DEGREE_DIPLOMA],
+        [points[DEGREE_PHD], points[DEGREE_MASTER],
+         points[DEGREE_BACHELOR], points[DEGREE_DIPLOMA]],
+        default=points[DEGREE_NONE],
+    )
+    score = w['base'] + degree_points
+    score = score + np.where(_col(m, 'relevant_field') != 0, w['relevant_field'], 0.0)
+    score = score + np.where(_col(m, 'top_school') != 0, w['top_school'], 0.0)
+    score = np.minimum(10.0, score)
+    return np.where(_col(m, 'education_present') != 0, score, 0.0)
+
+
+def _score_experience(m: np.ndarray, w: Dict[str, float], fallback: Dict[str, float],
+                      steps: Steps) -> np.ndarray:
+    months = _col(m, 'duration_months')
+    years = _col(m, 'distinct_years')
+
+    duration = np.select(
+        [months >= min_months for min_months, _ in steps],
+        [points for _, points in steps],
+        default=np.select(
+            [years >= 2,
+             (years == 1) & (_col(m, 'mentions_present') != 0),
+             years == 1,
+             _col(m, 'long_experience_text') != 0],
+            [fallback['multiple_years'], fallback['year_and_present'],
+             fallback['single_year'], fallback['long_text']],
+            default=0.0,
+        ),
+    )
+    score = 0.0 + duration
+    score = score + np.minimum(w['action_verb_max'], _col(m, 'action_verb_count') * w['action_verb'])
+    score = score + np.minimum(w['metric_max'], _col(m, 'metric_count') * w['metric'])
+    score = score + np.minimum(w['seniority_max'], _col(m, 'seniority_count') * w['seniority'])
+    score = score + np.where(_col(m, 'top_company') != 0, w['top_company'], 0.0)
+    score = np.minimum(10.0, _py_round(score, 1))
+    return np.where(_col(m, 'experience_present') != 0, score, 0.0)
+
+
+def _score_skills(m: np.ndarray, tiers: Sequence[SkillTier], above: float) -> np.ndarray:
+    count = _col(m, 'skill_count')
+    return np.select(
+        [count == 0] + [count <= tier.up_to for tier in tiers],
+        [0.0] + [_py_round(tier.base + ((count - tier.start) * tier.per_skill), 1) for tier in tiers],
+        default=above,
+    )
+
+
+def _score_projects(m: np.ndarray, w: Dict[str, float], steps: Steps) -> np.ndarray:
+    mentions = _col(m, 'project_mentions')
+    score = w['base'] + np.minimum(w['tech_max'], _col(m, 'tech_count') * w['tech'])
+    score = score + np.minimum(w['impact_max'], _col(m, 'impact_count') * w['impact'])
+    score = score + np.minimum(w['link_max'], _col(m, 'link_count') * w['link'])
+    score = score + np.select([mentions >= min_mentions for min_mentions, _ in steps],
+                              [points for _, points in steps], default=0.0)
+    score = np.minimum(10.0, score)
+    return np.where(_col(m, 'projects_present') != 0, score, 0.0)
+
+
+def _score_contact(m: np.ndarray, w: Dict[str, float]) -> np.ndarray:
+    score = 0.0 + np.where(_col(m, 'has_email') != 0, w['email'], 0.0)
+    score = score + np.where(_col(m, 'has_phone') != 0, w['phone'], 0.0)
+    score = score + np.where(_col(m, 'has_linkedin') != 0, w['linkedin'], 0.0)
+    score = score + np.where(_col(m, 'has_github') != 0, w['github'], 0.0)
+    score = score + np.where(_col(m, 'has_portfolio') != 0, w['portfolio'], 0.0)
+    return np.minimum(10.0, score)
+
+
+def score_feature_matrix(matrix: np.ndarray,
+                         relevance: Optional[np.ndarray] = None,
+                         rubric: Optional[Rubric] = None) -> Dict[str, np.ndarray]:
+    """
+    Score a feature matrix with vectorized operations.
+
+    Equivalent to running score_features() and normalize_score() on every
+    row, without the feedback messages.
+
+    Args:
+        matrix (np.ndarray): Output of features_to_matrix()
+        relevance (np.ndarray, optional): Raw similarity (0-1) per row.
+            NaN (or omitting the array) means no job description.
+        rubric (Rubric, optional): Weights to score with (default: the active rubric)
+
+    Returns:
+        Dict[str, np.ndarray]: One array per breakdown key ('education',
+        'experience', 'skills', 'projects', 'contact', 'parsingPenalty',
+        'heuristics', 'relevance'), plus 'heuristicScore' (0-50,
+        unrounded) and 'atsScore' (final 0-100 score)
+
+    Example:
+        >>> m = features_to_matrix(records)
+        >>> scores = score_feature_matrix(m, np.array([0.42, np.nan]))
+        >>> scores['atsScore']
+        array([71.3 , 64.68])
+    """
+    rows = matrix.shape[0]
+    if relevance is None:
+        relevance = np.full(rows, np.nan)
+    relevance = np.asarray(relevance, dtype=np.float64)
+
+    rubric = rubric or get_rubric()
+    weights = rubric.weights
+    education = _score_education(matrix, weights['education'], rubric.degree_points)
+    experience = _score_experience(matrix, weights['experience'], weights['duration'], rubric.duration_steps)
+    skills = _score_skills(matrix, rubric.skill_tiers, weights['skills']['above'])
+    projects = _score_projects(matrix, weights['projects'], rubric.mention_steps)
+    contact = _score_contact(matrix, weights['contact'])
+    penalty = np.minimum(weights['parsing']['max'],
+                         _col(matrix, 'parsing_error_count') * weights['parsing']['per_error'])
+
+    heuristic = 0.0 + education
+    heuristic = heuristic + experience
+    heuristic = heuristic + skills
+    heuristic = heuristic + projects
+    heuristic = heuristic + contact
+    heuristic = heuristic - penalty
+    heuristic = np.maximum(0.0, np.minimum(50.0, heuristic))
+
+    # normalize_score(): no JD (or zero relevance) doubles the heuristic
+    no_jd = np.isnan(relevance) | (relevance == 0.0)
+    rel = np.where(no_jd, 0.0, relevance)
+    relevance_component = np.select(
+        [rel < 0.3, rel < 0.6],
+        [rel * 35.0, 10.5 + (rel - 0.3) * 45.0],
+        default=24 + (rel - 0.6) * 65.0,
+    )
+    total = np.where(
+        no_jd,
+        heuristic * 2.0 * SCALING_FACTOR,
+        (heuristic + relevance_component) * SCALING_FACTOR,
+    )
+    total = np.maximum(0.0, np.minimum(100.0, total))
+
+    return {
+        'education': _py_round(education, 1),
+        'experience': _py_round(experience, 1),
+        'skills': _py_round(skills, 1),
+        'projects': _py_round(projects, 1),
+        'contact': _py_round(contact, 1),
+        'parsingPenalty': 0.0 - penalty,
+        'heuristicScore': heuristic,
+        'heuristics': np.where(no_jd, _py_round(heuristic * 2.0, 2), _py_round(heuristic, 2)),
+        'relevance': np.where(no_jd, 0.0, _py_round(relevance_component, 2)),
+        'atsScore': _py_round(total, 2),
+    }
+
+
+def score_feature_records(records: Sequence[Dict[str, Any]],
+                          relevance: Optional[Sequence[Optional[float]]] = None,
+                          rubric: Optional[Rubric] = None) -> List[Dict[str, Any]]:
+    """
+    Score feature records in one vectorized pass.
+
+    Args:
+        records (Sequence[Dict[str, Any]]): Records from extract_features()
+        relevance (Sequence[Optional[float]], optional): Raw similarity per
+            record; None entries mean no job description
+        rubric (Rubric, optional): Weights to score with (default: the active rubric)
+
+    Returns:
+        List[Dict[str, Any]]: Per record, 'atsScore' and a 'breakdown' shaped
+        like the /parse response breakdown. No feedback messages: those
+        come from score_features() on the scalar path only
+    """
+    matrix = features_to_matrix(records)
+    rel = None
+    if relevance is not None:
+        rel = np.array([np.nan if r is None else r for r in relevance], dtype=np.float64)
+
+    scores = score_feature_matrix(matrix, rel, rubric)
+    logger.info("Batch-scored %d feature record(s)", len(records))
+
+    results = []
+    for row in range(len(records)):
+        breakdown = {
+            key: float(scores[key][row])
+            for key in ('education', 'experience', 'skills', 'projects', 'contact',
+                        'parsingPenalty', 'heuristics', 'relevance')
+        }
+        breakdown['scalingFactor'] = SCALING_FACTOR
+        results.append({'atsScore': float(scores['atsScore'][row]), 'breakdown': breakdown})
+    return results
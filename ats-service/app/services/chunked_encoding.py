@@ -0,0 +1,211 @@
+"""
+Section-Chunked SBERT Encoding
+
+all-MiniLM-L6-v2 reads at most 256 word pieces per input, so encoding a
+whole resume as one text silently drops everything after its first page
+or so, and one long sequence is also the slowest shape to encode. This
+module splits a resume at its section headers, cuts each section into
+chunks that fit the model, encodes every chunk in one length-sorted
+batch and pools the chunk scores into one document score.
+
+Pooling modes:
+- mean: cosine of the JD with the mean chunk embedding (weighted by
+  chunk length), closest to the old whole-text score
+- max: best-matching chunk
+- jd-weighted: chunk scores averaged with softmax weights on their
+  similarity to the JD, so relevant sections dominate without a single
+  chunk deciding the score
+
+Each section is pooled the same way, which gives per-section relevance
+(e.g. how well the experience section alone matches the JD).
+
+Stored resume embeddings (/rank, /nearest-resumes, the ANN index) are the
+normalised length-weighted mean chunk embedding, so comparing one with a
+JD embedding gives the mean pooling score.
+
+Pipeline stage: Relevance Scoring (step 6 of the ATS pipeline)
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from app.config import SBERT_POOLING
+from app.services.resume_parser import SECTION_HEADERS, preprocess_pdf_text
+from app.services.section_segmenter import REQUIRED_SECTIONS
+from app.utils.text_cleaner import clean_text
+
+logger = logging.getLogger(__name__)
+
+POOLING_MODES = ('mean', 'max', 'jd-weighted')
+
+# Cleaned words per chunk: stays under the model's 256 word pieces even
+# for jargon-heavy text that splits into several pieces per word
+CHUNK_WORDS = 128
+
+# Softmax temperature of jd-weighted pooling (cosine scores are close
+# together, so a low temperature is needed to separate them)
+JD_WEIGHT_TEMPERATURE = 0.05
+
+# Section name for the text before the first header (name, contact, summary)
+LEADING_SECTION = 'header'
+
+# Header line (lowercased, without a trailing colon) -> section name
+_SECTION_NAMES: Dict[str, str] = {header: header for header in SECTION_HEADERS}
+_SECTION_NAMES.update({name: section for section, names in REQUIRED_SECTIONS.items() for name in names})
+
+
+class Chunk(NamedTuple):
+    section: str
+    text: str
+    words: int
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """
+    Split resume text at its section header lines.
+
+    Returns:
+        List[Tuple[str, str]]: (section name, section text) in document
+        order; a section appearing twice is returned twice
+    """
+    sections: List[Tuple[str, List[str]]] = [(LEADING_SECTION, [])]
+    for line in preprocess_pdf_text(text or '').splitlines():
+        name = _SECTION_NAMES.get(line.strip().rstrip(':').strip().lower())
+        if name is not None:
+            sections.append((name, []))
+        else:
+            sections[-1][1].append(line)
+    return [(name, '\n'.join(lines)) for name, lines in sections if any(l.strip() for l in lines)]
+
+
+def chunk_resume(text: str, stop_words: set = None, chunk_words: int = CHUNK_WORDS) -> List[Chunk]:
+    """
+    Cut every section into cleaned chunks of at most chunk_words words.
+    """
+    chunks = []
+    for section, body in split_sections(text):
+        words = clean_text(body, stop_words).split()
+        for start in range(0, len(words), chunk_words):
+            piece = words[start:start + chunk_words]
+            chunks.append(Chunk(section, ' '.join(piece), len(piece)))
+    return chunks
+
+
+def encode_sorted(texts: Sequence[str], sbert_model) -> np.ndarray:
+    """
+    Encode texts in one batch, longest first so each mini-batch pads to
+    similar lengths, and return the embeddings in input order.
+    """
+    order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+    encoded = np.asarray(sbert_model.encode([texts[i] for i in order], normalize_embeddings=True))
+    embeddings = np.empty_like(encoded)
+    embeddings[order] = encoded
+    return embeddings
+
+
+def pooled_embeddings(texts: Sequence[str], sbert_model, stop_words: set = None,
+                      chunk_words: int = CHUNK_WORDS) -> np.ndarray:
+    """
+    Encode documents as the L2-normalised, length-weighted mean of their
+    chunk embeddings, encoding the chunks of every document in one batch.
+
+    The cosine of a row with a JD embedding is the document's mean
+    pooling score in chunked_relevance(). A document without words gets
+    a zero row.
+
+    Returns:
+        np.ndarray: One embedding per text
+    """
+    per_text = [chunk_resume(text, stop_words, chunk_words) for text in texts]
+    flat = [chunk for chunks in per_text for chunk in chunks]
+    # Encoding an empty text only tells the embedding size
+    embeddings = encode_sorted([c.text for c in flat] if flat else [''], sbert_model)
+    pooled = np.zeros((len(texts), embeddings.shape[1]), dtype=np.float32)
+    start = 0
+    for row, chunks in enumerate(per_text):
+        if chunks:
+            words = np.array([c.words for c in chunks], dtype=np.float64)
+            mean = (words / words.sum()) @ embeddings[start:start + len(chunks)]
+            norm = np.linalg.norm(mean)
+            if norm > 0:
+                pooled[row] = mean / norm
+        start += len(chunks)
+    return pooled
+
+
+def pool_scores(embeddings: np.ndarray, weights: np.ndarray, jd_embedding: np.ndarray,
+                pooling: str) -> float:
+    """
+    Pool the chunk embeddings of one document (or section) into its
+    similarity to the job description.
+    """
+    sims = embeddings @ jd_embedding
+    if pooling == 'max':
+        score = sims.max()
+    elif pooling == 'jd-weighted':
+        attention = np.exp((sims - sims.max()) / JD_WEIGHT_TEMPERATURE)
+        score = float(attention @ sims / attention.sum())
+    elif pooling == 'mean':
+        mean = weights @ embeddings
+        norm = np.linalg.norm(mean)
+        score = mean @ jd_embedding / norm if norm > 0 else 0.0
+    else:
+        raise ValueError(f"Unknown pooling {pooling!r} (use one of {POOLING_MODES})")
+    return float(np.clip(score, 0.0, 1.0))
+
+
+def chunked_relevance(resume_text: str, jd_texts: Sequence[str], sbert_model,
+                      stop_words: set = None,
+                      pooling: str = SBERT_POOLING) -> Tuple[np.ndarray, List[Dict[str, float]]]:
+    """
+    SBERT relevance of a resume to each job description from its section
+    chunks.
+
+    The resume chunks and every JD are encoded in one batch, so scoring
+    against several JDs costs one resume encode.
+
+    Args:
+        resume_text (str): Resume text
+        jd_texts (Sequence[str]): Job description texts
+        sbert_model: Loaded SentenceTransformer
+        stop_words (set): Set of stopwords for text cleaning
+        pooling (str): 'mean', 'max' or 'jd-weighted'
+
+    Returns:
+        Tuple containing:
+        - scores (np.ndarray): Document relevance (0-1) per JD
+        - sections (List[Dict[str, float]]): Relevance of each section per JD
+
+    Raises:
+        ValueError: If pooling is not a known mode
+    """
+    if pooling not in POOLING_MODES:
+        raise ValueError(f"Unknown pooling {pooling!r} (use one of {POOLING_MODES})")
+    chunks = chunk_resume(resume_text, stop_words)
+    jd_clean = [clean_text(jd, stop_words) for jd in jd_texts]
+    scores = np.zeros(len(jd_texts))
+    sections: List[Dict[str, float]] = [{} for _ in jd_texts]
+    if not chunks or not any(jd_clean):
+        return scores, sections
+
+    embeddings = encode_sorted([c.text for c in chunks] + [jd for jd in jd_clean if jd], sbert_model)
+    chunk_embeddings, jd_embeddings = embeddings[:len(chunks)], iter(embeddings[len(chunks):])
+    words = np.array([c.words for c in chunks], dtype=np.float64)
+    by_section: Dict[str, List[int]] = {}
+    for index, chunk in enumerate(chunks):
+        by_section.setdefault(chunk.section, []).append(index)
+
+    for j, jd in enumerate(jd_clean):
+        if not jd:
+            continue
+        jd_embedding = next(jd_embeddings)
+        scores[j] = pool_scores(chunk_embeddings, words / words.sum(), jd_embedding, pooling)
+        for section, indices in by_section.items():
+            sections[j][section] = round(pool_scores(
+                chunk_embeddings[indices], words[indices] / words[indices].sum(), jd_embedding, pooling
+            ), 4)
+    logger.debug("Scored %d chunk(s) in %d section(s) against %d JD(s)",
+                 len(chunks), len(by_section), len(jd_texts))
+    return scores, sections
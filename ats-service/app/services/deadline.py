@@ -0,0 +1,118 @@
+"""
+Request Deadlines
+
+This module lets a caller bound how long /parse may take. A request
+carrying a time budget gets a Deadline; each optional stage of the
+pipeline asks it whether its estimated cost (see app/config.py) still
+fits, and is degraded instead of skipped silently when it does not.
+
+Degradations, in the order they are given up:
+- feedback-skipped: only the heuristic feedback is returned, without
+  generate_white_box_feedback()
+- embedding-skipped: a stored resume (resume_id) gets no SBERT embedding
+- sbert-to-tfidf: relevance is computed with TF-IDF instead of SBERT
+- pdf-pages-capped: only the leading PDF pages that fit are extracted
+
+The stages run in another order (extraction, embedding, relevance,
+feedback), so a stage only goes ahead if its cost fits together with
+the estimated cost of the higher-priority stages still to come, and a
+stage is given up as soon as a higher-priority one has been.
+
+Extraction is planned first but sized so that the pipeline can still
+finish with every other stage degraded: the whole document is kept as
+long as possible, since losing content changes the score the most.
+
+Applied degradations are listed in the response and counted in the
+ats_degradations_total metric. Requests without a budget never degrade.
+"""
+
+import logging
+import math
+import time
+from typing import List, Optional
+
+from app.config import (
+    DEADLINE_RESERVE_SECONDS,
+    DEADLINE_SECONDS_PER_PDF_PAGE,
+    EXTRACTION_MAX_PAGES,
+)
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('ats_degradations_total', 'Pipeline stages degraded to meet a request time budget')
+
+DEGRADED_FEEDBACK = 'feedback-skipped'
+DEGRADED_SBERT = 'sbert-to-tfidf'
+DEGRADED_EMBEDDING = 'embedding-skipped'
+DEGRADED_PDF_PAGES = 'pdf-pages-capped'
+
+# Lowest priority first
+DEGRADATION_ORDER = (DEGRADED_FEEDBACK, DEGRADED_EMBEDDING, DEGRADED_SBERT, DEGRADED_PDF_PAGES)
+
+
+class Deadline:
+    """
+    Time budget of one request, measured from its creation, and the
+    degradations applied to stay within it.
+
+    Args:
+        budget_seconds (float, optional): Time budget; None for unbounded
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.budget_seconds = budget_seconds
+        self._expires = None if budget_seconds is None else time.monotonic() + budget_seconds
+        self.degradations: List[str] = []
+
+    def remaining(self) -> float:
+        """
+        Seconds left before the deadline (infinite without a budget).
+        """
+        if self._expires is None:
+            return math.inf
+        return self._expires - time.monotonic()
+
+    def allows(self, seconds: float) -> bool:
+        """
+        Whether seconds of optional work still fit, keeping the reserve
+        for the stages that always run.
+        """
+        return self.remaining() - DEADLINE_RESERVE_SECONDS >= seconds
+
+    def should_degrade(self, kind: str, seconds: float, reserve: float = 0.0) -> bool:
+        """
+        Return True, recording kind, when a stage estimated at seconds no
+        longer fits next to reserve (the estimated cost of higher-priority
+        stages still to come), or when a higher-priority stage has already
+        been degraded. Once applied, a kind stays applied for the request.
+        """
+        if kind in self.degradations:
+            return True
+        higher = DEGRADATION_ORDER[DEGRADATION_ORDER.index(kind) + 1:]
+        if self.allows(seconds + reserve) and not any(k in self.degradations for k in higher):
+            return False
+        self.record(kind)
+        return True
+
+    def record(self, kind: str) -> None:
+        """
+        Record a degradation that has been applied.
+        """
+        if kind in self.degradations:
+            return
+        self.degradations.append(kind)
+        metrics.increment('ats_degradations_total', kind=kind)
+        logger.info("Time budget: %s with %.0f ms left", kind, self.remaining() * 1000)
+
+    def page_cap(self) -> Optional[int]:
+        """
+        Most PDF pages that can be extracted in time (at least one), or
+        None when the budget covers every page the extraction limits allow.
+        """
+        if self._expires is None:
+            return None
+        pages = int((self.remaining() - DEADLINE_RESERVE_SECONDS) // DEADLINE_SECONDS_PER_PDF_PAGE)
+        if pages >= EXTRACTION_MAX_PAGES:
+            return None
+        return max(1, pages)
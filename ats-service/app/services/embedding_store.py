@@ -0,0 +1,332 @@
+"""
+Embedding Store
+
+This module keeps resume embeddings on disk as one contiguous matrix that
+every worker memory-maps read-only, so the OS page cache holds a single
+shared copy instead of each process keeping its own.
+
+Layout (inside EMBEDDING_STORE_DIR):
+- vectors.<generation>.bin  raw row-major matrix, float16 or int8
+- index.sqlite3             id -> row map, int8 scales, store metadata
+
+Key Responsibilities:
+- Append-only writes: a new or updated embedding is always a new row;
+  the id simply points at its latest row
+- Optional int8 quantization (symmetric, one float scale per row)
+- Deletes and overwritten rows become garbage, reclaimed by compaction
+  into a new generation file once the garbage ratio passes a threshold
+- Readers re-map automatically when the file grows or is compacted
+
+Writers serialise on the SQLite write lock (BEGIN IMMEDIATE), which
+works across processes on every platform.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import EMBEDDING_STORE_DIR, EMBEDDING_STORE_DTYPE, EMBEDDING_COMPACT_RATIO
+from app.utils.sqlite_connections import thread_connection
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = ('float16', 'int8')
+
+# Don't bother compacting small stores
+_MIN_ROWS_FOR_COMPACTION = 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key    TEXT PRIMARY KEY,
+    value  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    item_id  TEXT PRIMARY KEY,
+    row      INTEGER NOT NULL,
+    scale    REAL NOT NULL
+);
+"""
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    quantized = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales.astype(np.float64)
+
+
+class EmbeddingStore:
+    """
+    Append-only embedding matrix, memory-mapped read-only by readers.
+    """
+
+    def __init__(self, directory: str, dim: Optional[int] = None, dtype: str = 'float16'):
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype {dtype!r} (use one of {SUPPORTED_DTYPES})")
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._map_lock = threading.Lock()
+        self._mmap: Optional[np.ndarray] = None
+        self._mmap_key: Optional[Tuple[int, int]] = None
+
+        conn = self._connect()
+        with conn:
+            conn.executescript(_SCHEMA)
+        meta = self._meta(conn)
+        if not meta:
+            with conn:
+                conn.executemany('INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)', [
+                    ('dim', str(dim or 0)), ('dtype', dtype), ('generation', '0'), ('rows', '0'),
+                ])
+            meta = self._meta(conn)
+        self.dtype = meta['dtype']
+        self.dim = int(meta['dim'])
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        return thread_connection(self._local, os.path.join(self.directory, 'index.sqlite3'),
+                                 timeout=30.0, synchronous=None, isolation_level=None)
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> Dict[str, str]:
+        return dict(conn.execute('SELECT key, value FROM meta'))
+
+    def _vector_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f'vectors.{generation}.bin')
+
+    @property
+    def _np_dtype(self):
+        return np.float16 if self.dtype == 'float16' else np.int8
+
+    def _row_bytes(self) -> int:
+        return self.dim * np.dtype(self._np_dtype).itemsize
+
+    def _matrix(self, generation: int, rows: int) -> np.ndarray:
+        """
+        Return a read-only memory map over the first `rows` rows.
+        """
+        key = (generation, rows)
+        with self._map_lock:
+            if self._mmap_key != key:
+                if rows == 0:
+                    self._mmap = np.zeros((0, self.dim), dtype=self._np_dtype)
+                else:
+                    self._mmap = np.memmap(self._vector_path(generation), dtype=self._np_dtype,
+                                           mode='r', shape=(rows, self.dim))
+                self._mmap_key = key
+            return self._mmap
+
+    def _snapshot(self) -> Tuple[np.ndarray, Dict[str, Tuple[int, float]]]:
+        """
+        Consistent view: the mapped matrix plus the id -> (row, scale) map.
+        """
+        conn = self._connect()
+        for attempt in range(2):
+            conn.execute('BEGIN')
+            try:
+                meta = self._meta(conn)
+                self.dim = int(meta['dim'])
+                rows = {item_id: (row, scale) for item_id, row, scale in
+                        conn.execute('SELECT item_id, row, scale FROM rows')}
+            finally:
+                conn.execute('COMMIT')
+            try:
+                return self._matrix(int(meta['generation']), int(meta['rows'])), rows
+            except FileNotFoundError:
+                # A compaction committed a new generation and removed the
+                # file between the read above and the mmap: read again
+                if attempt:
+                    raise
+                logger.info("Embedding generation %s was compacted away — re-reading", meta['generation'])
+
+    def _decode(self, raw: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        vectors = raw.astype(np.float32)
+        if self.dtype == 'int8':
+            vectors *= scales[:, None].astype(np.float32)
+        return vectors
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._connect().execute('SELECT COUNT(*) FROM rows').fetchone()[0]
+
+    def put(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Append embeddings; existing ids are re-pointed at their new rows.
+
+        Args:
+            ids (Sequence[str]): One id per vector
+            vectors (np.ndarray): Embeddings of shape (len(ids), dim)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[0] != len(ids):
+            raise ValueError(f"Expected {len(ids)} vectors, got array of shape {vectors.shape}")
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            meta = self._meta(conn)
+            if int(meta['dim']) == 0:
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'dim'", (str(vectors.shape[1]),))
+                self.dim = vectors.shape[1]
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-d vectors, got {vectors.shape[1]}-d")
+
+            if self.dtype == 'int8':
+                encoded, scales = _quantize_int8(vectors)
+            else:
+                encoded, scales = vectors.astype(np.float16), np.ones(len(ids))
+
+            generation, start = int(meta['generation']), int(meta['rows'])
+            with open(self._vector_path(generation), 'ab') as fh:
+                # Truncate any partial tail left by a crashed writer
+                fh.truncate(start * self._row_bytes())
+                fh.write(np.ascontiguousarray(encoded).tobytes())
+                fh.flush()
+                os.fsync(fh.fileno())
+
+            conn.executemany(
+                'INSERT OR REPLACE INTO rows (item_id, row, scale) VALUES (?, ?, ?)',
+                [(item_id, start + i, float(scales[i])) for i, item_id in enumerate(ids)]
+            )
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'rows'", (str(start + len(ids)),))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        if self.garbage_ratio() > EMBEDDING_COMPACT_RATIO:
+            self.compact()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """
+        Remove ids; their rows are reclaimed on the next compaction.
+
+        Returns:
+            int: Number of ids removed
+        """
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            removed = 0
+            for item_id in ids:
+                removed += conn.execute('DELETE FROM rows WHERE item_id = ?', (item_id,)).rowcount
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return removed
+
+    def get(self, ids: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Fetch embeddings for ids (unknown ids are skipped).
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Found ids and their float32 vectors
+        """
+        matrix, rows = self._snapshot()
+        found = [i for i in ids if i in rows]
+        if not found:
+            return [], np.zeros((0, self.dim), dtype=np.float32)
+        row_idx = np.array([rows[i][0] for i in found])
+        scales = np.array([rows[i][1] for i in found])
+        return found, self._decode(matrix[row_idx], scales)
+
+    def iter_blocks(self, block_size: int) -> Iterator[Tuple[List[str], np.ndarray]]:
+        """
+        Yield every live embedding as (ids, float32 block) in row order.
+        """
+        matrix, rows = self._snapshot()
+        items = sorted(rows.items(), key=lambda item: item[1][0])
+        for start in range(0, len(items), block_size):
+            chunk = items[start:start + block_size]
+            row_idx = np.array([r for _, (r, _) in chunk])
+            scales = np.array([s for _, (_, s) in chunk])
+            yield [i for i, _ in chunk], self._decode(matrix[row_idx], scales)
+
+    def ids(self) -> List[str]:
+        """
+        Return every stored id.
+        """
+        return [row[0] for row in self._connect().execute('SELECT item_id FROM rows')]
+
+    def garbage_ratio(self) -> float:
+        """
+        Fraction of rows in the vector file no longer referenced by any id.
+        """
+        conn = self._connect()
+        total = int(self._meta(conn)['rows'])
+        if total < _MIN_ROWS_FOR_COMPACTION:
+            return 0.0
+        live = conn.execute('SELECT COUNT(*) FROM rows').fetchone()[0]
+        return 1.0 - live / total
+
+    def compact(self) -> None:
+        """
+        Rewrite live rows into a new generation file and drop the old one.
+
+        Readers holding a map of the old file keep working until they next
+        look at the store, at which point they map the new generation. A
+        reader that read the old generation just before the file was
+        removed re-reads the metadata (see _snapshot()).
+        """
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            meta = self._meta(conn)
+            generation, total = int(meta['generation']), int(meta['rows'])
+            items = list(conn.execute('SELECT item_id, row FROM rows ORDER BY row'))
+            old_path = self._vector_path(generation)
+            new_path = self._vector_path(generation + 1)
+
+            if total:
+                old = np.memmap(old_path, dtype=self._np_dtype, mode='r', shape=(total, self.dim))
+                with open(new_path, 'wb') as fh:
+                    for start in range(0, len(items), 4096):
+                        rows = [r for _, r in items[start:start + 4096]]
+                        fh.write(np.ascontiguousarray(old[rows]).tobytes())
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                del old
+            else:
+                open(new_path, 'wb').close()
+
+            conn.executemany('UPDATE rows SET row = ? WHERE item_id = ?',
+                             [(new_row, item_id) for new_row, (item_id, _) in enumerate(items)])
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'generation'", (str(generation + 1),))
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'rows'", (str(len(items)),))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        try:
+            os.remove(old_path)
+        except OSError:
+            # Windows refuses to unlink a file another reader still maps;
+            # the orphaned generation is harmless and can be deleted by hand.
+            logger.warning("Could not remove old embedding file %s", old_path)
+        logger.info("Compacted embedding store: %d -> %d row(s), generation %d",
+                    total, len(items), generation + 1)
+
+
+_store: Optional[EmbeddingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """
+    Return the process-wide embedding store, opening it on first use.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = EmbeddingStore(EMBEDDING_STORE_DIR, dtype=EMBEDDING_STORE_DTYPE)
+    return _store
@@ -0,0 +1,255 @@
+"""
+Extraction Sandbox
+
+This module runs text extraction for one document in a short-lived child
+process with hard resource limits, so a malformed or hostile file can no
+longer hang or exhaust the worker that received it.
+
+Limits (see app/config.py):
+- Wall-clock timeout: the child is killed when it overruns
+- Memory: RLIMIT_AS caps what the child may allocate on top of the
+  already-loaded interpreter (POSIX only)
+- Structure guard: PDFs with too many pages or objects, and DOCX files
+  that decompress to too much data, are rejected before parsing
+
+PDFs are also classified (see pdf_classifier.py) before layout analysis;
+image-only (scanned) files skip extraction entirely. With early stop
+enabled, pages stream through a SectionSegmenter (see
+section_segmenter.py) and the rest of the document is skipped once it
+has every required section and contact field; the sections and contact
+it found come back with the text, so /parse doesn't search for them
+again.
+
+A breach comes back as an ordinary parsing error string, which the
+scoring engine already penalises, instead of an exception or a dead
+worker.
+
+Pipeline stage: Text Extraction (wraps step 1 of the ATS pipeline)
+"""
+
+import io
+import logging
+import multiprocessing
+import sys
+import zipfile
+from itertools import islice
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.config import (
+    EXTRACTION_SANDBOX_ENABLED,
+    EXTRACTION_TIMEOUT_SECONDS,
+    EXTRACTION_MEMORY_LIMIT_BYTES,
+    EXTRACTION_MAX_PAGES,
+    EXTRACTION_MAX_PDF_OBJECTS,
+    EXTRACTION_MAX_DOCX_BYTES,
+    STREAMING_EARLY_STOP,
+)
+from app.services.resume_parser import safe_extract_text
+from app.services.pdf_classifier import KIND_IMAGE_ONLY, IMAGE_ONLY_ERROR, classify_pdf
+from app.services.section_segmenter import SectionSegmenter, Segments
+from app.services import metrics
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('ats_extraction_chunks_total',
+                 'Pages (PDF) or paragraph blocks (DOCX) read while streaming extraction')
+metrics.describe('ats_extraction_early_stop_total',
+                 'Documents whose remaining pages were skipped by early stop')
+
+# (chunks read, stopped early) for a streamed extraction
+StreamProgress = Optional[Tuple[int, bool]]
+
+# fork starts a child in a few milliseconds with the parser already
+# imported (spawn/forkserver would re-import the __main__ module, i.e.
+# rebuild the whole app, for every document). Only the child's thread
+# survives the fork; it touches nothing but the parser and the pipe.
+_START_METHOD = 'fork' if sys.platform.startswith('linux') else 'spawn'
+
+
+class ExtractionOutcome(NamedTuple):
+    text: str
+    errors: List[str]
+    # False when the outcome may be transient (timeout, crashed child)
+    cacheable: bool
+    # pdf_classifier kind for PDFs, None for other files
+    pdf_kind: Optional[str]
+    # The segmenter's sections and contact for text, when it ran
+    segments: Optional[Segments] = None
+
+
+def _limit_error(filename: str, detail: str) -> str:
+    kind = 'DOCX' if filename.lower().endswith(('.docx', '.doc')) else 'PDF'
+    return f'{kind} parsing error: limit exceeded ({detail})'
+
+
+def check_document_limits(file_bytes: bytes, filename: str,
+                          max_pages: int = EXTRACTION_MAX_PAGES,
+                          max_objects: int = EXTRACTION_MAX_PDF_OBJECTS,
+                          max_docx_bytes: int = EXTRACTION_MAX_DOCX_BYTES) -> Optional[str]:
+    """
+    Cheap structural checks run before full extraction.
+
+    Files the guard cannot read are passed through; the extractor then
+    reports them as normal parsing errors.
+
+    Returns:
+        Optional[str]: A parsing error describing the breach, or None
+    """
+    lower = filename.lower()
+    try:
+        if lower.endswith('.pdf'):
+            from pdfminer.pdfdocument import PDFDocument
+            from pdfminer.pdfpage import PDFPage
+            from pdfminer.pdfparser import PDFParser
+
+            document = PDFDocument(PDFParser(io.BytesIO(file_bytes)))
+            objects = sum(len(list(xref.get_objids())) for xref in document.xrefs)
+            if objects > max_objects:
+                return _limit_error(filename, f'{objects} objects, max {max_objects}')
+            pages = sum(1 for _ in islice(PDFPage.create_pages(document), max_pages + 1))
+            if pages > max_pages:
+                return _limit_error(filename, f'more than {max_pages} pages')
+
+        elif lower.endswith(('.docx', '.doc')):
+            with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive:
+                expanded = sum(info.file_size for info in archive.infolist())
+            if expanded > max_docx_bytes:
+                return _limit_error(filename, f'{expanded} bytes uncompressed, max {max_docx_bytes}')
+    except Exception as e:
+        logger.debug("Document guard could not inspect %s: %s", filename, e)
+    return None
+
+
+def _apply_memory_limit(limit_bytes: int) -> None:
+    if resource is None or limit_bytes <= 0:
+        return
+    baseline = 0
+    try:
+        # Count the interpreter and libraries already mapped in the child
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmSize:'):
+                    baseline = int(line.split()[1]) * 1024
+                    break
+    except OSError:
+        pass
+    cap = baseline + limit_bytes
+    resource.setrlimit(resource.RLIMIT_AS, (cap, cap))
+
+
+def _extract_streaming(file_bytes: bytes, filename: str,
+                       max_pages: Optional[int] = None) -> Tuple[str, List[str], Optional[str],
+                                                                 StreamProgress, Optional[Segments]]:
+    breach = check_document_limits(file_bytes, filename)
+    if breach:
+        return '', [breach], None, None, None
+
+    pdf_kind = None
+    if filename.lower().endswith('.pdf'):
+        pdf_kind = classify_pdf(file_bytes)['kind']
+        if pdf_kind == KIND_IMAGE_ONLY:
+            logger.info("Skipping extraction of image-only PDF %s", filename)
+            return '', [IMAGE_ONLY_ERROR], pdf_kind, None, None
+
+    if not STREAMING_EARLY_STOP:
+        text, errors = safe_extract_text(file_bytes, filename, max_pages=max_pages)
+        return text, errors, pdf_kind, None, None
+
+    segmenter = SectionSegmenter()
+    text, errors = safe_extract_text(file_bytes, filename, segmenter=segmenter, max_pages=max_pages)
+    if segmenter.stopped_early:
+        logger.info("Stopped extracting %s after %d chunk(s): all required sections found",
+                    filename, segmenter.chunks_read)
+    else:
+        segmenter.close()
+    # After a parsing error the segmenter may have seen text that was
+    # then dropped; /parse searches the returned text instead
+    segments = None if errors else segmenter.segments()
+    return text, errors, pdf_kind, (segmenter.chunks_read, segmenter.stopped_early), segments
+
+
+def _record_progress(progress: StreamProgress) -> None:
+    if progress is None:
+        return
+    chunks_read, stopped_early = progress
+    metrics.increment('ats_extraction_chunks_total', chunks_read)
+    if stopped_early:
+        metrics.increment('ats_extraction_early_stop_total')
+
+
+def run_in_process(file_bytes: bytes, filename: str,
+                   max_pages: Optional[int] = None) -> ExtractionOutcome:
+    """
+    Extract one document like run_sandboxed(), but in the current process
+    (structure guard only; used when the sandbox is disabled).
+    """
+    text, errors, pdf_kind, progress, segments = _extract_streaming(file_bytes, filename, max_pages)
+    _record_progress(progress)
+    return ExtractionOutcome(text, errors, True, pdf_kind, segments)
+
+
+def extract_document(file_bytes: bytes, filename: str,
+                     max_pages: Optional[int] = None) -> Tuple[str, List[str], Optional[str]]:
+    """
+    Guard, classify and extract one document in the current process,
+    reading at most max_pages pages of a PDF when given.
+
+    Returns:
+        Tuple[str, List[str], Optional[str]]: (text, errors, pdf_kind)
+    """
+    outcome = run_in_process(file_bytes, filename, max_pages)
+    return outcome.text, outcome.errors, outcome.pdf_kind
+
+
+def _child_main(conn, file_bytes: bytes, filename: str, memory_limit: int,
+                max_pages: Optional[int]) -> None:
+    try:
+        _apply_memory_limit(memory_limit)
+        conn.send(_extract_streaming(file_bytes, filename, max_pages))
+    except MemoryError:
+        conn.send(('', [_limit_error(filename, 'memory')], None, None, None))
+    finally:
+        conn.close()
+
+
+def run_sandboxed(file_bytes: bytes, filename: str,
+                  timeout: float = EXTRACTION_TIMEOUT_SECONDS,
+                  memory_limit: int = EXTRACTION_MEMORY_LIMIT_BYTES,
+                  max_pages: Optional[int] = None) -> ExtractionOutcome:
+    """
+    Extract text in a child process under the configured limits, reading
+    at most max_pages pages of a PDF when given.
+
+    Returns:
+        ExtractionOutcome: Text (empty on failure), parsing errors including
+        limit breaches, whether the outcome may be cached, and the PDF kind
+    """
+    ctx = multiprocessing.get_context(_START_METHOD)
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child_main, args=(sender, file_bytes, filename, memory_limit, max_pages))
+    process.start()
+    sender.close()
+
+    try:
+        if receiver.poll(timeout):
+            try:
+                text, errors, pdf_kind, progress, segments = receiver.recv()
+                _record_progress(progress)
+                return ExtractionOutcome(text, errors, True, pdf_kind, segments)
+            except EOFError:
+                process.join(5)
+                logger.warning("Extraction process for %s died (exit code %s)", filename, process.exitcode)
+                error = _limit_error(filename, f'extractor crashed, exit code {process.exitcode}')
+                return ExtractionOutcome('', [error], False, None)
+        logger.warning("Extraction of %s exceeded %.1fs — killing child process", filename, timeout)
+        return ExtractionOutcome('', [_limit_error(filename, f'timeout after {timeout:g}s')], False, None)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
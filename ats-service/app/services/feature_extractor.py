@@ -0,0 +1,223 @@
+"""
+Feature Extractor Service
+
+This module turns resume text into a flat, versioned feature record.
+It contains every text-dependent check used by heuristic scoring
+(keyword counts, durations, skill count, contact flags) but none of the
+scoring arithmetic.
+
+Key Responsibilities:
+- Run all text scans needed by compute_heuristics exactly once
+- Produce a JSON-serialisable record that callers can store
+- Version the record so stale records can be detected on rescore
+- Record which keyword lists and skill dictionary produced the counts
+
+The keyword lists behind each check come from the scoring rubric (see
+rubric.py). Because the record holds raw counts and flags rather than
+points, the rubric weights can change without re-parsing any resume:
+stored records are simply fed back through score_features().
+
+Pipeline stage: Feature Extraction (between skill extraction and scoring)
+"""
+
+import re
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.services.skill_dictionary import SkillDictionary, get_skill_dictionary
+from app.services.skill_extractor import extract_skills_from_resume
+from app.services.resume_parser import extract_contact_info
+from app.services.rubric import Rubric, get_rubric
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a field is added, removed or computed differently.
+# Records carrying another version must be re-extracted from text.
+# 2: skill_count counts each skill once, whichever aliases the resume
+#    uses; rubric and skill dictionary provenance fields added
+FEATURE_VERSION: int = 2
+
+# Numeric fields of a feature record, in a fixed order.
+# Booleans are included and read as 0/1.
+FEATURE_FIELDS = (
+    'education_present',
+    'degree_level',
+    'relevant_field',
+    'top_school',
+    'experience_present',
+    'duration_months',
+    'distinct_years',
+    'mentions_present',
+    'long_experience_text',
+    'action_verb_count',
+    'metric_count',
+    'seniority_count',
+    'top_company',
+    'skill_count',
+    'projects_present',
+    'tech_count',
+    'impact_count',
+    'link_count',
+    'project_mentions',
+    'has_email',
+    'has_phone',
+    'has_linkedin',
+    'has_github',
+    'has_portfolio',
+    'parsing_error_count',
+)
+
+# Where the counts came from: the rubric version, the digest of its
+# keyword lists (Rubric.matchers_digest) and the skill dictionary
+# version. A record is only comparable with scores computed from the
+# same lists; the rubric weights may differ.
+FEATURE_SOURCE_FIELDS = (
+    'rubric_version',
+    'rubric_matchers',
+    'skill_dictionary_version',
+)
+
+# ── Compiled patterns ──────────────────────────────────────────────
+YEARS_DURATION_RE = re.compile(r'(\d+\.?\d*)\s*(?:years?|yrs?)')
+MONTHS_DURATION_RE = re.compile(r'(\d+\.?\d*)\s*(?:months?|mos?)')
+YEAR_RE = re.compile(r'20[12]\d')
+METRIC_RE = re.compile(
+    r'\d+%|\$\d+[kmb]?|\d+\s*(?:users|customers|clients|projects|applications|team|engineers|developers)'
+)
+IMPACT_RE = re.compile(r'\d+\s*(?:users|downloads|stars|forks|views)|deployed|production|live')
+
+
+def _extract_education_features(education_text: str, full_text: str, rubric: Rubric) -> Dict[str, Any]:
+    """
+    Extract education features: section presence, degree level,
+    relevant field and recognised institution.
+    """
+    present = bool(education_text) or 'education' in full_text
+    text = (education_text + ' ' + full_text).lower()
+
+    return {
+        'education_present': present,
+        'degree_level': rubric.degree_level(text),
+        'relevant_field': rubric.matchers['relevant_fields'].any_in(text),
+        'top_school': rubric.matchers['top_schools'].any_in(text),
+    }
+
+
+def _extract_experience_features(experience_text: str, full_text: str, rubric: Rubric) -> Dict[str, Any]:
+    """
+    Extract experience features: explicit durations, year mentions,
+    action verbs, quantified achievements, seniority and top companies.
+    """
+    present = bool(experience_text) or 'experience' in full_text
+    text = (experience_text + ' ' + full_text).lower()
+
+    # Explicit durations such as "2 years" or "6 months"
+    total_months = 0
+    for match in YEARS_DURATION_RE.findall(text):
+        total_months += float(match) * 12
+    for match in MONTHS_DURATION_RE.findall(text):
+        total_months += float(match)
+
+    return {
+        'experience_present': present,
+        'duration_months': float(total_months),
+        'distinct_years': len(set(YEAR_RE.findall(text))),
+        'mentions_present': 'present' in text or 'current' in text,
+        'long_experience_text': len(text) > 200,
+        'action_verb_count': rubric.matchers['action_verbs'].count_in(text),
+        'metric_count': len(METRIC_RE.findall(text)),
+        'seniority_count': rubric.matchers['seniority_terms'].count_in(text),
+        'top_company': rubric.matchers['top_companies'].any_in(text),
+    }
+
+
+def _extract_project_features(projects_text: str, full_text: str, rubric: Rubric) -> Dict[str, Any]:
+    """
+    Extract project features: presence, tech stack mentions, impact,
+    links to work and how often projects are mentioned.
+    """
+    if not projects_text:
+        present = rubric.matchers['project_indicators'].any_in(full_text)
+        text = full_text
+    else:
+        present = True
+        text = projects_text + ' ' + full_text
+
+    text_lower = text.lower()
+
+    return {
+        'projects_present': present,
+        'tech_count': rubric.matchers['tech_indicators'].count_in(text_lower),
+        'impact_count': len(IMPACT_RE.findall(text_lower)),
+        'link_count': rubric.matchers['link_indicators'].count_in(text_lower),
+        'project_mentions': text_lower.count('project'),
+    }
+
+
+def _extract_contact_features(contact: dict, full_text: str, rubric: Rubric) -> Dict[str, Any]:
+    """
+    Extract contact completeness flags.
+    """
+    return {
+        'has_email': bool(contact.get('email')),
+        'has_phone': bool(contact.get('phone')),
+        'has_linkedin': 'linkedin' in full_text,
+        'has_github': 'github' in full_text,
+        'has_portfolio': rubric.matchers['portfolio_indicators'].any_in(full_text),
+    }
+
+
+def extract_features(text: str, parsed_sections: dict,
+                     parsing_errors: List[str], rubric: Optional[Rubric] = None,
+                     skill_dictionary: Optional[SkillDictionary] = None) -> Dict[str, Any]:
+    """
+    Extract the versioned feature record used by heuristic scoring.
+
+    Every text scan performed during scoring happens here, so the record
+    can be stored and rescored later with score_features() without
+    touching the resume text again.
+
+    Args:
+        text (str): Full resume text
+        parsed_sections (dict): Dictionary of extracted sections
+        parsing_errors (List[str]): List of errors encountered during parsing
+        rubric (Rubric, optional): Keyword lists to match (default: the active rubric)
+        skill_dictionary (SkillDictionary, optional): Skills to count
+            (default: the active dictionary)
+
+    Returns:
+        Dict[str, Any]: Feature record with 'version', every field in
+        FEATURE_FIELDS and FEATURE_SOURCE_FIELDS and the 'parsing_errors'
+        messages
+
+    Example:
+        >>> features = extract_features(text, parsed, [])
+        >>> features['version'], features['skill_count']
+        (2, 14)
+    """
+    rubric = rubric or get_rubric()
+    skill_dictionary = skill_dictionary or get_skill_dictionary()
+    text_lower = text.lower()
+
+    features: Dict[str, Any] = {
+        'version': FEATURE_VERSION,
+        'rubric_version': rubric.version,
+        'rubric_matchers': rubric.matchers_digest,
+        'skill_dictionary_version': skill_dictionary.version,
+    }
+    features.update(_extract_education_features(
+        parsed_sections.get('education', '') or '', text_lower, rubric
+    ))
+    features.update(_extract_experience_features(
+        parsed_sections.get('experience', '') or '', text_lower, rubric
+    ))
+    features['skill_count'] = len(extract_skills_from_resume(text, skill_dictionary))
+    features.update(_extract_project_features(
+        parsed_sections.get('projects', '') or '', text_lower, rubric
+    ))
+    features.update(_extract_contact_features(extract_contact_info(text), text_lower, rubric))
+    features['parsing_error_count'] = len(parsing_errors)
+    features['parsing_errors'] = list(parsing_errors)
+
+    logger.debug("Extracted feature record v%d (%d skills)", FEATURE_VERSION, features['skill_count'])
+    return features
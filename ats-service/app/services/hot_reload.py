@@ -0,0 +1,110 @@
+"""
+Hot Reload
+
+This module keeps one compiled object built from a data file (the
+scoring rubric, the skill dictionary) and replaces it when the file
+changes, without a restart.
+
+The object is compiled completely before it is published, then swapped
+in with a single reference assignment, so readers never see a partial
+version and a request that fetched the object keeps using it until it
+finishes. Compilation happens on a background watcher thread (or in an
+admin call), never on the scoring path. A file that fails to load is
+logged and the previous version stays active.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class HotReloadable(Generic[T]):
+    """
+    The active compiled version of a data file.
+
+    Args:
+        name (str): What the file holds, for log messages
+        path (str): File to load and watch
+        loader (Callable[[str], T]): Reads and compiles a file; raises
+            ValueError or OSError when it is invalid. The result must
+            have a 'version' attribute.
+    """
+
+    def __init__(self, name: str, path: str, loader: Callable[[str], T]):
+        self.name = name
+        self.path = path
+        self._loader = loader
+        self._current: Optional[T] = None
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+
+    def get(self) -> T:
+        """
+        Return the active version, loading the file on first use.
+        """
+        current = self._current
+        if current is None:
+            with self._lock:
+                if self._current is None:
+                    self._swap(self.path)
+                current = self._current
+        return current
+
+    def reload(self, path: Optional[str] = None) -> T:
+        """
+        Recompile the file (or another one) and make it active.
+
+        Raises:
+            ValueError / OSError: If the file is invalid; the current version stays
+        """
+        with self._lock:
+            return self._swap(path or self.path)
+
+    def _swap(self, path: str) -> T:
+        mtime = _mtime(path)
+        compiled = self._loader(path)
+        self._current, self._mtime = compiled, mtime
+        logger.info("%s %s loaded from %s", self.name.capitalize(), compiled.version, path)
+        return compiled
+
+    def _watch(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            mtime = _mtime(self.path)
+            if mtime is None or mtime == self._mtime:
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                # Whatever the loader raised, the watcher must keep polling
+                logger.error("Rejected changed %s file %s: %s — keeping version %s",
+                             self.name, self.path, e,
+                             self._current.version if self._current is not None else None)
+                # Don't report the same broken file on every poll
+                self._mtime = mtime
+
+    def start_watcher(self, interval: float) -> None:
+        """
+        Load the file and start the daemon thread that reloads it when its
+        mtime changes (once per process; no-op if interval <= 0).
+        """
+        self.get()
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._watcher = threading.Thread(target=self._watch, args=(interval,),
+                                         name=f"{self.name.replace(' ', '-')}-watcher", daemon=True)
+        self._watcher.start()
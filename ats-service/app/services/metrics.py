@@ -0,0 +1,84 @@
+"""
+Metrics
+
+This module keeps simple in-process counters and renders them in the
+Prometheus text exposition format for GET /metrics.
+
+Counters are per worker process; a scraper that hits the service through
+a load balancer sees one worker at a time, so sum the series by instance
+(or scrape each worker) when running more than one.
+
+Key Responsibilities:
+- Count named events with optional labels
+- Leave out events of internal work such as the startup warmup
+- Render all counters as Prometheus text
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+_counters: Dict[str, Dict[_LabelKey, float]] = {}
+_help: Dict[str, str] = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def describe(name: str, help_text: str) -> None:
+    """
+    Register the HELP line shown for a counter.
+    """
+    _help[name] = help_text
+
+
+def increment(name: str, amount: float = 1.0, **labels: str) -> None:
+    """
+    Add amount to the counter name{labels}, unless the calling thread
+    is inside suppressed().
+    """
+    if getattr(_local, 'suppressed', False):
+        return
+    key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0.0) + amount
+
+
+@contextmanager
+def suppressed() -> Iterator[None]:
+    """
+    Drop the increments the current thread makes inside the block, so
+    internal work does not show up as traffic. Other threads keep
+    counting.
+    """
+    previous = getattr(_local, 'suppressed', False)
+    _local.suppressed = True
+    try:
+        yield
+    finally:
+        _local.suppressed = previous
+
+
+def snapshot() -> Dict[str, Dict[_LabelKey, float]]:
+    """
+    Return a copy of every counter.
+    """
+    with _lock:
+        return {name: dict(series) for name, series in _counters.items()}
+
+
+def render_prometheus() -> str:
+    """
+    Render every counter in the Prometheus text format.
+    """
+    lines = []
+    for name, series in sorted(snapshot().items()):
+        if name in _help:
+            lines.append(f'# HELP {name} {_help[name]}')
+        lines.append(f'# TYPE {name} counter')
+        for labels, value in sorted(series.items()):
+            label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{label_text}}} {value:g}' if label_text else f'{name} {value:g}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,133 @@
+"""
+PDF Classifier
+
+This module decides in a few milliseconds whether a PDF has a text layer
+at all, before the expensive pdfminer layout analysis runs.
+
+Scanned resumes are usually one full-page image per page with no fonts
+and no text-showing operators. Running layout analysis on them produces
+empty text and a near-zero score, so they are short-circuited instead
+with a parsing error that tells the candidate what to fix.
+
+How it works (first few pages only):
+- Look at each page's resources for fonts and image XObjects
+- Scan the start of each content stream (decompressed with a hard size
+  bound) for text-showing operators (Tj, TJ, ', ")
+
+Kinds:
+- text: every sampled page shows text
+- image_only: sampled pages draw images but show no text
+- mixed: some sampled pages show text, others are images only
+- unknown: nothing conclusive (blank pages, unreadable structure)
+"""
+
+import io
+import logging
+import re
+import zlib
+from itertools import islice
+from typing import Any, Dict, Optional
+
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, dict_value, resolve1, stream_value
+
+logger = logging.getLogger(__name__)
+
+KIND_TEXT = 'text'
+KIND_IMAGE_ONLY = 'image_only'
+KIND_MIXED = 'mixed'
+KIND_UNKNOWN = 'unknown'
+
+SAMPLE_PAGES = 3
+
+# Content bytes scanned per page; text operators appear early in practice
+_MAX_SCAN_BYTES = 256 * 1024
+
+_TEXT_OPERATOR_RE = re.compile(rb"[)\]>]\s*(?:Tj|TJ|'|\")")
+
+IMAGE_ONLY_ERROR = 'PDF parsing error: image-only (scanned) PDF, no text layer found'
+IMAGE_ONLY_FEEDBACK = (
+    'Your resume appears to be a scanned image with no selectable text, so an ATS '
+    'cannot read it. Export it from your word processor as a text-based PDF or DOCX.'
+)
+
+
+def _content_prefix(stream) -> Optional[bytes]:
+    """
+    Return up to _MAX_SCAN_BYTES of a content stream, or None when its
+    encoding is not one we decode here.
+    """
+    filters = resolve1(stream.attrs.get('Filter'))
+    if isinstance(filters, list):
+        filters = filters[0] if len(filters) == 1 else filters
+    raw = stream.rawdata if stream.rawdata is not None else stream.data
+    if raw is None:
+        return None
+    if filters is None:
+        return raw[:_MAX_SCAN_BYTES]
+    if getattr(filters, 'name', None) in ('FlateDecode', 'Fl'):
+        try:
+            return zlib.decompressobj().decompress(raw, _MAX_SCAN_BYTES)
+        except zlib.error:
+            return None
+    return None
+
+
+def _page_signals(page) -> Dict[str, bool]:
+    resources = dict_value(page.resources)
+    has_font = bool(dict_value(resources.get('Font')))
+
+    has_image = False
+    for xobject in dict_value(resources.get('XObject')).values():
+        xobject = resolve1(xobject)
+        if isinstance(xobject, PDFStream) and \
+                getattr(resolve1(xobject.attrs.get('Subtype')), 'name', None) == 'Image':
+            has_image = True
+            break
+
+    has_text_ops = None
+    for stream in page.contents:
+        prefix = _content_prefix(stream_value(stream))
+        if prefix is None:
+            continue
+        has_text_ops = bool(has_text_ops) or bool(_TEXT_OPERATOR_RE.search(prefix))
+
+    # Undecodable content: fall back to "has fonts" as the text signal
+    shows_text = has_text_ops if has_text_ops is not None else has_font
+    return {'text': shows_text, 'image': has_image}
+
+
+def classify_pdf(file_bytes: bytes, sample_pages: int = SAMPLE_PAGES) -> Dict[str, Any]:
+    """
+    Classify a PDF as text, image-only, mixed or unknown.
+
+    Args:
+        file_bytes (bytes): Raw PDF bytes
+        sample_pages (int): Number of leading pages to inspect
+
+    Returns:
+        dict: {'kind', 'pagesSampled', 'textPages', 'imagePages'}
+    """
+    result = {'kind': KIND_UNKNOWN, 'pagesSampled': 0, 'textPages': 0, 'imagePages': 0}
+    try:
+        document = PDFDocument(PDFParser(io.BytesIO(file_bytes)))
+        for page in islice(PDFPage.create_pages(document), sample_pages):
+            signals = _page_signals(page)
+            result['pagesSampled'] += 1
+            if signals['text']:
+                result['textPages'] += 1
+            elif signals['image']:
+                result['imagePages'] += 1
+    except Exception as e:
+        logger.debug("PDF classification failed: %s", e)
+        return result
+
+    if result['textPages'] and result['imagePages']:
+        result['kind'] = KIND_MIXED
+    elif result['textPages']:
+        result['kind'] = KIND_TEXT
+    elif result['imagePages']:
+        result['kind'] = KIND_IMAGE_ONLY
+    return result
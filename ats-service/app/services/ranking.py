@@ -0,0 +1,409 @@
+"""
+Ranking Service
+
+This module ranks many resumes against one job description, and scores
+one resume against many job descriptions.
+
+Instead of one TF-IDF fit per resume (what N calls to /similarity cost),
+all resumes are vectorized together and scored with a single sparse
+matrix-vector product. With SBERT enabled the resumes are encoded in one
+batch and scored with one matrix multiplication.
+
+For large pools, two-stage ranking lets the sparse TF-IDF score pick the
+top-M candidates and only re-ranks those with SBERT, reusing stored
+embeddings where there are any, so SBERT cost no longer grows with N.
+
+Key Responsibilities:
+- Score every resume against a job description in one operation
+- Select the top-k with argpartition (no full sort of all N scores)
+- Prefilter with TF-IDF and re-rank the top-M with SBERT
+- Score one resume against many job descriptions with the same values
+  /parse gives for each pair
+"""
+
+import logging
+import math
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from app.config import SBERT_CHUNKING
+from app.services.chunked_encoding import chunked_relevance, pooled_embeddings
+from app.utils.text_cleaner import clean_text, tfidf_terms
+
+logger = logging.getLogger(__name__)
+
+# Looks up stored SBERT embeddings by index into the resume list; returns
+# the ones it has (see rank_resumes)
+EmbeddingLookup = Callable[[Sequence[int]], Dict[int, np.ndarray]]
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the indices of the k highest scores, best first.
+
+    argpartition finds the top-k in O(N); only those k are then sorted.
+    Equal scores are ordered by index, as a stable full sort would, also
+    when they straddle the k-th place.
+
+    Args:
+        scores (np.ndarray): One score per candidate
+        k (int): Number of results wanted
+
+    Returns:
+        np.ndarray: Up to k indices into scores, highest score first
+    """
+    n = scores.shape[0]
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(-scores, kind='stable')
+
+    # argpartition picks arbitrarily among scores tied with the k-th:
+    # keep everything above it, then the lowest-index ties
+    threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - above.size]
+    candidates = np.concatenate([above, ties])
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def relevance_scores_tfidf(jd_text: str, resume_texts: Sequence[str]) -> np.ndarray:
+    """
+    Cosine similarity of every resume to the job description (TF-IDF).
+
+    The vectorizer is fitted once on the job description plus all resumes,
+    so IDF weights reflect the whole candidate pool.
+
+    Args:
+        jd_text (str): Job description text
+        resume_texts (Sequence[str]): Resume texts
+
+    Returns:
+        np.ndarray: One similarity (0-1) per resume
+    """
+    if not resume_texts:
+        return np.zeros(0)
+
+    try:
+        vect = TfidfVectorizer(analyzer=tfidf_terms)
+        matrix = vect.fit_transform([jd_text or ''] + [t or '' for t in resume_texts])
+    except ValueError:
+        # Empty vocabulary (all inputs empty or stopwords only)
+        return np.zeros(len(resume_texts))
+
+    # Rows are L2-normalised, so the dot product is the cosine similarity
+    scores = (matrix[1:] @ matrix[0].T).toarray().ravel()
+    return np.nan_to_num(scores)
+
+
+# Smoothed IDF of a term in a two-document corpus (one JD, one resume), by
+# the number of the two documents that contain it — what TfidfVectorizer
+# computes when fitted on a single pair
+_PAIR_IDF_ONE = math.log(3 / 2) + 1.0
+_PAIR_IDF_BOTH = 1.0
+
+
+def pairwise_relevance_tfidf(resume_text: str, jd_texts: Sequence[str]) -> np.ndarray:
+    """
+    TF-IDF similarity of one resume to each job description, as if a
+    separate vectorizer were fitted on every (JD, resume) pair.
+
+    These are exactly the values compute_relevance_tfidf() returns pair
+    by pair, but the texts are tokenized and counted once and all pairs
+    are scored with a few sparse products. A pair's IDF only depends on
+    whether a term occurs in one or both of its texts: shared terms weigh
+    _PAIR_IDF_BOTH, all others _PAIR_IDF_ONE.
+
+    Args:
+        resume_text (str): Resume text
+        jd_texts (Sequence[str]): Job description texts
+
+    Returns:
+        np.ndarray: One similarity (0-1) per job description
+    """
+    if not jd_texts:
+        return np.zeros(0)
+
+    try:
+        counts = CountVectorizer(analyzer=tfidf_terms, dtype=np.float64).fit_transform(
+            [resume_text or ''] + [t or '' for t in jd_texts]
+        ).tocsr()
+    except ValueError:
+        # Empty vocabulary (all inputs empty or stopwords only)
+        return np.zeros(len(jd_texts))
+
+    resume, jds = counts[0], counts[1:]
+    resume_sq = resume.multiply(resume)
+    jds_sq = jds.multiply(jds)
+    in_jd = (jds > 0).astype(np.float64)
+    in_resume = (resume > 0).astype(np.float64)
+
+    # Squared norms: every term at the one-document weight, then shared
+    # terms corrected down to the both-documents weight
+    one, both = _PAIR_IDF_ONE ** 2, _PAIR_IDF_BOTH ** 2
+    resume_norm = one * resume_sq.sum() - (one - both) * (in_jd @ resume_sq.T).toarray().ravel()
+    jd_norm = (one * np.asarray(jds_sq.sum(axis=1)).ravel()
+               - (one - both) * (jds_sq @ in_resume.T).toarray().ravel())
+    dot = both * (jds @ resume.T).toarray().ravel()
+
+    denom = np.sqrt(resume_norm * jd_norm)
+    scores = np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0)
+    return np.nan_to_num(scores)
+
+
+def tfidf_pair_similarity(text_a: str, text_b: str) -> float:
+    """
+    TF-IDF cosine similarity of a single pair of texts, without sklearn.
+
+    Same tokens, stopwords, smoothed IDF and L2 normalisation as fitting
+    TfidfVectorizer(analyzer=tfidf_terms) on the two texts, computed from
+    two term Counters. For one pair, building the vectorizer's vocabulary,
+    the sparse matrix and cosine_similarity costs far more than the
+    arithmetic itself; batch work should keep using the sklearn paths.
+
+    Args:
+        text_a (str): First text (e.g., resume)
+        text_b (str): Second text (e.g., job description)
+
+    Returns:
+        float: Similarity score between 0.0 and 1.0
+    """
+    counts_a = Counter(tfidf_terms(text_a or ''))
+    counts_b = Counter(tfidf_terms(text_b or ''))
+    if not counts_a or not counts_b:
+        return 0.0
+
+    one, both = _PAIR_IDF_ONE ** 2, _PAIR_IDF_BOTH ** 2
+    dot = norm_a = 0.0
+    for term, count in counts_a.items():
+        other = counts_b.get(term)
+        if other is None:
+            norm_a += one * count * count
+        else:
+            norm_a += both * count * count
+            dot += both * count * other
+    norm_b = sum((both if term in counts_a else one) * count * count
+                 for term, count in counts_b.items())
+    return dot / math.sqrt(norm_a * norm_b)
+
+
+def embed_texts(texts: Sequence[str], sbert_model, stop_words: set = None) -> np.ndarray:
+    """
+    Encode texts with SBERT in one batch, cleaned the same way as
+    ats_similarity_score_sbert() cleans its inputs.
+
+    Args:
+        texts (Sequence[str]): Texts to encode
+        sbert_model: Loaded SentenceTransformer
+        stop_words (set): Set of stopwords for text cleaning
+
+    Returns:
+        np.ndarray: L2-normalised embeddings, one row per text
+    """
+    cleaned = [clean_text(t, stop_words) for t in texts]
+    return np.asarray(sbert_model.encode(cleaned, normalize_embeddings=True))
+
+
+def embed_resumes(texts: Sequence[str], sbert_model, stop_words: set = None) -> np.ndarray:
+    """
+    Encode resumes with SBERT for ranking and the embedding store.
+
+    With ATS_SBERT_CHUNKING each resume is the mean of its section chunk
+    embeddings (see pooled_embeddings()), so its score against a JD is
+    the one /parse gives with mean pooling; otherwise the whole cleaned
+    text is encoded as by embed_texts().
+
+    Args:
+        texts (Sequence[str]): Resume texts
+        sbert_model: Loaded SentenceTransformer
+        stop_words (set): Set of stopwords for text cleaning
+
+    Returns:
+        np.ndarray: L2-normalised embeddings, one row per resume
+    """
+    if SBERT_CHUNKING:
+        return pooled_embeddings(texts, sbert_model, stop_words)
+    return embed_texts(texts, sbert_model, stop_words)
+
+
+def relevance_scores_sbert(jd_text: str, resume_texts: Sequence[str],
+                           sbert_model, stop_words: set = None,
+                           known_embeddings: Optional[Dict[int, np.ndarray]] = None) -> np.ndarray:
+    """
+    Cosine similarity of every resume to the job description (SBERT).
+
+    All resumes are encoded in one batch (see embed_resumes()) and
+    compared with one matmul.
+
+    Args:
+        jd_text (str): Job description text
+        resume_texts (Sequence[str]): Resume texts
+        sbert_model: Loaded SentenceTransformer
+        stop_words (set): Set of stopwords for text cleaning
+        known_embeddings (dict, optional): Stored embeddings by index into
+            resume_texts; only the other resumes are encoded
+
+    Returns:
+        np.ndarray: One similarity (0-1) per resume
+    """
+    if not resume_texts:
+        return np.zeros(0)
+
+    jd_clean = clean_text(jd_text, stop_words)
+    if not jd_clean:
+        return np.zeros(len(resume_texts))
+
+    jd_embedding = np.asarray(sbert_model.encode([jd_clean], normalize_embeddings=True))[0]
+    known = known_embeddings or {}
+    resume_embeddings = np.empty((len(resume_texts), jd_embedding.shape[0]), dtype=np.float32)
+    empty = np.zeros(len(resume_texts), dtype=bool)
+    missing = [i for i in range(len(resume_texts)) if i not in known]
+    if missing:
+        resume_embeddings[missing] = embed_resumes([resume_texts[i] for i in missing], sbert_model, stop_words)
+        empty[missing] = [not clean_text(resume_texts[i], stop_words) for i in missing]
+    for i, vector in known.items():
+        resume_embeddings[i] = vector
+        empty[i] = not (resume_texts[i] or '').strip()
+
+    scores = resume_embeddings @ jd_embedding
+    # Empty resumes have no meaningful embedding
+    scores[empty] = 0.0
+    return np.clip(scores, 0.0, 1.0)
+
+
+def _stored_embeddings(lookup: Optional[EmbeddingLookup], count: int) -> Dict[int, np.ndarray]:
+    if lookup is None:
+        return {}
+    try:
+        return lookup(range(count))
+    except Exception as e:
+        logger.warning("Stored embedding lookup failed: %s — encoding instead", e)
+        return {}
+
+
+def rerank_sbert(jd_text: str, resume_texts: Sequence[str], candidates: np.ndarray, top_k: int,
+                 sbert_model, stop_words: set = None,
+                 known_embeddings: Optional[Dict[int, np.ndarray]] = None) -> List[Tuple[int, float]]:
+    """
+    Re-rank a candidate subset of the resumes with SBERT.
+
+    Only the candidates are scored: stored embeddings are compared
+    directly, the rest are encoded in one batch.
+
+    Args:
+        jd_text (str): Job description text
+        resume_texts (Sequence[str]): All resume texts
+        candidates (np.ndarray): Indices into resume_texts to score
+        top_k (int): Number of results wanted
+        sbert_model: Loaded SentenceTransformer
+        stop_words (set): Set of stopwords for text cleaning
+        known_embeddings (dict, optional): Stored embeddings by index into
+            resume_texts
+
+    Returns:
+        List[Tuple[int, float]]: (index into resume_texts, SBERT score), best first
+    """
+    known = known_embeddings or {}
+    subset = {p: known[int(index)] for p, index in enumerate(candidates) if int(index) in known}
+    scores = relevance_scores_sbert(jd_text, [resume_texts[i] for i in candidates],
+                                    sbert_model, stop_words, known_embeddings=subset)
+    return [(int(candidates[i]), float(scores[i])) for i in top_k_indices(scores, top_k)]
+
+
+def rank_resumes(jd_text: str, resume_texts: Sequence[str], top_k: int,
+                 sbert_model=None, sbert_enabled: bool = False,
+                 stop_words: set = None, prefilter: int = 0,
+                 lookup: Optional[EmbeddingLookup] = None) -> Tuple[List[Tuple[int, float]], str]:
+    """
+    Rank resumes against a job description and return the top-k.
+
+    Uses SBERT when enabled, falling back to TF-IDF on any SBERT failure.
+    Stored embeddings (from lookup) are compared directly; the other
+    resumes are encoded. When more than prefilter (M) resumes would have
+    to be encoded, ranking is two-stage instead: TF-IDF scores every
+    resume and only its top-M (at least top_k) are scored with SBERT, so
+    resumes outside the TF-IDF top-M are never returned. With every
+    embedding stored, exhaustive SBERT is a single matmul and cheaper
+    than the TF-IDF pass, so no prefilter is applied.
+
+    Args:
+        jd_text (str): Job description text
+        resume_texts (Sequence[str]): Resume texts
+        top_k (int): Number of results wanted
+        sbert_model: SBERT model instance (or None)
+        sbert_enabled (bool): Whether SBERT is available
+        stop_words (set): Set of stopwords for text cleaning
+        prefilter (int): Most resumes encoded per query before TF-IDF
+            prefiltering kicks in (0 = never prefilter)
+        lookup (callable, optional): Stored embeddings by resume index
+
+    Returns:
+        Tuple containing:
+        - ranked (List[Tuple[int, float]]): (index into resume_texts, score),
+          best first
+        - method (str): 'SBERT', 'TF-IDF+SBERT' (two-stage) or 'TF-IDF'
+    """
+    method = 'TF-IDF'
+    scores = None
+    if sbert_enabled and sbert_model:
+        known = _stored_embeddings(lookup, len(resume_texts))
+        prefilter = max(prefilter, top_k) if prefilter > 0 else 0
+        try:
+            if 0 < prefilter < len(resume_texts) - len(known):
+                tfidf_scores = relevance_scores_tfidf(jd_text, resume_texts)
+                candidates = top_k_indices(tfidf_scores, prefilter)
+                ranked = rerank_sbert(jd_text, resume_texts, candidates, top_k, sbert_model, stop_words, known)
+                logger.info("Ranked %d resume(s) with TF-IDF, re-ranked top %d with SBERT",
+                            len(resume_texts), len(candidates))
+                return ranked, 'TF-IDF+SBERT'
+            scores = relevance_scores_sbert(jd_text, resume_texts, sbert_model, stop_words, known)
+            method = 'SBERT'
+        except Exception as e:
+            logger.warning("SBERT ranking failed: %s — falling back to TF-IDF", e)
+    if scores is None:
+        scores = relevance_scores_tfidf(jd_text, resume_texts)
+
+    top = top_k_indices(scores, top_k)
+    logger.info("Ranked %d resume(s) with %s, returning top %d", len(resume_texts), method, len(top))
+    return [(int(i), float(scores[i])) for i in top], method
+
+
+def relevance_to_many(resume_text: str, jd_texts: Sequence[str],
+                      sbert_model=None, sbert_enabled: bool = False,
+                      stop_words: set = None) -> Tuple[np.ndarray, str]:
+    """
+    Relevance of one resume to each of several job descriptions.
+
+    Gives the value ats_similarity_score_sbert() gives for each pair, with
+    the resume processed once: TF-IDF via pairwise_relevance_tfidf(), or
+    one SBERT batch (resume chunks, or the whole resume, plus every JD).
+    Falls back to TF-IDF on any SBERT failure.
+
+    Args:
+        resume_text (str): Resume text
+        jd_texts (Sequence[str]): Job description texts
+        sbert_model: SBERT model instance (or None)
+        sbert_enabled (bool): Whether SBERT is available
+        stop_words (set): Set of stopwords for text cleaning
+
+    Returns:
+        Tuple containing:
+        - scores (np.ndarray): One similarity (0-1) per job description
+        - method (str): 'SBERT' or 'TF-IDF'
+    """
+    if sbert_enabled and sbert_model and jd_texts:
+        try:
+            if SBERT_CHUNKING:
+                return chunked_relevance(resume_text, jd_texts, sbert_model, stop_words)[0], 'SBERT'
+            if not clean_text(resume_text, stop_words):
+                return np.zeros(len(jd_texts)), 'SBERT'
+            embeddings = embed_texts([resume_text] + list(jd_texts), sbert_model, stop_words)
+            scores = embeddings[1:] @ embeddings[0]
+            scores[[not clean_text(t, stop_words) for t in jd_texts]] = 0.0
+            return np.clip(scores, 0.0, 1.0), 'SBERT'
+        except Exception as e:
+            logger.warning("SBERT relevance failed: %s — falling back to TF-IDF", e)
+    return pairwise_relevance_tfidf(resume_text, jd_texts), 'TF-IDF'
@@ -9,20 +9,133 @@ Key Responsibilities:
 - Read DOCX files and extract text
 - Handle parsing errors gracefully
 - Return both extracted text and any errors encountered
+- Stream text page by page so a consumer can stop reading early
 
 Pipeline stage: Text Extraction (step 1 of the ATS pipeline)
 """
 
 import io
 import logging
-from typing import Tuple, List, Optional
+from itertools import islice
+from typing import Iterator, Tuple, List, Optional
 import re
 
-from pdfminer.high_level import extract_text as extract_text_from_pdf
+import pdfminer
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
 import docx
 
 logger = logging.getLogger(__name__)
 
+# Identifies the extraction code and library versions. Cached extraction
+# results are keyed on this, so bump the revision whenever
+# safe_extract_text starts producing different output for the same file.
+EXTRACTOR_REVISION = 2
+EXTRACTOR_VERSION = f"{EXTRACTOR_REVISION}:pdfminer-{pdfminer.__version__}"
+
+# Paragraphs per chunk when streaming a DOCX file
+DOCX_CHUNK_PARAGRAPHS = 40
+
+# Section headers that end the section being collected (see find_section)
+SECTION_HEADERS = [
+    'experience', 'education', 'skills', 'technical skills', 'projects',
+    'certifications', 'leadership', 'extracurriculars', 'achievements',
+    'hackathon', 'summary', 'objective', 'work experience', 'professional experience'
+]
+
+# Email pattern: basic email format
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+
+# Phone pattern: flexible phone number format
+# Matches: +1-555-1234, (555) 123-4567, 555.123.4567, etc.
+PHONE_RE = re.compile(r'(\+?\d[\d\s\-()]{6,}\d)')
+
+
+def iter_pdf_pages(data: bytes, max_pages: Optional[int] = None) -> Iterator[str]:
+    """
+    Extract text from a PDF file one page at a time.
+
+    Uses the same layout analysis as pdfminer's extract_text(), so the
+    concatenated pages equal its output exactly (each page ends with a
+    form feed). Only the current page's layout is held in memory, and
+    closing the generator stops parsing.
+
+    Args:
+        data (bytes): Raw bytes of a PDF file
+        max_pages (int, optional): Stop after this many pages
+
+    Yields:
+        str: Text of each page, in order
+    """
+    with io.StringIO() as output:
+        rsrcmgr = PDFResourceManager(caching=True)
+        device = TextConverter(rsrcmgr, output, codec='utf-8', laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(io.BytesIO(data), maxpages=max_pages or 0, caching=True):
+            interpreter.process_page(page)
+            text = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            yield text
+
+
+def count_pdf_pages(data: bytes, limit: Optional[int] = None) -> Optional[int]:
+    """
+    Count the pages of a PDF from its page tree, without layout analysis.
+
+    Args:
+        data (bytes): Raw bytes of a PDF file
+        limit (int, optional): Stop counting once this many pages are seen
+
+    Returns:
+        Optional[int]: Page count (at most limit), or None if unreadable
+    """
+    try:
+        document = PDFDocument(PDFParser(io.BytesIO(data)))
+        return sum(1 for _ in islice(PDFPage.create_pages(document), limit))
+    except Exception as e:
+        logger.debug("Could not count PDF pages: %s", e)
+        return None
+
+
+def iter_docx_chunks(data: bytes, paragraphs_per_chunk: int = DOCX_CHUNK_PARAGRAPHS) -> Iterator[str]:
+    """
+    Extract text from a DOCX file in blocks of paragraphs.
+
+    The concatenated chunks equal extract_text_from_docx_bytes(data).
+
+    Args:
+        data (bytes): Raw bytes of a DOCX file
+        paragraphs_per_chunk (int): Paragraphs per yielded chunk
+
+    Yields:
+        str: Newline-joined paragraphs (every chunk but the last ends with a newline)
+    """
+    paragraphs = docx.Document(io.BytesIO(data)).paragraphs
+    for start in range(0, len(paragraphs), paragraphs_per_chunk):
+        block = [para.text for para in paragraphs[start:start + paragraphs_per_chunk]]
+        last = start + paragraphs_per_chunk >= len(paragraphs)
+        yield '\n'.join(block) + ('' if last else '\n')
+
+
+def _collect_chunks(chunks: Iterator[str], segmenter) -> str:
+    """
+    Join streamed chunks, feeding each to the segmenter (if any) and
+    stopping as soon as it reports that it has everything it needs.
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        if segmenter is not None and segmenter.feed(chunk):
+            segmenter.stopped_early = True
+            chunks.close()
+            break
+    return ''.join(parts)
+
 
 def extract_text_from_docx_bytes(data: bytes) -> str:
     """
@@ -56,7 +169,8 @@ def extract_text_from_docx_bytes(data: bytes) -> str:
         raise
 
 
-def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]:
+def safe_extract_text(file_bytes: bytes, filename: str, segmenter=None,
+                      max_pages: Optional[int] = None) -> Tuple[str, List[str]]:
     """
     Safely extract text from a resume file (PDF or DOCX).
 
@@ -66,9 +180,17 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
     3. Catches and reports any parsing errors
     4. Always returns text (even if empty) and a list of errors
 
+    When a SectionSegmenter (see section_segmenter.py) is passed, the text
+    is fed to it page by page and extraction stops once the segmenter has
+    gathered every required section and contact field; the returned text
+    is then only the pages read. max_pages likewise truncates a PDF to its
+    leading pages (used to meet a request's time budget, see deadline.py).
+
     Args:
         file_bytes (bytes): Raw bytes of the uploaded file
         filename (str): Original filename (used to determine file type)
+        segmenter (SectionSegmenter, optional): Incremental consumer of the text
+        max_pages (int, optional): Read at most this many PDF pages
 
     Returns:
         Tuple[str, List[str]]: (extracted_text, list_of_errors)
@@ -92,8 +214,10 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
         if lower.endswith('.pdf'):
             logger.info("Extracting text from PDF: %s", filename)
             try:
-                # pdfminer expects a file-like object, so wrap bytes in BytesIO
-                text = extract_text_from_pdf(io.BytesIO(file_bytes))
+                text = _collect_chunks(iter_pdf_pages(file_bytes, max_pages), segmenter)
+            except MemoryError:
+                # Let the extraction sandbox report it as a limit breach
+                raise
             except Exception as e:
                 logger.warning("PDF parsing error for %s: %s", filename, e)
                 errors.append(f'PDF parsing error: {str(e)}')
@@ -102,7 +226,9 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
         elif lower.endswith('.docx') or lower.endswith('.doc'):
             logger.info("Extracting text from DOCX: %s", filename)
             try:
-                text = extract_text_from_docx_bytes(file_bytes)
+                text = _collect_chunks(iter_docx_chunks(file_bytes), segmenter)
+            except MemoryError:
+                raise
             except Exception as e:
                 logger.warning("DOCX parsing error for %s: %s", filename, e)
                 errors.append(f'DOCX parsing error: {str(e)}')
@@ -112,6 +238,8 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
             logger.warning("Unsupported file type: %s", filename)
             errors.append('Unsupported file extension')
 
+    except MemoryError:
+        raise
     except Exception as e:
         logger.error("Unexpected parsing error for %s: %s", filename, e)
         errors.append(f'Unexpected parsing error: {str(e)}')
@@ -176,6 +304,27 @@ def preprocess_pdf_text(text: str) -> str:
     return processed
 
 
+def starts_section(line: str, section_names: List[str]) -> bool:
+    """
+    True when a line is the header of the section with the given names.
+    """
+    l = line.strip().lower()
+    return any(l.startswith(name) or name in l for name in section_names)
+
+
+def ends_section(line: str, section_names: List[str]) -> bool:
+    """
+    True when a (non-blank) line ends the section being collected: another
+    known section header, an all-caps header or a colon-ended header.
+    """
+    stripped = line.strip()
+    l_lower = stripped.lower()
+    for header in SECTION_HEADERS:
+        if header != section_names[0].lower() and (l_lower.startswith(header) or l_lower == header):
+            return True
+    return bool(re.match(r'^[A-Z\s]{3,}$', stripped)) or stripped.endswith(':')
+
+
 def find_section(text: str, section_names: List[str]) -> Optional[str]:
     """
     Find and extract a specific section from resume text.
@@ -203,21 +352,10 @@ def find_section(text: str, section_names: List[str]) -> Optional[str]:
     lines = processed_text.splitlines()
     idx = None
 
-    # Common section headers for detecting end of current section
-    all_headers = [
-        'experience', 'education', 'skills', 'technical skills', 'projects',
-        'certifications', 'leadership', 'extracurriculars', 'achievements',
-        'hackathon', 'summary', 'objective', 'work experience', 'professional experience'
-    ]
-
     # Find the line where the section starts
     for i, ln in enumerate(lines):
-        l = ln.strip().lower()
-        for name in section_names:
-            if l.startswith(name) or name in l:
-                idx = i
-                break
-        if idx is not None:
+        if starts_section(ln, section_names):
+            idx = i
             break
 
     # Section not found
@@ -227,8 +365,6 @@ def find_section(text: str, section_names: List[str]) -> Optional[str]:
     # Collect lines after the section header
     collected = []
     for ln in lines[idx + 1:]:
-        l_lower = ln.strip().lower()
-
         # Stop at blank lines (if we already have content)
         if not ln.strip():
             if collected:
@@ -236,18 +372,8 @@ def find_section(text: str, section_names: List[str]) -> Optional[str]:
             else:
                 continue
 
-        # Stop at next section header
-        is_next_section = False
-        for header in all_headers:
-            if header != section_names[0].lower() and (l_lower.startswith(header) or l_lower == header):
-                is_next_section = True
-                break
-
-        if is_next_section:
-            break
-
-        # Stop at all caps headers or colon-ended headers
-        if re.match(r'^[A-Z\s]{3,}$', ln.strip()) or ln.strip().endswith(':'):
+        # Stop at the next section header
+        if ends_section(ln, section_names):
             break
 
         collected.append(ln.strip())
@@ -273,16 +399,9 @@ def extract_contact_info(text: str) -> dict:
         >>> extract_contact_info("Contact: john@example.com, +1-555-1234")
         {'email': 'john@example.com', 'phone': '+1-555-1234'}
     """
-    # Email pattern: basic email format
-    email_re = re.compile(r'[\w\.-]+@[\w\.-]+')
-
-    # Phone pattern: flexible phone number format
-    # Matches: +1-555-1234, (555) 123-4567, 555.123.4567, etc.
-    phone_re = re.compile(r'(\+?\d[\d\s\-()]{6,}\d)')
-
     # Search for patterns
-    email = email_re.search(text)
-    phone = phone_re.search(text)
+    email = EMAIL_RE.search(text)
+    phone = PHONE_RE.search(text)
 
     return {
         'email': email.group(0) if email else None,
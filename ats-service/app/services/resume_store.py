@@ -0,0 +1,135 @@
+"""
+Resume Store
+
+This module keeps the extracted text of resumes the service has already
+parsed, addressed by the caller's resume id (the backend's Resume _id).
+Ranking endpoints use it to score many known resumes against a job
+description without the caller re-sending every resume.
+
+Key Responsibilities:
+- Save resume text under a caller-supplied id (from /parse)
+- Fetch many resumes by id in one query
+- Stream stored resumes in fixed-size blocks
+- Share one SQLite database between all worker processes
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.config import RESUME_STORE_PATH
+from app.utils.sqlite_connections import thread_connection
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps the number of bound parameters per statement
+_MAX_IDS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    resume_id   TEXT PRIMARY KEY,
+    text        TEXT NOT NULL,
+    updated_at  REAL NOT NULL
+);
+"""
+
+
+class ResumeStore:
+    """
+    SQLite store mapping resume id to extracted resume text.
+
+    Uses WAL mode and lazily opened per-thread connections (see
+    app/utils/sqlite_connections.py).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return thread_connection(self._local, self.path)
+
+    def put(self, resume_id: str, text: str) -> None:
+        """
+        Save (or replace) the text stored for a resume id.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO resumes (resume_id, text, updated_at) VALUES (?, ?, ?)',
+                (resume_id, text, time.time())
+            )
+
+    def get_many(self, resume_ids: Sequence[str]) -> Dict[str, str]:
+        """
+        Fetch stored text for many resume ids.
+
+        Returns:
+            Dict[str, str]: resume id -> text, for the ids that exist
+        """
+        conn = self._connect()
+        found: Dict[str, str] = {}
+        ids = list(dict.fromkeys(resume_ids))
+        for start in range(0, len(ids), _MAX_IDS_PER_QUERY):
+            chunk = ids[start:start + _MAX_IDS_PER_QUERY]
+            placeholders = ','.join('?' * len(chunk))
+            for resume_id, text in conn.execute(
+                f'SELECT resume_id, text FROM resumes WHERE resume_id IN ({placeholders})', chunk
+            ):
+                found[resume_id] = text
+        return found
+
+    def iter_blocks(self, block_size: int,
+                    resume_ids: Optional[Sequence[str]] = None) -> Iterator[Tuple[List[str], List[str]]]:
+        """
+        Yield stored resumes as (ids, texts) blocks of at most block_size.
+
+        Args:
+            block_size (int): Maximum resumes per block
+            resume_ids (Sequence[str], optional): Restrict to these ids
+                (unknown ids are skipped); defaults to every stored resume
+        """
+        if resume_ids is not None:
+            ids = list(dict.fromkeys(resume_ids))
+            for start in range(0, len(ids), block_size):
+                found = self.get_many(ids[start:start + block_size])
+                yield list(found.keys()), list(found.values())
+            return
+
+        cursor = self._connect().execute('SELECT resume_id, text FROM resumes ORDER BY resume_id')
+        while True:
+            rows = cursor.fetchmany(block_size)
+            if not rows:
+                break
+            yield [r[0] for r in rows], [r[1] for r in rows]
+
+    def all_ids(self) -> List[str]:
+        """
+        Return every stored resume id.
+        """
+        return [row[0] for row in self._connect().execute('SELECT resume_id FROM resumes')]
+
+
+_store: Optional[ResumeStore] = None
+_store_lock = threading.Lock()
+
+
+def get_resume_store() -> ResumeStore:
+    """
+    Return the process-wide resume store, opening it on first use.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ResumeStore(RESUME_STORE_PATH)
+    return _store
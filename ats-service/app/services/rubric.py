@@ -0,0 +1,290 @@
+"""
+Scoring Rubric
+
+This module loads the heuristic scoring rubric (the keyword lists behind
+every feature and the points each feature is worth) from a versioned
+JSON file, by default app/data/scoring_rubric.json.
+
+The file is compiled once into an immutable Rubric: lists are lowercased
+and de-duplicated into tuples, and every "does the text mention any of
+these" list gets a single alternation regex. The active rubric is swapped
+atomically on reload (see hot_reload.py), so a request that fetched the
+rubric at its start keeps scoring with that version even if a reload
+lands halfway through.
+
+Reloads happen:
+- When the file changes (a daemon thread polls its mtime), per worker
+- On POST /admin/rubric/reload, in the worker that receives the call
+
+An invalid file is rejected and the current rubric stays active.
+
+Besides per-feature points, the weights hold the piecewise curves: the
+experience duration steps (with the date-range fallbacks), the skill
+count tiers, the project mention steps and the parsing error penalty.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from app.config import RUBRIC_PATH, RUBRIC_POLL_SECONDS
+from app.services.hot_reload import HotReloadable
+
+logger = logging.getLogger(__name__)
+
+# Degree levels, stored as integers so feature records stay compact
+DEGREE_NONE = 0
+DEGREE_DIPLOMA = 1
+DEGREE_BACHELOR = 2
+DEGREE_MASTER = 3
+DEGREE_PHD = 4
+
+# Degree list per level, checked highest level first
+_DEGREE_MATCHERS = (
+    (DEGREE_PHD, 'phd_degrees', 'phd'),
+    (DEGREE_MASTER, 'master_degrees', 'master'),
+    (DEGREE_BACHELOR, 'bachelor_degrees', 'bachelor'),
+    (DEGREE_DIPLOMA, 'diploma_degrees', 'diploma'),
+)
+
+MATCHER_NAMES = (
+    'phd_degrees', 'master_degrees', 'bachelor_degrees', 'diploma_degrees',
+    'relevant_fields', 'top_schools', 'action_verbs', 'seniority_terms',
+    'top_companies', 'project_indicators', 'tech_indicators', 'link_indicators',
+    'portfolio_indicators',
+)
+
+# Every weight the scoring code reads, by section
+WEIGHT_NAMES: Dict[str, Tuple[str, ...]] = {
+    'education': ('base', 'relevant_field', 'top_school'),
+    'experience': ('action_verb', 'action_verb_max', 'metric', 'metric_max',
+                   'seniority', 'seniority_max', 'top_company'),
+    'projects': ('base', 'tech', 'tech_max', 'impact', 'impact_max', 'link', 'link_max'),
+    'contact': ('email', 'phone', 'linkedin', 'github', 'portfolio'),
+    'skills': ('above',),
+    'parsing': ('per_error', 'max'),
+}
+
+# Points for the experience date-range fallbacks, used when no duration
+# is stated (weights.experience.duration, next to the month steps)
+DURATION_FALLBACK_NAMES = ('multiple_years', 'year_and_present', 'single_year', 'long_text')
+
+# (minimum, points) pairs, highest minimum first: the first step reached wins
+Steps = Tuple[Tuple[float, float], ...]
+
+
+class SkillTier(NamedTuple):
+    """
+    Skill counts up to up_to score base + (count - start) * per_skill.
+    """
+    up_to: float
+    base: float
+    start: float
+    per_skill: float
+
+
+class PhraseTable:
+    """
+    A compiled keyword list, matched as substrings of lowercased text.
+    """
+
+    __slots__ = ('phrases', '_any_re')
+
+    def __init__(self, phrases):
+        self.phrases: Tuple[str, ...] = tuple(dict.fromkeys(p.lower() for p in phrases))
+        self._any_re = re.compile('|'.join(re.escape(p) for p in self.phrases))
+
+    def any_in(self, text: str) -> bool:
+        """
+        True if any phrase occurs in text.
+        """
+        return self._any_re.search(text) is not None
+
+    def count_in(self, text: str) -> int:
+        """
+        Number of distinct phrases that occur in text.
+        """
+        return sum(1 for phrase in self.phrases if phrase in text)
+
+
+class Rubric:
+    """
+    One compiled, immutable rubric version.
+    """
+
+    def __init__(self, version: str, matchers: Dict[str, PhraseTable],
+                 degree_points: Dict[int, float], weights: Dict[str, Dict[str, float]],
+                 duration_steps: Steps, mention_steps: Steps,
+                 skill_tiers: Tuple[SkillTier, ...], source: str):
+        self.version = version
+        self.matchers = matchers
+        self.degree_points = degree_points
+        self.weights = weights
+        self.duration_steps = duration_steps
+        self.mention_steps = mention_steps
+        self.skill_tiers = skill_tiers
+        self.source = source
+        self.degree_levels = tuple((level, matchers[name]) for level, name, _ in _DEGREE_MATCHERS)
+        # Identifies the keyword lists alone: rubric versions that only
+        # change weights share it, so their feature records stay comparable
+        self.matchers_digest = hashlib.sha256(json.dumps(
+            {name: table.phrases for name, table in sorted(matchers.items())}
+        ).encode('utf-8')).hexdigest()[:16]
+
+    def degree_level(self, text: str) -> int:
+        """
+        Highest degree level mentioned in (lowercased) text.
+        """
+        for level, table in self.degree_levels:
+            if table.any_in(text):
+                return level
+        return DEGREE_NONE
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'source': self.source,
+            'matchers': {name: len(table.phrases) for name, table in self.matchers.items()},
+            'matchersDigest': self.matchers_digest,
+        }
+
+
+def _number(value: Any, where: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{where} must be a number, got {value!r}")
+    return float(value)
+
+
+def _object(value: Any, where: str) -> Dict[str, Any]:
+    # Missing means empty; the fields inside then report what is missing
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"{where} must be an object, got {type(value).__name__}")
+    return value
+
+
+def _list(value: Any, where: str) -> List[Any]:
+    if not isinstance(value, list) or not value:
+        raise ValueError(f"{where} must be a non-empty list")
+    return value
+
+
+def _steps(value: Any, where: str) -> Steps:
+    # [{"min": m, "points": p}, ...] in any order
+    steps = []
+    for index, step in enumerate(_list(value, where)):
+        step = _object(step, f"{where}[{index}]")
+        steps.append((_number(step.get('min'), f"{where}[{index}].min"),
+                      _number(step.get('points'), f"{where}[{index}].points")))
+    return tuple(sorted(steps, reverse=True))
+
+
+def _skill_tiers(value: Any, where: str) -> Tuple[SkillTier, ...]:
+    tiers = []
+    for index, tier in enumerate(_list(value, where)):
+        tier = _object(tier, f"{where}[{index}]")
+        tiers.append(SkillTier(*(_number(tier.get(key), f"{where}[{index}].{key}")
+                                 for key in ('up_to', 'base', 'from', 'per_skill'))))
+    tiers.sort()
+    if len({tier.up_to for tier in tiers}) != len(tiers):
+        raise ValueError(f"{where} must not repeat an up_to count")
+    return tuple(tiers)
+
+
+def compile_rubric(data: Dict[str, Any], source: str = '<memory>') -> Rubric:
+    """
+    Validate and compile rubric data (the parsed JSON file).
+
+    Raises:
+        ValueError: If a field is missing or has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Rubric must be a JSON object")
+    version = data.get('version')
+    if not isinstance(version, str) or not version:
+        raise ValueError("Rubric 'version' must be a non-empty string")
+
+    raw_matchers = _object(data.get('matchers'), "Rubric 'matchers'")
+    matchers = {}
+    for name in MATCHER_NAMES:
+        phrases = raw_matchers.get(name)
+        if not isinstance(phrases, list) or not phrases or \
+                not all(isinstance(p, str) and p for p in phrases):
+            raise ValueError(f"Rubric matcher '{name}' must be a non-empty list of strings")
+        matchers[name] = PhraseTable(phrases)
+
+    raw_weights = _object(data.get('weights'), "Rubric 'weights'")
+    weights = {}
+    for section, names in WEIGHT_NAMES.items():
+        values = _object(raw_weights.get(section), f"weights.{section}")
+        weights[section] = {name: _number(values.get(name), f"weights.{section}.{name}")
+                            for name in names}
+
+    raw_degree = _object(_object(raw_weights.get('education'), 'weights.education').get('degree'),
+                         'weights.education.degree')
+    degree_points = {DEGREE_NONE: 0.0}
+    for level, _, key in _DEGREE_MATCHERS:
+        degree_points[level] = _number(raw_degree.get(key), f"weights.education.degree.{key}")
+
+    raw_duration = _object(_object(raw_weights.get('experience'), 'weights.experience').get('duration'),
+                           'weights.experience.duration')
+    weights['duration'] = {name: _number(raw_duration.get(name), f"weights.experience.duration.{name}")
+                           for name in DURATION_FALLBACK_NAMES}
+    duration_steps = _steps(raw_duration.get('months'), 'weights.experience.duration.months')
+    mention_steps = _steps(_object(raw_weights.get('projects'), 'weights.projects').get('mentions'),
+                           'weights.projects.mentions')
+    skill_tiers = _skill_tiers(_object(raw_weights.get('skills'), 'weights.skills').get('tiers'),
+                               'weights.skills.tiers')
+
+    return Rubric(version, matchers, degree_points, weights, duration_steps, mention_steps,
+                  skill_tiers, source)
+
+
+def load_rubric(path: str = RUBRIC_PATH) -> Rubric:
+    """
+    Read and compile a rubric file.
+
+    Raises:
+        ValueError: If the file is not valid JSON or not a valid rubric
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding='utf-8') as fh:
+        try:
+            data = json.load(fh)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Rubric file is not valid JSON: {e}") from e
+    return compile_rubric(data, source=path)
+
+
+_rubric = HotReloadable('scoring rubric', RUBRIC_PATH, load_rubric)
+
+
+def get_rubric() -> Rubric:
+    """
+    Return the active rubric, loading it on first use.
+
+    Fetch it once per request and pass it down, so the whole request is
+    scored with one version.
+    """
+    return _rubric.get()
+
+
+def reload_rubric(path: str = RUBRIC_PATH) -> Rubric:
+    """
+    Recompile the rubric file and make it active.
+
+    Raises:
+        ValueError / OSError: If the file is invalid; the current rubric stays
+    """
+    return _rubric.reload(path)
+
+
+def start_rubric_watcher(interval: float = RUBRIC_POLL_SECONDS) -> None:
+    """
+    Load the rubric and start the background thread that reloads it when
+    the file changes (once per process; no-op if interval <= 0).
+    """
+    _rubric.start_watcher(interval)
@@ -29,6 +29,10 @@ SCORING BREAKDOWN (v4 - Strict & Equal):
    |------------|-----|----------------------------------------|
    | MAX TOTAL  | 50  |                                        |
 
+   The keyword lists, per-feature points, duration and skill count curves
+   and the parsing penalty come from the scoring rubric file (see
+   rubric.py), which can be reloaded without a restart.
+
 2. RELEVANCE SCORE (0-50):
    - TF-IDF or SBERT similarity to job description
    - Low relevance (<0.3) penalized more harshly
@@ -51,7 +55,12 @@ import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
-from app.utils.text_cleaner import clean_text, detect_formatting_risks
+from app.utils.text_cleaner import clean_text, detect_formatting_risks, tfidf_terms
+from app.services.feature_extractor import FEATURE_VERSION, extract_features
+from app.services.rubric import Rubric, SkillTier, Steps, get_rubric
+from app.services.ranking import tfidf_pair_similarity
+from app.services.chunked_encoding import chunked_relevance
+from app.config import SBERT_CHUNKING
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +75,10 @@ def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
     2. Calculating cosine similarity between vectors
     3. Returning a score between 0 (no match) and 1 (perfect match)
     
-    This is the fallback method when SBERT is not available.
+    This is the fallback method when SBERT is not available. A single pair
+    is computed with plain Counter arithmetic (tfidf_pair_similarity),
+    which gives the same values as compute_relevance_tfidf_sklearn()
+    without the vectorizer's setup cost.
     
     Args:
         resume_text (str): Full resume text
@@ -81,8 +93,29 @@ def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
         0.65  # High similarity due to matching keywords
     """
     try:
-        # Create TF-IDF vectorizer with English stopword removal
-        vect = TfidfVectorizer(stop_words='english')
+        return tfidf_pair_similarity(resume_text, job_text)
+    except Exception:
+        return 0.0
+
+
+def compute_relevance_tfidf_sklearn(resume_text: str, job_text: str) -> float:
+    """
+    compute_relevance_tfidf() through TfidfVectorizer and cosine_similarity.
+    
+    The reference the lightweight pairwise path is tested against (see
+    tests/test_pairwise_tfidf.py and scripts/benchmark_pairwise_tfidf.py).
+    
+    Args:
+        resume_text (str): Full resume text
+        job_text (str): Job description text
+    
+    Returns:
+        float: Similarity score between 0.0 and 1.0
+    """
+    try:
+        # Create TF-IDF vectorizer over the shared tokenizer (English
+        # stopwords removed, tokens cached per text)
+        vect = TfidfVectorizer(analyzer=tfidf_terms)
         
         # Fit and transform both texts
         # Order: [job_description, resume]
@@ -126,18 +159,40 @@ def ats_similarity_score_sbert(resume_text: str, jd_text: str,
     Returns:
         float: Similarity score between 0.0 and 1.0
     """
+    return similarity_with_sections(resume_text, jd_text, sbert_model, sbert_enabled, stop_words)[0]
+
+
+def similarity_with_sections(resume_text: str, jd_text: str,
+                             sbert_model=None, sbert_enabled: bool = False,
+                             stop_words: set = None) -> Tuple[float, Optional[Dict[str, float]]]:
+    """
+    ats_similarity_score_sbert() plus the relevance of each resume section.
+
+    With SBERT and ATS_SBERT_CHUNKING enabled (the default), the resume is
+    encoded as section chunks and pooled (see chunked_encoding.py), so
+    text beyond the model's input length still counts; otherwise the
+    cleaned resume is encoded as one input.
+
+    Returns:
+        Tuple[float, Optional[Dict[str, float]]]: Similarity (0-1) and the
+        per-section similarities (None for TF-IDF and whole-text SBERT)
+    """
     # If SBERT is not enabled, use TF-IDF fallback
     if not sbert_enabled or not sbert_model:
-        return compute_relevance_tfidf(resume_text, jd_text)
+        return compute_relevance_tfidf(resume_text, jd_text), None
     
     try:
+        if SBERT_CHUNKING:
+            scores, sections = chunked_relevance(resume_text, [jd_text], sbert_model, stop_words)
+            return float(scores[0]), sections[0]
+
         # Clean inputs (remove stopwords, special chars, etc.)
         resume_clean = clean_text(resume_text, stop_words)
         jd_clean = clean_text(jd_text, stop_words)
         
         # Ensure both texts have content
         if not resume_clean or not jd_clean:
-            return 0.0
+            return 0.0, None
         
         # Generate embeddings (numerical representations of text meaning)
         resume_embedding = sbert_model.encode([resume_clean])
@@ -149,12 +204,12 @@ def ats_similarity_score_sbert(resume_text: str, jd_text: str,
         # Ensure similarity is between 0 and 1
         similarity = max(0.0, min(1.0, float(similarity)))
         
-        return similarity
+        return similarity, None
     
     except Exception as e:
         logger.warning("SBERT similarity calculation failed: %s — falling back to TF-IDF", e)
         # Fallback to TF-IDF
-        return compute_relevance_tfidf(resume_text, jd_text)
+        return compute_relevance_tfidf(resume_text, jd_text), None
 
 
 def compute_heuristics(text: str, parsed_sections: dict, 
@@ -177,6 +232,9 @@ def compute_heuristics(text: str, parsed_sections: dict,
     |------------|-----|----------------------------------------|
     | TOTAL      | 50  |                                        |
     
+    This is extract_features() followed by score_features(); use those
+    directly when the feature record needs to be kept.
+    
     Args:
         text (str): Full resume text
         parsed_sections (dict): Dictionary of extracted sections
@@ -188,11 +246,38 @@ def compute_heuristics(text: str, parsed_sections: dict,
         - feedback (List[str]): List of feedback messages
         - breakdown (Dict[str, float]): Score breakdown by component
     """
-    from app.services.skill_extractor import extract_skills_from_resume
-    from app.services.resume_parser import extract_contact_info
-
     logger.info("Computing heuristic score — sections available: %s", list(parsed_sections.keys()))
+    rubric = get_rubric()
+    features = extract_features(text, parsed_sections, parsing_errors, rubric)
+    return score_features(features, rubric)
+
+
+def score_features(features: Dict[str, Any],
+                   rubric: Optional[Rubric] = None) -> Tuple[float, List[str], Dict[str, float]]:
+    """
+    Compute the heuristic score from a feature record (no text processing).
+    
+    Args:
+        features (Dict[str, Any]): Record produced by extract_features()
+        rubric (Rubric, optional): Weights to score with (default: the active rubric)
+    
+    Returns:
+        Tuple containing:
+        - score (float): Heuristic score (0-50)
+        - feedback (List[str]): List of feedback messages
+        - breakdown (Dict[str, float]): Score breakdown by component
     
+    Raises:
+        ValueError: If the record was produced by another FEATURE_VERSION
+    """
+    if features.get('version') != FEATURE_VERSION:
+        raise ValueError(
+            f"Unsupported feature record version {features.get('version')!r} "
+            f"(expected {FEATURE_VERSION}) — re-parse the resume"
+        )
+    
+    rubric = rubric or get_rubric()
+    weights = rubric.weights
     score = 0.0
     feedback = []
     breakdown = {
@@ -204,13 +289,10 @@ def compute_heuristics(text: str, parsed_sections: dict,
         'parsingPenalty': 0
     }
     
-    text_lower = text.lower()
-    
     # ============================================
     # EDUCATION (0-10 points) - Quality based
     # ============================================
-    education_text = parsed_sections.get('education', '') or ''
-    edu_score = _score_education(education_text, text_lower)
+    edu_score = _score_education(features, weights['education'], rubric.degree_points)
     breakdown['education'] = round(edu_score, 1)
     score += edu_score
     
@@ -223,8 +305,8 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # EXPERIENCE (0-10 points) - Quality based
     # ============================================
-    experience_text = parsed_sections.get('experience', '') or ''
-    exp_score = _score_experience(experience_text, text_lower)
+    exp_score = _score_experience(features, weights['experience'], weights['duration'],
+                                  rubric.duration_steps)
     breakdown['experience'] = round(exp_score, 1)
     score += exp_score
     
@@ -237,9 +319,8 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # SKILLS (0-10 points) - Quality based
     # ============================================
-    all_skills = extract_skills_from_resume(text)
-    skill_count = len(all_skills)
-    skills_score = _score_skills(skill_count, all_skills)
+    skill_count = features['skill_count']
+    skills_score = _score_skills(skill_count, rubric.skill_tiers, weights['skills']['above'])
     breakdown['skills'] = round(skills_score, 1)
     score += skills_score
     
@@ -249,8 +330,7 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # PROJECTS (0-10 points) - Quality based
     # ============================================
-    projects_text = parsed_sections.get('projects', '') or ''
-    proj_score = _score_projects(projects_text, text_lower)
+    proj_score = _score_projects(features, weights['projects'], rubric.mention_steps)
     breakdown['projects'] = round(proj_score, 1)
     score += proj_score
     
@@ -263,8 +343,7 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # CONTACT (0-10 points) - Completeness based
     # ============================================
-    contact = extract_contact_info(text)
-    contact_score = _score_contact(contact, text_lower)
+    contact_score = _score_contact(features, weights['contact'])
     breakdown['contact'] = round(contact_score, 1)
     score += contact_score
     
@@ -272,10 +351,11 @@ def compute_heuristics(text: str, parsed_sections: dict,
         feedback.append('Contact info incomplete - add email, phone, and LinkedIn/GitHub')
     
     # ============================================
-    # PARSING PENALTY (-10 points max)
+    # PARSING PENALTY (-10 points max by default)
     # ============================================
-    if parsing_errors:
-        penalty = min(10, len(parsing_errors) * 5)
+    parsing_errors = features.get('parsing_errors') or []
+    if features['parsing_error_count']:
+        penalty = min(weights['parsing']['max'], features['parsing_error_count'] * weights['parsing']['per_error'])
         breakdown['parsingPenalty'] = -penalty
         score -= penalty
         feedback.append('Parsing issues detected: ' + '; '.join(parsing_errors[:3]))
@@ -286,7 +366,8 @@ def compute_heuristics(text: str, parsed_sections: dict,
     return score, feedback, breakdown
 
 
-def _score_education(education_text: str, full_text: str) -> float:
+def _score_education(features: Dict[str, Any], weights: Dict[str, float],
+                     degree_points: Dict[int, float]) -> float:
     """
     Score education section based on quality (0-10).
     
@@ -298,155 +379,101 @@ def _score_education(education_text: str, full_text: str) -> float:
     - 9: Degree + field + recognized institution
     - 10: Graduate degree or top institution
     """
-    if not education_text and 'education' not in full_text:
+    if not features['education_present']:
         return 0.0
     
-    text = (education_text + ' ' + full_text).lower()
-    score = 2.0  # Base for having section
+    score = weights['base']  # Base for having section
     
     # Degree types (higher = better)
-    if any(deg in text for deg in ['ph.d', 'phd', 'doctorate', 'doctoral']):
-        score += 5.0
-    elif any(deg in text for deg in ['master', 'm.s.', 'm.sc', 'mba', 'm.tech', 'mtech']):
-        score += 4.0
-    elif any(deg in text for deg in ['bachelor', 'b.s.', 'b.sc', 'b.tech', 'btech', 'b.e.', 'undergraduate']):
-        score += 3.0
-    elif any(deg in text for deg in ['diploma', 'associate', 'certificate']):
-        score += 1.5
+    score += degree_points[features['degree_level']]
     
     # Relevant field
-    relevant_fields = ['computer science', 'software', 'engineering', 'information technology',
-                       'data science', 'artificial intelligence', 'machine learning', 'mathematics',
-                       'electrical', 'electronics', 'cs', 'cse', 'it', 'ece']
-    if any(field in text for field in relevant_fields):
-        score += 1.5
-    
-    # Top institutions (partial list - add more as needed)
-    top_schools = ['mit', 'stanford', 'iit', 'nit', 'iiit', 'bits', 'harvard', 'berkeley',
-                   'carnegie mellon', 'georgia tech', 'caltech', 'oxford', 'cambridge']
-    if any(school in text for school in top_schools):
-        score += 1.0
+    if features['relevant_field']:
+        score += weights['relevant_field']
+    
+    # Top institutions
+    if features['top_school']:
+        score += weights['top_school']
     
     return min(10.0, score)
 
 
-def _score_experience(experience_text: str, full_text: str) -> float:
+def _score_experience(features: Dict[str, Any], weights: Dict[str, float],
+                      duration_weights: Dict[str, float], duration_steps: Steps) -> float:
     """
     Score experience section based on quality (0-10).
     
-    Scoring criteria:
+    Scoring criteria (default rubric points):
     - Experience duration: 6+ months = up to 4 points
     - Action verbs: Led, developed, implemented, etc. = up to 2.5 points
     - Quantified achievements: %, $, numbers = up to 2 points
     - Seniority indicators: Senior, Lead, Manager = up to 1 point
     - Company recognition = up to 0.5 points
     """
-    if not experience_text and 'experience' not in full_text:
+    if not features['experience_present']:
         return 0.0
     
-    text = (experience_text + ' ' + full_text).lower()
     score = 0.0
     
-    import re
-    
-    # Experience Duration (up to 4 points) - KEY FACTOR
-    # Look for patterns like "2 years", "6 months", "1.5 years", etc.
-    duration_patterns = [
-        r'(\d+\.?\d*)\s*(?:years?|yrs?)',
-        r'(\d+\.?\d*)\s*(?:months?|mos?)',
-    ]
-    
-    total_months = 0
-    for pattern in duration_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            val = float(match)
-            if 'year' in pattern or 'yr' in pattern:
-                total_months += val * 12
-            else:
-                total_months += val
-    
-    # Duration scoring
-    # Duration scoring (Max 4.0 points)
+    # Duration scoring (Max 4.0 points) - KEY FACTOR
+    total_months = features['duration_months']
     found_duration = False
-    if total_months >= 6:
-        score += 4.0
-        found_duration = True
-    elif total_months >= 3:
-        score += 3.0
-        found_duration = True
-    elif total_months >= 1:
-        score += 2.0
-        found_duration = True
+    for min_months, points in duration_steps:
+        if total_months >= min_months:
+            score += points
+            found_duration = True
+            break
     
     # Fallback: Date range detection if no explicit "X years" found
     if not found_duration:
-        # Check for years (2010-2029)
-        years = re.findall(r'20[12]\d', text)
-        distinct_years = len(set(years))
+        distinct_years = features['distinct_years']
         
         if distinct_years >= 2:
-            score += 4.0  # Spans multiple years -> likely >6 months
-        elif distinct_years == 1 and ('present' in text or 'current' in text):
-            score += 4.0  # Year + Present -> likely >6 months
+            score += duration_weights['multiple_years']  # Spans multiple years -> likely >6 months
+        elif distinct_years == 1 and features['mentions_present']:
+            score += duration_weights['year_and_present']  # Year + Present -> likely >6 months
         elif distinct_years == 1:
-            score += 2.5  # At least mentions a year
-        elif len(text) > 200:
-            score += 1.0  # Decent length description as fallback
+            score += duration_weights['single_year']  # At least mentions a year
+        elif features['long_experience_text']:
+            score += duration_weights['long_text']  # Decent length description as fallback
     
     # Action verbs (up to 2.5 points)
-    action_verbs = [
-        'led', 'developed', 'implemented', 'designed', 'architected', 'built',
-        'managed', 'created', 'optimized', 'improved', 'reduced', 'increased',
-        'delivered', 'launched', 'mentored', 'scaled', 'automated', 'integrated',
-        'deployed', 'spearheaded', 'established', 'transformed', 'pioneered'
-    ]
-    action_count = sum(1 for v in action_verbs if v in text)
-    score += min(2.5, action_count * 0.35)
+    score += min(weights['action_verb_max'], features['action_verb_count'] * weights['action_verb'])
     
     # Quantified achievements (up to 2 points)
-    metrics = re.findall(r'\d+%|\$\d+[kmb]?|\d+\s*(?:users|customers|clients|projects|applications|team|engineers|developers)', text)
-    score += min(2.0, len(metrics) * 0.4)
+    score += min(weights['metric_max'], features['metric_count'] * weights['metric'])
     
     # Seniority (up to 1 point)
-    seniority = ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head', 'vp', 'cto', 'ceo']
-    seniority_count = sum(1 for s in seniority if s in text)
-    score += min(1.0, seniority_count * 0.5)
+    score += min(weights['seniority_max'], features['seniority_count'] * weights['seniority'])
     
     # Recognized companies (up to 0.5 points)
-    top_companies = ['google', 'amazon', 'microsoft', 'meta', 'facebook', 'apple', 'netflix',
-                     'uber', 'airbnb', 'stripe', 'linkedin', 'twitter', 'salesforce', 'adobe']
-    if any(company in text for company in top_companies):
-        score += 0.5
+    if features['top_company']:
+        score += weights['top_company']
     
     return min(10.0, round(score, 1))
 
 
-def _score_skills(skill_count: int, skills_list: List) -> float:
+def _score_skills(skill_count: int, tiers: Tuple[SkillTier, ...], above: float) -> float:
     """
-    Score skills based on quantity and diversity (0-10).
+    Score skills based on quantity (0-10).
     
-    Scoring:
+    Scoring (default rubric tiers):
     - 0: 0.0
     - 1-5 skills: 2.0 + (count * 0.2)
     - 6-15 skills: 3.0 + (count - 5) * 0.4
     - 16-24 skills: 7.0 + (count - 15) * 0.3
-    - 25+ skills: 10.0
+    - 25+ skills: 10.0 (above every tier)
     """
     if skill_count == 0:
         return 0.0
     
-    if skill_count <= 5:
-        return round(2.0 + (skill_count * 0.2), 1)
-    elif skill_count <= 15:
-        return round(3.0 + ((skill_count - 5) * 0.4), 1)
-    elif skill_count < 25:
-        return round(7.0 + ((skill_count - 15) * 0.3), 1)
-    else:
-        return 10.0
+    for tier in tiers:
+        if skill_count <= tier.up_to:
+            return round(tier.base + ((skill_count - tier.start) * tier.per_skill), 1)
+    return above
 
 
-def _score_projects(projects_text: str, full_text: str) -> float:
+def _score_projects(features: Dict[str, Any], weights: Dict[str, float], mention_steps: Steps) -> float:
     """
     Score projects section based on quality (0-10).
     
@@ -456,47 +483,31 @@ def _score_projects(projects_text: str, full_text: str) -> float:
     - Impact/results described
     - Links to GitHub/live demos
     """
-    # Check for projects section or project-like content
-    if not projects_text:
-        # Try to find projects mentioned elsewhere
-        project_indicators = ['github.com', 'project:', 'built a', 'created a', 'developed a', 'hackathon']
-        if not any(ind in full_text for ind in project_indicators):
-            return 0.0
-        text = full_text
-    else:
-        text = projects_text + ' ' + full_text
+    if not features['projects_present']:
+        return 0.0
     
-    text_lower = text.lower()
-    score = 2.0  # Base for having projects
+    score = weights['base']  # Base for having projects
     
     # Technical stack mentioned (up to 3 points)
-    tech_indicators = ['react', 'node', 'python', 'javascript', 'typescript', 'java', 'golang', 'rust',
-                       'aws', 'docker', 'kubernetes', 'mongodb', 'postgresql', 'api', 'machine learning',
-                       'tensorflow', 'pytorch', 'database', 'microservices']
-    tech_count = sum(1 for t in tech_indicators if t in text_lower)
-    score += min(3.0, tech_count * 0.5)
+    score += min(weights['tech_max'], features['tech_count'] * weights['tech'])
     
     # Project impact/metrics (up to 2 points)
-    import re
-    impact_patterns = re.findall(r'\d+\s*(?:users|downloads|stars|forks|views)|deployed|production|live', text_lower)
-    score += min(2.0, len(impact_patterns) * 0.5)
+    score += min(weights['impact_max'], features['impact_count'] * weights['impact'])
     
     # Links to work (up to 2 points)
-    links = ['github.com', 'gitlab.com', 'bitbucket', 'herokuapp', 'vercel', 'netlify', 'http://', 'https://']
-    link_count = sum(1 for l in links if l in text_lower)
-    score += min(2.0, link_count * 0.7)
+    score += min(weights['link_max'], features['link_count'] * weights['link'])
     
     # Multiple projects mentioned (up to 1 point)
-    project_words = text_lower.count('project')
-    if project_words >= 3:
-        score += 1.0
-    elif project_words >= 2:
-        score += 0.5
+    project_words = features['project_mentions']
+    for min_mentions, points in mention_steps:
+        if project_words >= min_mentions:
+            score += points
+            break
     
     return min(10.0, score)
 
 
-def _score_contact(contact: dict, full_text: str) -> float:
+def _score_contact(features: Dict[str, Any], weights: Dict[str, float]) -> float:
     """
     Score contact information based on completeness (0-10).
     
@@ -510,25 +521,24 @@ def _score_contact(contact: dict, full_text: str) -> float:
     score = 0.0
     
     # Email (3 points)
-    if contact.get('email'):
-        score += 3.0
+    if features['has_email']:
+        score += weights['email']
     
     # Phone (2 points)
-    if contact.get('phone'):
-        score += 2.0
+    if features['has_phone']:
+        score += weights['phone']
     
     # LinkedIn (2 points)
-    if 'linkedin.com' in full_text or 'linkedin' in full_text:
-        score += 2.0
+    if features['has_linkedin']:
+        score += weights['linkedin']
     
     # GitHub (2 points)
-    if 'github.com' in full_text or 'github' in full_text:
-        score += 2.0
+    if features['has_github']:
+        score += weights['github']
     
     # Portfolio/Website (1 point)
-    portfolio_indicators = ['portfolio', 'website', '.com/', '.io/', 'vercel.app', 'netlify.app']
-    if any(ind in full_text for ind in portfolio_indicators):
-        score += 1.0
+    if features['has_portfolio']:
+        score += weights['portfolio']
     
     return min(10.0, score)
 
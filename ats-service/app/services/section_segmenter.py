@@ -0,0 +1,175 @@
+"""
+Section Segmenter
+
+This module finds resume sections and contact details incrementally, as
+the text arrives page by page from the extractor, instead of waiting for
+the whole document.
+
+It gives exactly the answers find_section() and extract_contact_info()
+give on the text fed so far: only complete lines are segmented (header
+splitting in preprocess_pdf_text never crosses a newline), and a contact
+match is only accepted once the text after it shows it cannot grow.
+
+Once every required section has been closed and both email and phone
+are known, the segmenter reports that it is complete, so the extractor
+can skip the remaining pages (see safe_extract_text).
+
+Pipeline stage: Text Extraction / Section Parsing (steps 1-3 of the ATS pipeline)
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from app.services.resume_parser import (
+    EMAIL_RE,
+    PHONE_RE,
+    ends_section,
+    preprocess_pdf_text,
+    starts_section,
+)
+
+# Sections /parse extracts, with the header names find_section looks for
+REQUIRED_SECTIONS: Dict[str, List[str]] = {
+    'skills': ['skills', 'technical skills', 'skills & technologies'],
+    'education': ['education', 'academic', 'qualifications'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment'],
+}
+
+
+
+class Segments(NamedTuple):
+    """
+    What a finished segmenter found: the REQUIRED_SECTIONS as
+    find_section() returns them, and extract_contact_info()'s contact.
+    """
+    sections: Dict[str, Optional[str]]
+    contact: dict
+
+
+# Characters that could still extend a match at the end of the text
+_EMAIL_STOP_RE = re.compile(r'[^\w\.-]')
+_PHONE_STOP_RE = re.compile(r'[^\d\s\-()]')
+
+
+class _SectionState:
+    """
+    find_section() for one section, run one line at a time.
+    """
+
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.started = False
+        self.done = False
+        self.collected: List[str] = []
+
+    def feed_line(self, ln: str) -> None:
+        if self.done:
+            return
+        if not self.started:
+            self.started = starts_section(ln, self.names)
+            return
+        if not ln.strip():
+            self.done = bool(self.collected)
+            return
+        if ends_section(ln, self.names):
+            self.done = True
+            return
+        self.collected.append(ln.strip())
+
+    @property
+    def text(self) -> Optional[str]:
+        return '\n'.join(self.collected).strip() if self.collected else None
+
+
+class SectionSegmenter:
+    """
+    Incremental section and contact extraction over streamed text chunks.
+
+    Example:
+        >>> segmenter = SectionSegmenter()
+        >>> for page in iter_pdf_pages(data):
+        ...     if segmenter.feed(page):
+        ...         break
+        >>> segmenter.close()
+        >>> segmenter.sections['skills']
+    """
+
+    def __init__(self, sections: Dict[str, List[str]] = REQUIRED_SECTIONS):
+        self._states = {key: _SectionState(names) for key, names in sections.items()}
+        self._text = ''
+        self._pending = ''
+        self._email = None
+        self._phone = None
+        self.chunks_read = 0
+        self.stopped_early = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of text.
+
+        Returns:
+            bool: True once every required feature has been gathered
+        """
+        self.chunks_read += 1
+        self._text += chunk
+        self._pending += chunk
+        cut = self._pending.rfind('\n') + 1
+        if cut:
+            self._feed_lines(self._pending[:cut])
+            self._pending = self._pending[cut:]
+        self._update_contact(final=False)
+        return self.complete
+
+    def close(self) -> None:
+        """
+        Flush the last, unterminated line (the document has ended).
+        """
+        if self._pending:
+            self._feed_lines(self._pending)
+            self._pending = ''
+        self._update_contact(final=True)
+
+    def _feed_lines(self, text: str) -> None:
+        for ln in preprocess_pdf_text(text).splitlines():
+            for state in self._states.values():
+                state.feed_line(ln)
+
+    def _update_contact(self, final: bool) -> None:
+        if self._email is None:
+            self._email = self._settled_match(EMAIL_RE, _EMAIL_STOP_RE, final)
+        if self._phone is None:
+            self._phone = self._settled_match(PHONE_RE, _PHONE_STOP_RE, final)
+
+    def _settled_match(self, pattern, stop_re, final: bool) -> Optional[str]:
+        # A match that runs into the end of the text may still grow (or a
+        # longer one may start earlier) when the next chunk arrives
+        match = pattern.search(self._text)
+        if match is None:
+            return None
+        if final or stop_re.search(self._text, match.end()):
+            return match.group(0)
+        return None
+
+    @property
+    def complete(self) -> bool:
+        return (all(state.done for state in self._states.values())
+                and self._email is not None and self._phone is not None)
+
+    @property
+    def sections(self) -> Dict[str, Optional[str]]:
+        return {key: state.text for key, state in self._states.items()}
+
+    @property
+    def contact(self) -> dict:
+        return {'email': self._email, 'phone': self._phone}
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def segments(self) -> Segments:
+        """
+        The sections and contact found, for the text fed so far; valid
+        once the segmenter is complete or has been closed.
+        """
+        return Segments(self.sections, self.contact)
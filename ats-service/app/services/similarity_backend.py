@@ -0,0 +1,193 @@
+"""
+Similarity Backend
+
+This module holds the model behind relevance scoring. The service starts
+on TF-IDF and accepts traffic at once, while a daemon thread imports
+sentence-transformers, loads the SentenceTransformer and warms it with a
+few encodes (so the first request does not pay for lazy initialisation).
+Only then is the model published, with a single reference assignment,
+like the hot-reloaded rubric (see hot_reload.py).
+
+The same path swaps to another model version without downtime
+(POST /admin/sbert/load): the current backend keeps serving until the new
+model is warm. A load that fails is logged and the current backend stays.
+
+Each request fetches the backend once and uses it throughout, so a swap
+halfway through a request never mixes two models. /health reports the
+active backend and any load in progress.
+
+Stored embeddings and the ANN index are computed with ATS_SBERT_MODEL;
+they are only used while that model is the active one.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config import SBERT_ENABLED, SBERT_MODEL
+from app.services import metrics
+from app.thread_budget import apply_thread_budget
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('ats_sbert_model_loads_total', 'SentenceTransformer loads by model and outcome')
+
+# Encoded once before a model is published: one short input and one the
+# size of a resume chunk, so both padding shapes are initialised
+_WARMUP_TEXTS = [
+    'python developer',
+    ' '.join(['software engineer building backend services with python sql and aws'] * 12),
+]
+
+
+class SimilarityBackend:
+    """
+    One immutable similarity backend: a loaded SentenceTransformer, or
+    TF-IDF when model is None.
+    """
+
+    def __init__(self, model=None, model_name: str = 'TF-IDF', loaded_at: Optional[float] = None):
+        self.model = model
+        self.model_name = model_name
+        self.loaded_at = loaded_at
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether relevance is computed with SBERT.
+        """
+        return self.model is not None
+
+    @property
+    def method(self) -> str:
+        return 'SBERT' if self.enabled else 'TF-IDF'
+
+    @property
+    def uses_stored_embeddings(self) -> bool:
+        """
+        Whether embeddings in the embedding store and ANN index (computed
+        with ATS_SBERT_MODEL) are comparable with this backend's.
+        """
+        return self.enabled and self.model_name == SBERT_MODEL
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'method': self.method,
+            'model': self.model_name,
+            'loadedAt': self.loaded_at,
+        }
+
+
+TFIDF_BACKEND = SimilarityBackend()
+
+_active: SimilarityBackend = TFIDF_BACKEND
+_loading: Optional[str] = None
+_last_error: Optional[str] = None
+_load_lock = threading.Lock()
+
+
+def get_similarity_backend() -> SimilarityBackend:
+    """
+    Return the active backend.
+
+    Fetch it once per request and pass it down, so the whole request is
+    scored with one model.
+    """
+    return _active
+
+
+def load_sbert_backend(model_name: str = SBERT_MODEL) -> SimilarityBackend:
+    """
+    Load and warm a SentenceTransformer, then make it the active backend.
+
+    Blocks for the whole load; one load runs at a time.
+
+    Raises:
+        Exception: Whatever the import or model load raised; the current
+        backend stays active
+    """
+    with _load_lock:
+        return _load(model_name)
+
+
+def _load(model_name: str) -> SimilarityBackend:
+    # Called with _load_lock held
+    global _active, _loading, _last_error
+    _loading = model_name
+    started = time.perf_counter()
+    try:
+        from sentence_transformers import SentenceTransformer
+        # torch and tokenizers were just imported: cap their pools too
+        apply_thread_budget()
+        model = SentenceTransformer(model_name)
+        model.encode(_WARMUP_TEXTS, normalize_embeddings=True)
+    except Exception as e:
+        _last_error = f"{model_name}: {e}"
+        metrics.increment('ats_sbert_model_loads_total', model=model_name, outcome='failed')
+        raise
+    finally:
+        _loading = None
+
+    previous = _active
+    _active = SimilarityBackend(model, model_name, time.time())
+    _last_error = None
+    metrics.increment('ats_sbert_model_loads_total', model=model_name, outcome='loaded')
+    logger.info("Similarity backend switched from %s to %s (loaded in %.1fs)",
+                previous.model_name, model_name, time.perf_counter() - started)
+    return _active
+
+
+def _load_in_background(model_name: str) -> None:
+    try:
+        _load(model_name)
+    except Exception as e:
+        logger.warning("Could not load SBERT model %s: %s — keeping %s",
+                       model_name, e, _active.model_name)
+    finally:
+        _load_lock.release()
+
+
+def start_sbert_loader(model_name: str = SBERT_MODEL) -> bool:
+    """
+    Load model_name on a daemon thread and switch to it once it is warm.
+
+    Returns:
+        bool: False if a load is already in progress (nothing started)
+    """
+    global _loading
+    if not _load_lock.acquire(blocking=False):
+        return False
+    # Visible on /health right away; the thread releases the lock
+    _loading = model_name
+    threading.Thread(target=_load_in_background, args=(model_name,),
+                     name='sbert-loader', daemon=True).start()
+    return True
+
+
+def start_default_backend() -> None:
+    """
+    Start loading ATS_SBERT_MODEL in the background when SBERT is
+    enabled (ATS_SBERT_ENABLED=1). Requests use TF-IDF until it is ready.
+    """
+    if not SBERT_ENABLED:
+        logger.info("SBERT disabled (set ATS_SBERT_ENABLED=1 to enable) — using TF-IDF")
+        return
+    logger.info("Loading SBERT model %s in the background — using TF-IDF until it is ready", SBERT_MODEL)
+    start_sbert_loader(SBERT_MODEL)
+
+
+def describe_similarity_backend() -> Dict[str, Any]:
+    """
+    The active backend and any load in progress, for /health.
+    """
+    backend = _active
+    if _loading is not None:
+        state = 'loading'
+    elif backend.enabled:
+        state = 'ready'
+    elif _last_error is not None:
+        state = 'failed'
+    else:
+        state = 'disabled'
+    return {**backend.describe(), 'state': state, 'loading': _loading, 'lastError': _last_error}
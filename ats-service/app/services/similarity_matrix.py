@@ -0,0 +1,210 @@
+"""
+Similarity Matrix Service
+
+This module computes TF-IDF relevance for every resume against every job
+description (JD), for admin analytics.
+
+compute_relevance_tfidf() is strictly pairwise, so M JDs x N resumes would
+be M*N vectorizer fits. Here the whole matrix is built from chunked sparse
+matrix products instead, in two streaming passes over the resumes:
+
+1. Document frequencies are accumulated block by block
+2. Each resume block is TF-IDF weighted, L2-normalised and multiplied
+   against the (small) JD matrix, giving one M x block slice of scores
+
+Only one block of resumes is ever held in memory. Terms are hashed into a
+fixed-size feature space (HashingVectorizer with the shared tfidf_terms
+analyzer, as TfidfVectorizer uses elsewhere), so no global vocabulary has
+to be built first. IDF uses TfidfVectorizer's smoothed formula.
+
+Results are streamed into either a running top-k per JD or a compressed
+sparse score matrix written to disk.
+"""
+
+import json
+import logging
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from app.utils.text_cleaner import tfidf_terms
+
+logger = logging.getLogger(__name__)
+
+# 2**20 buckets keeps collisions negligible for resume-sized vocabularies
+N_FEATURES = 2 ** 20
+
+DEFAULT_BLOCK_SIZE = 1000
+
+# A resume block: parallel lists of ids and texts
+ResumeBlock = Tuple[List[str], List[str]]
+
+
+def _make_hasher() -> HashingVectorizer:
+    return HashingVectorizer(
+        n_features=N_FEATURES,
+        analyzer=tfidf_terms,
+        alternate_sign=False,
+        norm=None,
+    )
+
+
+def _document_frequencies(hasher: HashingVectorizer, texts: Sequence[str]) -> np.ndarray:
+    counts = hasher.transform(texts)
+    return np.bincount(counts.indices, minlength=N_FEATURES)
+
+
+def _weight(hasher: HashingVectorizer, texts: Sequence[str], idf: np.ndarray) -> sp.csr_matrix:
+    counts = hasher.transform(texts).tocsr()
+    counts.data = counts.data * idf[counts.indices]
+    return normalize(counts, norm='l2', copy=False)
+
+
+def iter_similarity_blocks(jd_texts: Sequence[str],
+                           resume_blocks: Callable[[], Iterable[ResumeBlock]]
+                           ) -> Iterator[Tuple[List[str], np.ndarray]]:
+    """
+    Yield (resume_ids, scores) per resume block, scores shaped (M, block).
+
+    Args:
+        jd_texts (Sequence[str]): Job description texts (M of them)
+        resume_blocks (Callable): Zero-argument callable returning a fresh
+            iterable of (ids, texts) blocks; it is called twice (one pass
+            for document frequencies, one for scoring)
+
+    Yields:
+        Tuple[List[str], np.ndarray]: Block resume ids and the dense M x block
+        cosine similarity slice
+    """
+    hasher = _make_hasher()
+
+    # Pass 1: document frequencies over JDs + all resumes
+    df = _document_frequencies(hasher, [t or '' for t in jd_texts])
+    n_docs = len(jd_texts)
+    for _, texts in resume_blocks():
+        df += _document_frequencies(hasher, [t or '' for t in texts])
+        n_docs += len(texts)
+
+    # Same smoothing as TfidfVectorizer(smooth_idf=True)
+    idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+    logger.info("Similarity matrix: IDF fitted over %d document(s)", n_docs)
+
+    jd_matrix = _weight(hasher, [t or '' for t in jd_texts], idf)
+
+    # Pass 2: score each resume block against every JD
+    for ids, texts in resume_blocks():
+        if not ids:
+            continue
+        block = _weight(hasher, [t or '' for t in texts], idf)
+        yield ids, (jd_matrix @ block.T).toarray()
+
+
+class TopKAccumulator:
+    """
+    Running top-k resumes per JD, merged block by block with argpartition.
+    """
+
+    def __init__(self, n_jds: int, k: int):
+        self.k = k
+        self.scores = np.empty((n_jds, 0))
+        self.ids = np.empty((n_jds, 0), dtype=object)
+
+    def add(self, block_ids: List[str], block_scores: np.ndarray) -> None:
+        ids = np.concatenate(
+            [self.ids, np.broadcast_to(np.array(block_ids, dtype=object), block_scores.shape)], axis=1
+        )
+        scores = np.concatenate([self.scores, block_scores], axis=1)
+        if scores.shape[1] > self.k:
+            keep = np.argpartition(-scores, self.k - 1, axis=1)[:, :self.k]
+            scores = np.take_along_axis(scores, keep, axis=1)
+            ids = np.take_along_axis(ids, keep, axis=1)
+        self.scores, self.ids = scores, ids
+
+    def results(self) -> List[List[Tuple[str, float]]]:
+        """
+        Return, per JD, (resume_id, score) pairs sorted best first.
+        """
+        order = np.argsort(-self.scores, axis=1, kind='stable')
+        return [
+            [(str(self.ids[row, col]), float(self.scores[row, col])) for col in order[row]]
+            for row in range(self.scores.shape[0])
+        ]
+
+
+def top_k_per_jd(jd_texts: Sequence[str],
+                 resume_blocks: Callable[[], Iterable[ResumeBlock]],
+                 k: int) -> List[List[Tuple[str, float]]]:
+    """
+    Return the k most relevant resumes for every job description.
+
+    Args:
+        jd_texts (Sequence[str]): Job description texts
+        resume_blocks (Callable): See iter_similarity_blocks()
+        k (int): Matches to keep per JD
+
+    Returns:
+        List[List[Tuple[str, float]]]: Per JD (in input order), up to k
+        (resume_id, score) pairs, best first
+    """
+    acc = TopKAccumulator(len(jd_texts), k)
+    for ids, scores in iter_similarity_blocks(jd_texts, resume_blocks):
+        acc.add(ids, scores)
+    return acc.results()
+
+
+def similarity_matrix(jd_texts: Sequence[str],
+                      resume_blocks: Callable[[], Iterable[ResumeBlock]],
+                      min_score: float = 0.0) -> Tuple[sp.csr_matrix, List[str]]:
+    """
+    Build the sparse M x N similarity matrix, keeping scores > min_score.
+
+    Args:
+        jd_texts (Sequence[str]): Job description texts
+        resume_blocks (Callable): See iter_similarity_blocks()
+        min_score (float): Scores at or below this are dropped
+
+    Returns:
+        Tuple[sp.csr_matrix, List[str]]: Score matrix (rows = JDs, columns =
+        resumes) and the resume id of every column
+    """
+    slices = []
+    resume_ids: List[str] = []
+    for ids, scores in iter_similarity_blocks(jd_texts, resume_blocks):
+        scores[scores <= min_score] = 0.0
+        slices.append(sp.csr_matrix(scores))
+        resume_ids.extend(ids)
+
+    if not slices:
+        return sp.csr_matrix((len(jd_texts), 0)), resume_ids
+    return sp.hstack(slices, format='csr'), resume_ids
+
+
+def save_similarity_matrix(path: str, matrix: sp.csr_matrix,
+                           jd_ids: Sequence[str], resume_ids: Sequence[str]) -> None:
+    """
+    Write the matrix as a compressed .npz plus an '<path>.ids.json' sidecar
+    holding the row (JD) and column (resume) ids.
+    """
+    if not path.endswith('.npz'):
+        path += '.npz'
+    sp.save_npz(path, matrix, compressed=True)
+    with open(f'{path}.ids.json', 'w', encoding='utf-8') as fh:
+        json.dump({'jdIds': list(jd_ids), 'resumeIds': list(resume_ids)}, fh)
+    logger.info("Wrote %dx%d similarity matrix (%d non-zero) to %s",
+                matrix.shape[0], matrix.shape[1], matrix.nnz, path)
+
+
+def blocks_from_pairs(items: Sequence[Tuple[str, str]],
+                      block_size: int = DEFAULT_BLOCK_SIZE) -> Callable[[], Iterator[ResumeBlock]]:
+    """
+    Adapt an in-memory sequence of (id, text) pairs to the block callable
+    expected by the functions above.
+    """
+    def blocks() -> Iterator[ResumeBlock]:
+        for start in range(0, len(items), block_size):
+            chunk = items[start:start + block_size]
+            yield [i for i, _ in chunk], [t for _, t in chunk]
+    return blocks
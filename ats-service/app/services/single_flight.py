@@ -0,0 +1,114 @@
+"""
+Single-Flight Request Coalescing
+
+This module makes identical concurrent requests share one computation.
+When the backend retries a /parse that timed out on its side, or a user
+double-clicks upload, the duplicate arrives while the first is still
+running; instead of extracting and scoring the same file twice, it
+awaits the first request's result.
+
+Requests are identified by a key (hash of the file bytes, the job
+description and every other input, see request_key). The first caller
+starts the computation as its own task; later callers with the same key
+attach to it while it runs. Nothing is kept after it finishes — this is
+not a result cache, and it works with the text cache disabled.
+
+Cancellation: a caller that goes away (client disconnect, timeout) only
+stops waiting. The computation keeps running for the others and is
+cancelled only when its last waiter has left.
+
+The in-flight map lives on the worker's event loop, so only duplicates
+that reach the same worker are coalesced. Coalesced callers are counted
+in the ats_coalesced_requests_total metric.
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.config import COALESCE_REQUESTS
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('ats_coalesced_requests_total',
+                 'Requests that awaited an identical in-flight request instead of computing')
+
+T = TypeVar('T')
+
+
+def request_key(*parts: Optional[Any]) -> str:
+    """
+    Hash request inputs (bytes, strings or None) into a coalescing key.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            digest.update(b'\x00N')
+            continue
+        data = part if isinstance(part, bytes) else str(part).encode('utf-8')
+        # Length-prefixed so ("ab", "c") and ("a", "bc") differ
+        digest.update(b'\x01%d:' % len(data) + data)
+    return digest.hexdigest()
+
+
+class _Flight:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    Args:
+        name (str): Label for the metric (usually the endpoint)
+        enabled (bool): When False every call runs on its own
+    """
+
+    def __init__(self, name: str, enabled: bool = COALESCE_REQUESTS):
+        self.name = name
+        self.enabled = enabled
+        self._flights: Dict[str, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return compute()'s result, sharing one call among concurrent
+        callers with the same key.
+
+        Raises:
+            Whatever compute() raises, to every caller sharing it
+        """
+        if not self.enabled:
+            return await compute()
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(compute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            metrics.increment('ats_coalesced_requests_total', endpoint=self.name)
+            logger.info("Coalesced duplicate %s request into the one in flight", self.name)
+
+        flight.waiters += 1
+        try:
+            # shield: cancelling this caller must not cancel the shared task
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                logger.info("Every %s caller left; cancelling the shared computation", self.name)
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
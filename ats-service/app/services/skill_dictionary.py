@@ -0,0 +1,177 @@
+"""
+Skill Dictionary
+
+This module loads the known technical skills from a versioned JSON file
+(by default app/data/skills.json) and compiles them into the matcher used
+by extract_skills_from_resume().
+
+Each skill has a canonical name and optional aliases ("node" for
+"nodejs" and "node.js"); a resume mentioning several spellings of one
+skill counts it once. Every spelling becomes a precompiled word-boundary
+pattern, guarded by a plain substring check so most of the dictionary
+is skipped without running a regex.
+
+The dictionary is reloaded on file change or via POST
+/admin/skills/reload and swapped in atomically (see hot_reload.py), so
+adding a technology needs neither a code change nor a restart.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Tuple
+
+from app.config import SKILL_DICTIONARY_PATH, SKILL_DICTIONARY_POLL_SECONDS
+from app.services.hot_reload import HotReloadable
+
+logger = logging.getLogger(__name__)
+
+# (spelling, compiled pattern) pairs of one skill
+_Spellings = Tuple[Tuple[str, 're.Pattern'], ...]
+
+
+class SkillDictionary:
+    """
+    One compiled, immutable skill dictionary version.
+    """
+
+    def __init__(self, version: str, skills: Dict[str, List[str]], source: str):
+        self.version = version
+        self.source = source
+        self._skills: Tuple[Tuple[str, _Spellings], ...] = tuple(
+            (name, tuple((spelling, re.compile(r'\b' + re.escape(spelling) + r'\b'))
+                         for spelling in spellings))
+            for name, spellings in skills.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def match(self, text: str) -> List[str]:
+        """
+        Find every known skill mentioned in text.
+
+        Args:
+            text (str): Resume text (any casing)
+
+        Returns:
+            List[str]: One entry per skill found, as first written in the
+            text (original casing), in dictionary order
+        """
+        text_lower = text.lower()
+        found = []
+        for _, spellings in self._skills:
+            first = None
+            for spelling, pattern in spellings:
+                if spelling not in text_lower:
+                    continue
+                match = pattern.search(text_lower)
+                # Earliest mention wins; "node.js" beats "node" at the same spot
+                if match and (first is None or (match.start(), -match.end()) < (first.start(), -first.end())):
+                    first = match
+            if first is not None:
+                found.append(text[first.start():first.end()])
+        return found
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'source': self.source,
+            'skills': len(self._skills),
+            'spellings': sum(len(spellings) for _, spellings in self._skills),
+        }
+
+
+def compile_skill_dictionary(data: Dict[str, Any], source: str = '<memory>') -> SkillDictionary:
+    """
+    Validate and compile skill dictionary data (the parsed JSON file).
+
+    'skills' maps a category name to a list of entries; an entry is a
+    skill name or {"name": ..., "aliases": [...]}. Names are matched
+    case-insensitively; a spelling listed twice is kept once.
+
+    Raises:
+        ValueError: If a field is missing or has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Skill dictionary must be a JSON object")
+    version = data.get('version')
+    if not isinstance(version, str) or not version:
+        raise ValueError("Skill dictionary 'version' must be a non-empty string")
+    categories = data.get('skills')
+    if not isinstance(categories, dict) or not categories:
+        raise ValueError("Skill dictionary 'skills' must be an object of category lists")
+
+    skills: Dict[str, List[str]] = {}
+    owner: Dict[str, str] = {}
+    for category, entries in categories.items():
+        if not isinstance(entries, list):
+            raise ValueError(f"Skill category '{category}' must be a list")
+        for entry in entries:
+            if isinstance(entry, str):
+                name, aliases = entry, []
+            elif isinstance(entry, dict) and isinstance(entry.get('name'), str):
+                name, aliases = entry['name'], entry.get('aliases') or []
+            else:
+                raise ValueError(f"Invalid skill entry in '{category}': {entry!r}")
+            if not isinstance(aliases, list) or not all(isinstance(a, str) for a in aliases):
+                raise ValueError(f"Aliases of skill '{name}' must be a list of strings")
+
+            name = name.strip().lower()
+            spellings = skills.setdefault(name, [])
+            for spelling in [name] + [a.strip().lower() for a in aliases]:
+                if not spelling:
+                    raise ValueError(f"Empty spelling for skill '{name}'")
+                if spelling in owner:
+                    if owner[spelling] != name:
+                        logger.warning("Skill spelling '%s' listed under both '%s' and '%s' — keeping '%s'",
+                                       spelling, owner[spelling], name, owner[spelling])
+                    continue
+                owner[spelling] = name
+                spellings.append(spelling)
+
+    return SkillDictionary(version, {name: s for name, s in skills.items() if s}, source)
+
+
+def load_skill_dictionary(path: str = SKILL_DICTIONARY_PATH) -> SkillDictionary:
+    """
+    Read and compile a skill dictionary file.
+
+    Raises:
+        ValueError: If the file is not valid JSON or not a valid dictionary
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding='utf-8') as fh:
+        try:
+            data = json.load(fh)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Skill dictionary file is not valid JSON: {e}") from e
+    return compile_skill_dictionary(data, source=path)
+
+
+_dictionary = HotReloadable('skill dictionary', SKILL_DICTIONARY_PATH, load_skill_dictionary)
+
+
+def get_skill_dictionary() -> SkillDictionary:
+    """
+    Return the active skill dictionary, loading it on first use.
+    """
+    return _dictionary.get()
+
+
+def reload_skill_dictionary(path: str = SKILL_DICTIONARY_PATH) -> SkillDictionary:
+    """
+    Recompile the skill dictionary file and make it active.
+
+    Raises:
+        ValueError / OSError: If the file is invalid; the current dictionary stays
+    """
+    return _dictionary.reload(path)
+
+
+def start_skill_dictionary_watcher(interval: float = SKILL_DICTIONARY_POLL_SECONDS) -> None:
+    """
+    Load the dictionary and start the background thread that reloads it
+    when the file changes (once per process; no-op if interval <= 0).
+    """
+    _dictionary.start_watcher(interval)
@@ -8,86 +8,20 @@ Key Responsibilities:
 - Extract skills from a dedicated "Skills" section
 - Extract skills from the ENTIRE resume text
 - Parse comma/newline-separated skill lists
-- Match against known technology keywords
+- Match against known technology keywords (the skill dictionary, see
+  skill_dictionary.py)
 
 Pipeline stage: Entity / Skill Extraction (step 3 of the ATS pipeline)
 """
 
 import re
 import logging
-from typing import List, Optional, Set
+from typing import List, Optional
 
-logger = logging.getLogger(__name__)
+from app.services.skill_dictionary import SkillDictionary, get_skill_dictionary
+from app.utils.text_cleaner import analyze
 
-# Comprehensive list of technical skills and technologies
-KNOWN_SKILLS: Set[str] = {
-    # Programming Languages
-    'python', 'java', 'javascript', 'typescript', 'c', 'c++', 'c#', 'go', 'golang',
-    'rust', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'lua',
-    'haskell', 'elixir', 'clojure', 'dart', 'objective-c', 'assembly', 'fortran',
-    'cobol', 'visual basic', 'vb.net', 'f#', 'groovy', 'julia',
-
-    # Web Frontend
-    'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'tailwind', 'tailwindcss',
-    'bootstrap', 'react', 'reactjs', 'react.js', 'angular', 'angularjs', 'vue', 'vuejs',
-    'vue.js', 'svelte', 'nextjs', 'next.js', 'nuxt', 'nuxtjs', 'gatsby', 'jquery',
-    'webpack', 'vite', 'parcel', 'rollup', 'babel', 'redux', 'mobx', 'zustand',
-    'graphql', 'apollo', 'material-ui', 'mui', 'chakra', 'ant design', 'styled-components',
-
-    # Web Backend
-    'node', 'nodejs', 'node.js', 'express', 'expressjs', 'fastify', 'koa', 'nestjs',
-    'django', 'flask', 'fastapi', 'spring', 'spring boot', 'springboot', 'rails',
-    'ruby on rails', 'laravel', 'symfony', 'asp.net', '.net', 'dotnet', '.net core',
-    'gin', 'echo', 'fiber', 'actix', 'rocket', 'phoenix', 'phoenix framework',
-
-    # Databases
-    'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'sqlite', 'oracle', 'redis',
-    'cassandra', 'dynamodb', 'elasticsearch', 'mariadb', 'couchdb', 'neo4j', 'firestore',
-    'firebase', 'supabase', 'prisma', 'sequelize', 'typeorm', 'mongoose', 'knex',
-    'influxdb', 'timescaledb', 'cockroachdb', 'planetscale',
-
-    # Cloud & DevOps
-    'aws', 'amazon web services', 'azure', 'gcp', 'google cloud', 'google cloud platform',
-    'docker', 'kubernetes', 'k8s', 'terraform', 'ansible', 'jenkins', 'circleci',
-    'github actions', 'gitlab ci', 'travis ci', 'argo', 'helm', 'istio', 'prometheus',
-    'grafana', 'datadog', 'splunk', 'new relic', 'cloudformation', 'pulumi', 'vagrant',
-    'packer', 'consul', 'vault', 'nomad', 'serverless', 'lambda', 'ec2', 's3', 'rds',
-    'cloudfront', 'route53', 'elastic beanstalk', 'ecs', 'eks', 'fargate', 'cloudwatch',
-
-    # Data & ML
-    'machine learning', 'ml', 'deep learning', 'neural networks', 'tensorflow', 'pytorch',
-    'keras', 'scikit-learn', 'sklearn', 'pandas', 'numpy', 'scipy', 'matplotlib',
-    'seaborn', 'plotly', 'jupyter', 'jupyter notebook', 'data science', 'data analysis',
-    'data engineering', 'etl', 'spark', 'apache spark', 'pyspark', 'hadoop', 'hive',
-    'kafka', 'airflow', 'dbt', 'snowflake', 'bigquery', 'redshift', 'databricks',
-    'nlp', 'natural language processing', 'computer vision', 'opencv', 'llm',
-    'langchain', 'hugging face', 'transformers', 'bert', 'gpt', 'openai', 'rag',
-
-    # Mobile
-    'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova',
-    'swiftui', 'uikit', 'jetpack compose', 'android studio', 'xcode',
-
-    # Testing
-    'jest', 'mocha', 'chai', 'jasmine', 'playwright', 'cypress', 'selenium',
-    'pytest', 'unittest', 'junit', 'testng', 'mockito', 'rspec', 'enzyme',
-    'testing library', 'puppeteer', 'webdriver', 'postman', 'insomnia', 'k6', 'locust',
-    'jmeter', 'load testing', 'unit testing', 'integration testing', 'e2e testing',
-
-    # Version Control & Collaboration
-    'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'jira', 'confluence',
-    'trello', 'asana', 'slack', 'notion', 'linear', 'figma', 'sketch', 'adobe xd',
-
-    # Methodologies
-    'agile', 'scrum', 'kanban', 'devops', 'devsecops', 'ci/cd', 'cicd', 'tdd',
-    'bdd', 'microservices', 'soa', 'rest', 'restful', 'api', 'apis', 'oauth',
-    'jwt', 'sso', 'saml', 'oidc', 'graphql', 'grpc', 'websocket', 'websockets',
-
-    # Other
-    'linux', 'unix', 'bash', 'shell', 'powershell', 'windows server', 'nginx',
-    'apache', 'iis', 'rabbitmq', 'zeromq', 'celery', 'cron', 'systemd',
-    'embedded', 'iot', 'raspberry pi', 'arduino', 'mqtt', 'blockchain', 'solidity',
-    'web3', 'rust', 'wasm', 'webassembly', 'electron', 'tauri', 'pwa',
-}
+logger = logging.getLogger(__name__)
 
 
 def extract_skills_from_section(section_text: Optional[str]) -> List[str]:
@@ -145,44 +79,35 @@ def extract_skills_from_section(section_text: Optional[str]) -> List[str]:
     return skills
 
 
-def extract_skills_from_resume(text: str) -> List[str]:
+def extract_skills_from_resume(text: str, dictionary: Optional[SkillDictionary] = None) -> List[str]:
     """
     Extract technical skills from the ENTIRE resume text.
 
-    This function matches words in the resume against a comprehensive
-    list of known technical skills and technologies. This ensures we
+    This function matches words in the resume against the skill
+    dictionary (known technologies and their aliases). This ensures we
     capture skills mentioned anywhere in the resume, not just in the
-    skills section.
+    skills section. Matching uses word boundaries, so "react" doesn't
+    match "reaction", and a skill written several ways ("Node.js",
+    "NodeJS") is reported once.
 
     Args:
         text (str): Full resume text
+        dictionary (Optional[SkillDictionary]): Dictionary to match against
+            (default: the active one)
 
     Returns:
         List[str]: List of unique skills found (original casing)
 
     Example:
         >>> extract_skills_from_resume("I developed a React app using Python and AWS")
-        ['React', 'Python', 'AWS']
+        ['Python', 'React', 'AWS']
     """
     if not text:
         return []
 
-    found_skills = []
-    text_lower = text.lower()
-
-    # Find all known skills mentioned in the text
-    for skill in KNOWN_SKILLS:
-        # Use word boundary matching to avoid partial matches
-        # e.g., "react" shouldn't match "reaction"
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            # Get the original casing from the text if possible
-            match = re.search(pattern, text_lower)
-            if match:
-                # Find the matching text in original case
-                start, end = match.start(), match.end()
-                original_skill = text[start:end]
-                found_skills.append(original_skill)
+    if dictionary is None:
+        dictionary = get_skill_dictionary()
+    found_skills = dictionary.match(text)
 
     # Deduplicate while preserving order
     unique = deduplicate_skills(found_skills)
@@ -216,9 +141,9 @@ def extract_keywords(text: str, min_length: int = 3, max_length: int = 30) -> Li
     if not text:
         return []
 
-    # Split by whitespace and common punctuation
-    # Keep hyphens and dots (for terms like "React.js", "C++", etc.)
-    words = re.findall(r'[\w\.\-\+]+', text)
+    # Split by whitespace and common punctuation (shared tokenizer keeps
+    # hyphens, dots and plus signs for terms like "React.js", "C++")
+    words = analyze(text).keywords
 
     keywords = []
     for word in words:
@@ -0,0 +1,315 @@
+"""
+Extracted Text Cache
+
+This module keeps a disk-backed cache of extracted resume text so the
+same file is only ever run through pdfminer/python-docx once.
+
+Key Responsibilities:
+- Key entries by SHA-256(file bytes) + file type + extractor version
+- Store the extracted text, any parsing errors and the PDF classification
+  (negative results for unparseable files are cached too)
+- Share one SQLite database between all worker processes
+- Evict least-recently-used entries when the store exceeds its size limit
+
+Cache failures never break parsing: any SQLite error is logged and the
+request falls back to a direct extraction.
+
+Pipeline stage: Text Extraction (wraps step 1 of the ATS pipeline)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.config import (
+    TEXT_CACHE_ENABLED,
+    TEXT_CACHE_PATH,
+    TEXT_CACHE_MAX_BYTES,
+    EXTRACTION_SANDBOX_ENABLED,
+    STREAMING_EARLY_STOP,
+)
+from app.services.resume_parser import EXTRACTOR_VERSION, count_pdf_pages
+from app.services.extraction_sandbox import ExtractionOutcome, run_in_process, run_sandboxed
+from app.services.section_segmenter import Segments
+from app.services import metrics
+from app.utils.sqlite_connections import thread_connection
+
+logger = logging.getLogger(__name__)
+
+# Only refresh an entry's access time when it is older than this, so hot
+# entries don't turn every read into a write.
+_TOUCH_INTERVAL_SECONDS = 60.0
+
+metrics.describe('ats_pdf_classification_total', 'Uploaded PDFs by text-layer classification')
+
+# After eviction the store is trimmed down to this fraction of the limit
+_EVICT_TARGET_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extracted_text (
+    key          TEXT PRIMARY KEY,
+    text         TEXT NOT NULL,
+    errors       TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    created_at   REAL NOT NULL,
+    last_access  REAL NOT NULL,
+    pdf_kind     TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_extracted_text_last_access
+    ON extracted_text (last_access);
+"""
+
+
+def file_digest(file_bytes: bytes) -> str:
+    """
+    Return the SHA-256 hex digest of a file's bytes.
+    """
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+class ExtractedDocument(NamedTuple):
+    text: str
+    errors: List[str]
+    # pdf_classifier kind for PDFs, None for other files
+    pdf_kind: Optional[str]
+    cache_hit: bool
+    # True when only the leading max_pages pages of a longer PDF were read
+    pages_capped: bool = False
+    # Sections and contact found while extracting (not kept in the cache)
+    segments: Optional[Segments] = None
+
+
+def _file_kind(filename: str) -> str:
+    """
+    Return the extension that safe_extract_text dispatches on.
+
+    The same bytes uploaded as .pdf and as .docx give different results,
+    so the extension is part of the cache key.
+    """
+    lower = (filename or '').lower()
+    for ext in ('.pdf', '.docx', '.doc'):
+        if lower.endswith(ext):
+            return ext
+    return 'other'
+
+
+class TextCache:
+    """
+    SQLite store mapping file hash + extractor version to extracted text.
+
+    The database runs in WAL mode so concurrent readers in other worker
+    processes are never blocked by a writer. Connections are opened lazily
+    per thread and re-opened after a fork (see app/utils/sqlite_connections.py).
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._evict_lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(extracted_text)')}
+            if 'pdf_kind' not in columns:
+                conn.execute('ALTER TABLE extracted_text ADD COLUMN pdf_kind TEXT')
+
+    def _connect(self) -> sqlite3.Connection:
+        return thread_connection(self._local, self.path)
+
+    @staticmethod
+    def make_key(file_bytes: bytes, filename: str) -> str:
+        """
+        Build the cache key for a file.
+        """
+        # Early-stopped extractions hold only the leading pages
+        version = f"{EXTRACTOR_VERSION}:early-stop" if STREAMING_EARLY_STOP else EXTRACTOR_VERSION
+        return f"{file_digest(file_bytes)}:{_file_kind(filename)}:{version}"
+
+    def get(self, key: str) -> Optional[Tuple[str, List[str], Optional[str]]]:
+        """
+        Look up a cached extraction result.
+
+        Returns:
+            Optional[Tuple[str, List[str], Optional[str]]]: (text, errors,
+            pdf_kind), or None on a miss
+        """
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT text, errors, pdf_kind, last_access FROM extracted_text WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        text, errors, pdf_kind, last_access = row
+        now = time.time()
+        if now - last_access > _TOUCH_INTERVAL_SECONDS:
+            with conn:
+                conn.execute('UPDATE extracted_text SET last_access = ? WHERE key = ?', (now, key))
+        return text, json.loads(errors), pdf_kind
+
+    def put(self, key: str, text: str, errors: List[str], pdf_kind: Optional[str] = None) -> None:
+        """
+        Store an extraction result and evict old entries if over the limit.
+        """
+        errors_json = json.dumps(errors)
+        size = len(text.encode('utf-8')) + len(errors_json)
+        if size > self.max_bytes:
+            logger.info("Extracted text too large to cache (%d bytes)", size)
+            return
+
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO extracted_text '
+                '(key, text, errors, size, created_at, last_access, pdf_kind) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, text, errors_json, size, now, now, pdf_kind)
+            )
+        self._evict_if_needed(conn)
+
+    def _evict_if_needed(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM extracted_text').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        with self._evict_lock, conn:
+            to_free = total - int(self.max_bytes * _EVICT_TARGET_RATIO)
+            victims = []
+            for key, size in conn.execute(
+                'SELECT key, size FROM extracted_text ORDER BY last_access ASC'
+            ):
+                victims.append((key,))
+                to_free -= size
+                if to_free <= 0:
+                    break
+            conn.executemany('DELETE FROM extracted_text WHERE key = ?', victims)
+        logger.info("Text cache over %d bytes — evicted %d entr(ies)", self.max_bytes, len(victims))
+
+    def stats(self) -> dict:
+        """
+        Return the number of entries and total stored bytes.
+        """
+        count, total = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extracted_text'
+        ).fetchone()
+        return {'entries': count, 'bytes': total, 'maxBytes': self.max_bytes}
+
+
+_cache: Optional[TextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_text_cache() -> Optional[TextCache]:
+    """
+    Return the process-wide text cache, or None when caching is disabled
+    or the store cannot be opened.
+    """
+    global _cache
+    if not TEXT_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = TextCache(TEXT_CACHE_PATH, TEXT_CACHE_MAX_BYTES)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("Could not open text cache at %s: %s — caching disabled", TEXT_CACHE_PATH, e)
+                    return None
+    return _cache
+
+
+def cached_extract_document(file_bytes: bytes, filename: str,
+                            max_pages: Optional[int] = None,
+                            use_cache: bool = True) -> ExtractedDocument:
+    """
+    Extract text from a resume file, reusing a previous extraction of the
+    same bytes when one is cached.
+
+    Misses are extracted in the resource-limited sandbox (see
+    extraction_sandbox.py); timeouts and crashed extractors are not
+    cached, since they may be transient. PDF classifications are counted
+    in the ats_pdf_classification_total metric.
+
+    With max_pages, a PDF that is not cached and has more pages is read
+    only up to that page; the truncated text is returned but not cached.
+
+    Args:
+        file_bytes (bytes): Raw bytes of the uploaded file
+        filename (str): Original filename (used to determine file type)
+        max_pages (int, optional): Most PDF pages to extract on a miss
+        use_cache (bool): False always extracts and leaves the cache
+            untouched (startup warmup)
+
+    Returns:
+        ExtractedDocument: Text, parsing errors, PDF kind, whether the
+        result came from the cache and whether it was truncated
+    """
+    document = _cached_extract(file_bytes, filename, max_pages, use_cache)
+    if document.pdf_kind is not None:
+        metrics.increment('ats_pdf_classification_total', kind=document.pdf_kind,
+                          source='cache' if document.cache_hit else 'computed')
+    return document
+
+
+def _cached_extract(file_bytes: bytes, filename: str, max_pages: Optional[int],
+                    use_cache: bool) -> ExtractedDocument:
+    cache = get_text_cache() if use_cache else None
+    if cache is None:
+        return _extract_capped(file_bytes, filename, max_pages)[0]
+
+    key = cache.make_key(file_bytes, filename)
+    try:
+        hit = cache.get(key)
+    except sqlite3.Error as e:
+        logger.warning("Text cache lookup failed: %s", e)
+        hit = None
+
+    if hit is not None:
+        logger.info("Text cache hit for %s", filename)
+        return ExtractedDocument(*hit, cache_hit=True)
+
+    document, cacheable = _extract_capped(file_bytes, filename, max_pages)
+    if cacheable:
+        try:
+            cache.put(key, document.text, document.errors, document.pdf_kind)
+        except sqlite3.Error as e:
+            logger.warning("Text cache store failed: %s", e)
+    return document
+
+
+def _extract_capped(file_bytes: bytes, filename: str,
+                    max_pages: Optional[int]) -> Tuple[ExtractedDocument, bool]:
+    """
+    Extract, reading at most max_pages pages when the file is a longer PDF.
+
+    Returns:
+        Tuple[ExtractedDocument, bool]: The document and whether it may be
+        cached (not when transient or truncated)
+    """
+    if max_pages is None or _file_kind(filename) != '.pdf' or \
+            (count_pdf_pages(file_bytes, max_pages + 1) or 0) <= max_pages:
+        outcome = _extract(file_bytes, filename)
+        document = ExtractedDocument(outcome.text, outcome.errors, outcome.pdf_kind, False,
+                                     segments=outcome.segments)
+        return document, outcome.cacheable
+
+    logger.info("Reading only the first %d page(s) of %s", max_pages, filename)
+    outcome = _extract(file_bytes, filename, max_pages)
+    document = ExtractedDocument(outcome.text, outcome.errors, outcome.pdf_kind, False,
+                                 pages_capped=bool(outcome.text), segments=outcome.segments)
+    return document, False
+
+
+def _extract(file_bytes: bytes, filename: str, max_pages: Optional[int] = None) -> ExtractionOutcome:
+    if EXTRACTION_SANDBOX_ENABLED:
+        return run_sandboxed(file_bytes, filename, max_pages=max_pages)
+    return run_in_process(file_bytes, filename, max_pages)
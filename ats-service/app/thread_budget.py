@@ -0,0 +1,137 @@
+"""
+Thread Budget
+
+Each native thread pool in a worker (OpenMP/BLAS under NumPy, SciPy and
+scikit-learn, PyTorch intra-op threads, the HuggingFace tokenizers pool)
+defaults to one thread per core. With several uvicorn workers on one
+host that is workers x cores threads per pool, all competing for the
+same cores.
+
+This module divides the cores available to the process between the
+workers and caps every pool at that share:
+
+- Environment variables read by the libraries when they load (OMP, BLAS,
+  torch, tokenizers), set before anything heavy is imported. Variables
+  already present are left alone, but the runtime caps below still
+  apply: set ATS_THREADS_PER_WORKER to choose the count.
+- threadpoolctl for BLAS/OpenMP libraries that are already loaded
+- torch.set_num_threads() if PyTorch is loaded
+
+apply_thread_budget() is idempotent; it runs when the app package is
+imported and again once startup has loaded everything (see create_app).
+It lives outside app.utils because that package imports scikit-learn.
+Extraction children are single-threaded pure Python and need no budget.
+"""
+
+import logging
+import os
+import sys
+from typing import Any, Dict, NamedTuple, Optional
+
+from app.config import THREADS_PER_WORKER, WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Read by OpenMP, the BLAS builds NumPy/SciPy ship with, MKL, numexpr and torch
+_THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+    'BLIS_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS',
+)
+
+
+class ThreadBudget(NamedTuple):
+    cpus: int
+    workers: int
+    threads: int
+    # 'auto' (cpus // workers) or 'ATS_THREADS_PER_WORKER'
+    source: str
+
+
+def available_cpus() -> int:
+    """
+    Cores this process may run on (respects CPU affinity / cpusets).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def compute_thread_budget(workers: int = WORKERS, threads: int = THREADS_PER_WORKER,
+                          cpus: Optional[int] = None) -> ThreadBudget:
+    """
+    Threads each pool of one worker may use.
+
+    Args:
+        workers (int): Worker processes sharing the host
+        threads (int): Explicit per-worker threads (0 = cores / workers)
+        cpus (int, optional): Cores to divide (default: available_cpus())
+
+    Returns:
+        ThreadBudget: The per-worker thread count and how it was chosen
+    """
+    cpus = cpus or available_cpus()
+    workers = max(1, workers)
+    if threads > 0:
+        return ThreadBudget(cpus, workers, threads, 'ATS_THREADS_PER_WORKER')
+    return ThreadBudget(cpus, workers, max(1, cpus // workers), 'auto')
+
+
+_applied: Dict[str, Any] = {}
+
+
+def apply_thread_budget(budget: Optional[ThreadBudget] = None) -> ThreadBudget:
+    """
+    Cap every thread pool of this process at the budget.
+
+    Args:
+        budget (ThreadBudget, optional): Default: compute_thread_budget()
+
+    Returns:
+        ThreadBudget: The budget applied
+    """
+    budget = budget or compute_thread_budget()
+    n = str(budget.threads)
+    for name in _THREAD_ENV_VARS:
+        os.environ.setdefault(name, n)
+    # tokenizers uses a rayon pool; a single thread gains nothing from it
+    os.environ.setdefault('RAYON_NUM_THREADS', n)
+    os.environ.setdefault('TOKENIZERS_PARALLELISM', 'true' if budget.threads > 1 else 'false')
+
+    pools = []
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+        threadpool_limits(limits=budget.threads)
+        pools = [f"{pool['internal_api']}:{pool['num_threads']}" for pool in threadpool_info()]
+    except ImportError:
+        pass
+
+    torch_threads = None
+    if 'torch' in sys.modules:
+        torch = sys.modules['torch']
+        torch.set_num_threads(budget.threads)
+        torch_threads = torch.get_num_threads()
+
+    state = {'budget': budget, 'pools': pools, 'torch': torch_threads}
+    if state != _applied:
+        logger.info("Thread budget: %d thread(s) per pool (%d cpus / %d workers, %s); pools capped: %s",
+                    budget.threads, budget.cpus, budget.workers, budget.source,
+                    ', '.join(pools) or 'none loaded yet')
+    _applied.update(state)
+    return budget
+
+
+def describe_thread_budget() -> Dict[str, Any]:
+    """
+    The budget in effect, for /health.
+    """
+    budget = _applied.get('budget') or compute_thread_budget()
+    return {
+        'cpus': budget.cpus,
+        'workers': budget.workers,
+        'threadsPerWorker': budget.threads,
+        'source': budget.source,
+        'nativePools': _applied.get('pools', []),
+        'torchThreads': _applied.get('torch'),
+        'tokenizersParallelism': os.environ.get('TOKENIZERS_PARALLELISM'),
+    }
@@ -5,15 +5,33 @@ Helper functions and utilities used across the ATS service.
 """
 
 from app.utils.text_cleaner import (
+    AnalyzedText,
+    analyze,
+    tfidf_terms,
     clean_text,
     detect_formatting_risks,
     normalize_whitespace,
     remove_special_characters
 )
 
+from app.utils.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    wants_ndjson,
+    ndjson_response
+)
+
+from app.utils.sqlite_connections import thread_connection
+
 __all__ = [
+    'AnalyzedText',
+    'analyze',
+    'tfidf_terms',
     'clean_text',
     'detect_formatting_risks',
     'normalize_whitespace',
-    'remove_special_characters'
+    'remove_special_characters',
+    'NDJSON_MEDIA_TYPE',
+    'wants_ndjson',
+    'ndjson_response',
+    'thread_connection'
 ]
@@ -0,0 +1,54 @@
+"""
+NDJSON Streaming
+
+Helpers for endpoints that can answer with newline-delimited JSON
+(application/x-ndjson) instead of one JSON document.
+
+A streamed response is written one line at a time from an async
+generator: the first line is the response envelope (every field except
+the result list), then one line per result as soon as it is ready. The
+generator only runs when the server asks for the next chunk, so a slow
+client pauses the scoring instead of letting results pile up in memory.
+
+The status code is sent before the first line, so a failure part-way
+through is reported as a final {"error": ...} line.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """
+    True if the Accept header asks for an NDJSON stream.
+    """
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept.lower()
+
+
+async def _encode(lines: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    try:
+        async for line in lines:
+            yield (json.dumps(line, separators=(',', ':')) + '\n').encode('utf-8')
+    except Exception as e:
+        logger.exception("NDJSON stream failed")
+        yield (json.dumps({'error': str(e)}) + '\n').encode('utf-8')
+
+
+def ndjson_response(lines: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Stream the dicts produced by an async generator as NDJSON.
+
+    Args:
+        lines (AsyncIterator[Dict[str, Any]]): Envelope first, then results
+
+    Returns:
+        StreamingResponse: application/x-ndjson response
+    """
+    return StreamingResponse(_encode(lines), media_type=NDJSON_MEDIA_TYPE)
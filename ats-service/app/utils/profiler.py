@@ -0,0 +1,190 @@
+"""
+Per-Request Profiler
+
+This module lets an admin profile one request on a live worker, so a
+slow /parse for one customer's resume can be examined without
+reproducing it locally.
+
+A request opts in with the `X-ATS-Profile: 1` header or the `?profile=1`
+query flag, and must carry the admin token in `X-Admin-Token`. It is then
+run under two profilers at once:
+
+- cProfile on the event-loop thread (where async endpoints do their
+  work), saved as a .pstats file
+- A stack sampler over every thread (which also covers sync endpoints
+  and the /parse pipeline, both running in the threadpool), saved as
+  collapsed stacks ready for flamegraph.pl / speedscope
+
+Both files land in PROFILE_DIR and are linked from the response headers
+(`X-ATS-Profile-Id` and `Link`); they can be downloaded through
+/admin/profiles. Profiled requests run one at a time, and anything else
+the worker does meanwhile shows up in the profile too.
+
+The middleware is only installed when ATS_ADMIN_TOKEN is set; requests
+that don't opt in go straight through with a single header check.
+"""
+
+import asyncio
+import cProfile
+import hmac
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b'x-ats-profile'
+ADMIN_TOKEN_HEADER = b'x-admin-token'
+
+# Leaf frames of threads that are just waiting (idle pool workers, the
+# event loop's selector); dropped so they don't dominate the flamegraph
+_IDLE_FILES = ('threading.py', 'selectors.py', 'queue.py')
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    Samples the Python stack of every thread at a fixed interval and
+    counts identical stacks (collapsed-stack format).
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='ats-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if os.path.basename(frame.f_code.co_filename) in _IDLE_FILES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.counts[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        Return the samples as 'root;...;leaf count' lines.
+        """
+        return ''.join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+def profile_requested(scope: Dict) -> bool:
+    """
+    True when the request asks to be profiled (header or query flag).
+    """
+    for name, value in scope['headers']:
+        if name == PROFILE_HEADER:
+            return value not in (b'', b'0', b'false')
+    query = scope.get('query_string', b'')
+    if b'profile=' not in query:
+        return False
+    flag = parse_qs(query.decode('latin-1')).get('profile', ['0'])[0]
+    return flag not in ('', '0', 'false')
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware running opted-in admin requests under the profilers.
+    """
+
+    def __init__(self, app, admin_token: str, output_dir: str, interval: float = 0.005):
+        self.app = app
+        self.admin_token = admin_token.encode()
+        self.output_dir = output_dir
+        self.interval = interval
+        self._lock = asyncio.Lock()
+
+    def _is_admin(self, scope: Dict) -> bool:
+        for name, value in scope['headers']:
+            if name == ADMIN_TOKEN_HEADER:
+                return hmac.compare_digest(value, self.admin_token)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not profile_requested(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._is_admin(scope):
+            logger.warning("Ignoring profile request without a valid admin token: %s", scope['path'])
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        links = ', '.join(
+            f'</admin/profiles/{profile_id}{ext}>; rel="profile"' for ext in ('.pstats', '.collapsed')
+        )
+
+        async def send_with_links(message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = list(message.get('headers', [])) + [
+                    (b'x-ats-profile-id', profile_id.encode()),
+                    (b'link', links.encode()),
+                ]
+            await send(message)
+
+        async with self._lock:
+            sampler = StackSampler(self.interval)
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            sampler.start()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_links)
+            finally:
+                profiler.disable()
+                sampler.stop()
+                elapsed = time.perf_counter() - started
+                self._write(profile_id, profiler, sampler)
+                logger.info("Profiled %s %s in %.3fs (%d sample(s)) -> %s",
+                            scope['method'], scope['path'], elapsed, sampler.samples, profile_id)
+
+    def _write(self, profile_id: str, profiler: cProfile.Profile, sampler: StackSampler) -> None:
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            base = os.path.join(self.output_dir, profile_id)
+            profiler.dump_stats(base + '.pstats')
+            with open(base + '.collapsed', 'w', encoding='utf-8') as fh:
+                fh.write(sampler.collapsed())
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", profile_id, e)
+
+
+def list_profiles(output_dir: str) -> List[str]:
+    """
+    Return the names of saved profile files, newest first.
+    """
+    try:
+        names = os.listdir(output_dir)
+    except OSError:
+        return []
+    return sorted((n for n in names if n.endswith(('.pstats', '.collapsed'))), reverse=True)
@@ -0,0 +1,45 @@
+"""
+SQLite Connections
+
+The service's local stores (text cache, resume store, embedding store)
+each keep one SQLite database that all worker processes share. They open
+connections the same way, through thread_connection():
+
+- One connection per thread, opened lazily (sqlite3 connections must not
+  be shared between threads)
+- Re-opened in a forked child, which must not reuse its parent's handle
+- WAL mode, so readers in other workers are never blocked by a writer
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Optional
+
+
+def thread_connection(local: threading.local, path: str, timeout: float = 10.0,
+                      synchronous: Optional[str] = 'NORMAL', **connect_kwargs: Any) -> sqlite3.Connection:
+    """
+    Return this thread's connection to the database at path, opening it
+    on first use in this thread and process.
+
+    Args:
+        local (threading.local): The store's thread-local holder
+        path (str): Database file
+        timeout (float): Seconds to wait for another writer's lock
+        synchronous (str, optional): PRAGMA synchronous value; None keeps
+            SQLite's default (FULL)
+        **connect_kwargs: Passed on to sqlite3.connect()
+
+    Returns:
+        sqlite3.Connection: The connection, in WAL mode
+    """
+    conn = getattr(local, 'conn', None)
+    if conn is None or getattr(local, 'pid', None) != os.getpid():
+        conn = sqlite3.connect(path, timeout=timeout, **connect_kwargs)
+        conn.execute('PRAGMA journal_mode=WAL')
+        if synchronous is not None:
+            conn.execute(f'PRAGMA synchronous={synchronous}')
+        local.conn = conn
+        local.pid = os.getpid()
+    return conn
@@ -5,6 +5,7 @@ This module contains helper functions for cleaning and normalizing text.
 These utilities are used throughout the ATS service to prepare text for analysis.
 
 Key Responsibilities:
+- Tokenize each document once (shared by TF-IDF, SBERT cleaning and keywords)
 - Remove special characters
 - Normalize whitespace
 - Remove stopwords
@@ -12,7 +13,112 @@ Key Responsibilities:
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS as _SKLEARN_STOP_WORDS
+
+# Stopwords dropped from TF-IDF terms (the list TfidfVectorizer(stop_words='english') uses)
+ENGLISH_STOP_WORDS = frozenset(_SKLEARN_STOP_WORDS)
+
+# Analysed documents kept in memory, keyed by the exact text
+ANALYSIS_CACHE_SIZE = 256
+
+_TOKEN_RE = re.compile(r'\w+')
+_LETTERS_RE = re.compile(r'[a-z]+')
+# Keeps hyphens, dots and plus signs for terms like "React.js" and "C++"
+_KEYWORD_RE = re.compile(r'[\w\.\-\+]+')
+
+
+class AnalyzedText:
+    """
+    One document, tokenized once.
+
+    Every view is derived from the same lowercased word tokens (runs of
+    word characters) and computed on first use:
+    - terms: TF-IDF terms, identical to TfidfVectorizer(stop_words='english')
+      (tokens of two or more characters that are not stopwords)
+    - words: letter-only words, as clean_text() produces them
+    - keywords: original-case keyword candidates for extract_keywords()
+
+    Stopwords are flagged once per token in stop_flags.
+    """
+
+    __slots__ = ('text', '_tokens', '_stop_flags', '_terms', '_words', '_keywords')
+
+    def __init__(self, text: str):
+        self.text = text
+        self._tokens: Optional[Tuple[str, ...]] = None
+        self._stop_flags: Optional[Tuple[bool, ...]] = None
+        self._terms: Optional[List[str]] = None
+        self._words: Optional[Tuple[str, ...]] = None
+        self._keywords: Optional[Tuple[str, ...]] = None
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        if self._tokens is None:
+            self._tokens = tuple(_TOKEN_RE.findall(self.text.lower()))
+        return self._tokens
+
+    @property
+    def stop_flags(self) -> Tuple[bool, ...]:
+        if self._stop_flags is None:
+            self._stop_flags = tuple(token in ENGLISH_STOP_WORDS for token in self.tokens)
+        return self._stop_flags
+
+    @property
+    def terms(self) -> List[str]:
+        if self._terms is None:
+            self._terms = [token for token, stop in zip(self.tokens, self.stop_flags)
+                           if not stop and len(token) > 1]
+        return self._terms
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        if self._words is None:
+            # Letters are word characters, so each letter run lies inside one token
+            self._words = tuple(word for token in self.tokens for word in _LETTERS_RE.findall(token))
+        return self._words
+
+    @property
+    def keywords(self) -> Tuple[str, ...]:
+        if self._keywords is None:
+            self._keywords = tuple(_KEYWORD_RE.findall(self.text))
+        return self._keywords
+
+    def clean(self, stop_words: set = None) -> str:
+        """
+        Letter-only words joined by single spaces, minus stop_words.
+        """
+        if stop_words:
+            return ' '.join(word for word in self.words if word not in stop_words)
+        return ' '.join(self.words)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def analyze(text: str) -> AnalyzedText:
+    """
+    Return the analysed form of a text, reusing it when the same text was
+    analysed recently (e.g. the resume scored by TF-IDF and then cleaned
+    for SBERT in one request).
+
+    Args:
+        text (str): Raw text
+
+    Returns:
+        AnalyzedText: Shared, lazily tokenized document
+    """
+    return AnalyzedText(text)
+
+
+def tfidf_terms(text: str) -> List[str]:
+    """
+    Analyzer for TfidfVectorizer/HashingVectorizer(analyzer=tfidf_terms).
+
+    Gives the same terms as the default word analyzer with
+    stop_words='english', from the shared token cache.
+    """
+    return analyze(text).terms
 
 
 def clean_text(text: str, stop_words: set = None) -> str:
@@ -39,20 +145,9 @@ def clean_text(text: str, stop_words: set = None) -> str:
     if not text:
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove special characters, keep only letters and spaces
-    text = re.sub(r'[^a-z\s]', ' ', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    # Remove stopwords if provided
-    if stop_words:
-        text = " ".join(word for word in text.split() if word not in stop_words)
-    
-    return text
+    # Lowercase letter-only words from the shared tokenization, with
+    # stopwords removed if provided
+    return analyze(text).clean(stop_words)
 
 
 def detect_formatting_risks(text: str) -> List[str]:
@@ -0,0 +1,179 @@
+"""
+Startup Warmup
+
+The first /parse on a fresh worker pays for lazy imports, regex
+compilation, pdfminer's font metrics and caches, the extraction sandbox's
+first fork and the first TF-IDF/SBERT inference, which shows up as p99
+spikes after every deploy. This module pays for them once at startup,
+before the worker reports itself ready:
+
+- Every sample resume in WARMUP_DIR (PDF and DOCX) is extracted in
+  process, so parser imports and pdfminer's caches live in the worker
+  and every forked extraction child inherits them
+- Each sample then goes through the full /parse pipeline, bypassing the
+  extracted text cache so a warm cache can't skip extraction, and the
+  first one through /parse-multi as well
+
+Warmup runs on a daemon thread started by create_app(). GET /ready
+answers 503 until it has finished and 200 afterwards; GET /health stays
+a pure liveness check. A sample that fails is logged and reported but
+does not keep the worker unready. The SBERT model warms itself before it
+is switched in (see services/similarity_backend.py), so warmup does not
+wait for it. Counters incremented while warming up are left out of
+/metrics, which reports real traffic only.
+
+It lives outside app.services because it drives the route pipeline.
+"""
+
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import WARMUP_DIR, WARMUP_ENABLED
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SUFFIXES = ('.pdf', '.docx')
+
+# Used when WARMUP_DIR has no job_descriptions.json
+_DEFAULT_JOB_DESCRIPTION = ('We are hiring a Backend Engineer with 3+ years of experience. '
+                            'Required skills: Python, SQL, Docker, AWS, REST APIs.')
+
+_state: Dict[str, Any] = {
+    'state': 'pending',
+    'startedAt': None,
+    'finishedAt': None,
+    'samples': [],
+    'errors': [],
+}
+_lock = threading.Lock()
+
+
+def load_samples(directory: str = WARMUP_DIR) -> Tuple[List[Tuple[str, bytes]], List[str]]:
+    """
+    Read the sample resumes and job descriptions of a warmup directory.
+
+    Returns:
+        Tuple containing:
+        - samples (List[Tuple[str, bytes]]): (filename, bytes) per resume
+        - job_descriptions (List[str]): At least one job description
+    """
+    samples = []
+    for path in sorted(glob.glob(os.path.join(directory, '*'))):
+        if path.lower().endswith(WARMUP_SUFFIXES):
+            with open(path, 'rb') as fh:
+                samples.append((os.path.basename(path), fh.read()))
+
+    job_descriptions = []
+    jd_path = os.path.join(directory, 'job_descriptions.json')
+    if os.path.isfile(jd_path):
+        with open(jd_path, encoding='utf-8') as fh:
+            job_descriptions = [jd for jd in json.load(fh) if isinstance(jd, str) and jd]
+    return samples, job_descriptions or [_DEFAULT_JOB_DESCRIPTION]
+
+
+def run_warmup(directory: str = WARMUP_DIR) -> Dict[str, Any]:
+    """
+    Push the samples of directory through extraction and the /parse and
+    /parse-multi pipelines, and mark the worker ready.
+
+    Returns:
+        dict: The warmup status (see describe_warmup())
+    """
+    from app.models.request_schema import JobDescriptionItem
+    from app.routes.score import _parse_and_score, _parse_and_score_multi
+    from app.services import metrics
+    from app.services.deadline import Deadline
+    from app.services.extraction_sandbox import extract_document
+
+    with _lock:
+        _state.update(state='running', startedAt=time.time(), finishedAt=None, samples=[], errors=[])
+    started = time.perf_counter()
+
+    try:
+        samples, job_descriptions = load_samples(directory)
+    except (OSError, ValueError) as e:
+        samples, job_descriptions = [], []
+        _state['errors'].append(f"{directory}: {e}")
+    if not samples and not _state['errors']:
+        _state['errors'].append(f"No PDF or DOCX samples in {directory}")
+
+    jd_items = [JobDescriptionItem(id=str(i), text=jd) for i, jd in enumerate(job_descriptions)]
+    for index, (filename, data) in enumerate(samples):
+        sample_started = time.perf_counter()
+        try:
+            with metrics.suppressed():
+                extract_document(data, filename)
+                result = _parse_and_score(data, filename, job_descriptions[0], None, Deadline(), use_cache=False)
+                if index == 0:
+                    _parse_and_score_multi(data, filename, jd_items, None, Deadline(), use_cache=False)
+            if result['parsingErrors']:
+                _state['errors'].append(f"{filename}: {'; '.join(result['parsingErrors'])}")
+        except Exception as e:
+            logger.exception("Warmup failed for %s", filename)
+            _state['errors'].append(f"{filename}: {e}")
+        _state['samples'].append({
+            'file': filename,
+            'ms': round((time.perf_counter() - sample_started) * 1000, 1),
+        })
+
+    with _lock:
+        _state.update(state='done', finishedAt=time.time())
+    logger.info("Warmup done in %.0f ms: %d sample(s), %d error(s)",
+                (time.perf_counter() - started) * 1000, len(samples), len(_state['errors']))
+    return describe_warmup()
+
+
+def _run_in_background(directory: str) -> None:
+    try:
+        run_warmup(directory)
+    except Exception as e:
+        # Never leave the worker unready because warmup itself broke
+        logger.exception("Warmup aborted")
+        with _lock:
+            _state['errors'].append(str(e))
+            _state.update(state='done', finishedAt=time.time())
+
+
+def start_warmup(directory: str = WARMUP_DIR, enabled: bool = WARMUP_ENABLED) -> Optional[threading.Thread]:
+    """
+    Start warmup on a daemon thread (once per process). With warmup
+    disabled (ATS_WARMUP=0) the worker is ready at once.
+
+    Returns:
+        threading.Thread: The warmup thread, or None if none was started
+    """
+    with _lock:
+        if _state['state'] != 'pending':
+            return None
+        if not enabled:
+            _state.update(state='disabled')
+            return None
+        _state['state'] = 'running'
+    thread = threading.Thread(target=_run_in_background, args=(directory,), name='warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def is_ready() -> bool:
+    """
+    Whether warmup has finished (or is disabled).
+    """
+    return _state['state'] in ('done', 'disabled')
+
+
+def describe_warmup() -> Dict[str, Any]:
+    """
+    The warmup status, for GET /ready.
+    """
+    with _lock:
+        return {
+            'ready': is_ready(),
+            **_state,
+            'samples': list(_state['samples']),
+            'errors': list(_state['errors']),
+        }
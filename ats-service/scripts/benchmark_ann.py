@@ -0,0 +1,85 @@
+"""
+ANN Index Benchmark
+
+Measures recall@k and query latency of the IVF index against exact
+(brute-force) search, for a range of n_probe values.
+
+Uses the stored index when one exists (--index), otherwise a synthetic
+clustered corpus shaped like all-MiniLM-L6-v2 embeddings (384-d).
+
+Usage (from the ats-service/ directory):
+    python scripts/benchmark_ann.py --n 50000 --queries 200 --k 10
+    python scripts/benchmark_ann.py --index .cache/resume_ann_index.npz
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.ann_index import IVFIndex
+
+
+def synthetic_index(n, dim, n_lists, seed):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(8, n // 500), dim))
+    vectors = centers[rng.integers(0, centers.shape[0], n)] + 0.6 * rng.normal(size=(n, dim))
+    index = IVFIndex(dim, n_lists)
+    index.add([f'r{i}' for i in range(n)], vectors)
+    index.train(vectors[rng.choice(n, size=min(n, 20000), replace=False)])
+    queries = centers[rng.integers(0, centers.shape[0], 1000)] + 0.6 * rng.normal(size=(1000, dim))
+    return index, queries
+
+
+def percentile_ms(samples, p):
+    return round(float(np.percentile(samples, p)) * 1000, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ANN recall and latency')
+    parser.add_argument('--index', help='Existing index file (default: synthetic corpus)')
+    parser.add_argument('--n', type=int, default=50000, help='Synthetic corpus size')
+    parser.add_argument('--dim', type=int, default=384, help='Synthetic embedding size')
+    parser.add_argument('--n-lists', type=int, default=128, help='Synthetic index lists')
+    parser.add_argument('--queries', type=int, default=200, help='Queries to run')
+    parser.add_argument('--k', type=int, default=10, help='Neighbours per query')
+    parser.add_argument('--probes', default='1,2,4,8,16,32', help='Comma-separated n_probe values')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.index:
+        index = IVFIndex.load(args.index)
+        rng = np.random.default_rng(args.seed)
+        queries = index.stored_vectors()
+        queries = queries[rng.choice(queries.shape[0], size=min(1000, queries.shape[0]), replace=False)]
+        queries = queries + 0.05 * rng.normal(size=queries.shape)
+    else:
+        index, queries = synthetic_index(args.n, args.dim, args.n_lists, args.seed)
+    queries = queries[:args.queries]
+
+    exact, exact_times = [], []
+    for q in queries:
+        start = time.perf_counter()
+        exact.append({i for i, _ in index.exact_search(q, args.k)})
+        exact_times.append(time.perf_counter() - start)
+    print(f'vectors={len(index)} lists={index.n_lists} k={args.k} queries={len(queries)}')
+    print(f'exact       p50={percentile_ms(exact_times, 50)}ms p95={percentile_ms(exact_times, 95)}ms')
+
+    for n_probe in (int(p) for p in args.probes.split(',')):
+        hits, times = 0, []
+        for q, truth in zip(queries, exact):
+            start = time.perf_counter()
+            found = index.search(q, args.k, n_probe)
+            times.append(time.perf_counter() - start)
+            hits += len(truth & {i for i, _ in found})
+        recall = hits / max(1, sum(len(t) for t in exact))
+        print(f'n_probe={n_probe:<4} recall@{args.k}={recall:.3f} '
+              f'p50={percentile_ms(times, 50)}ms p95={percentile_ms(times, 95)}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Chunked SBERT Encoding Benchmark
+
+Scores long synthetic resumes (several resumes joined, like a multi-page
+CV) against a job description with the old whole-text encode and with
+section chunks (app/services/chunked_encoding.py), and reports:
+
+- single: one resume per call, as /parse does
+- bulk: all resumes in one encode call (whole texts vs all their chunks)
+- coverage: share of each resume's word pieces the model actually reads
+
+Usage (from the ats-service/ directory):
+    python scripts/benchmark_chunked_encoding.py --n 200 --repeat 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_corpus import make_corpus, make_job_description
+from app.services.chunked_encoding import POOLING_MODES, chunk_resume, chunked_relevance, encode_sorted
+from app.utils.text_cleaner import clean_text
+
+
+def whole_text_scores(resumes, jd, model):
+    jd_embedding = model.encode([clean_text(jd)], normalize_embeddings=True)[0]
+    return [float(model.encode([clean_text(text)], normalize_embeddings=True)[0] @ jd_embedding)
+            for text in resumes]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def coverage(texts, model):
+    """
+    Mean share of word pieces within the model's max_seq_length.
+    """
+    limit = getattr(model, 'max_seq_length', 256)
+    tokenizer = getattr(model, 'tokenizer', None)
+    shares = []
+    for text in texts:
+        pieces = len(tokenizer.tokenize(text)) if tokenizer is not None else len(text.split())
+        shares.append(min(1.0, limit / pieces) if pieces else 1.0)
+    return float(np.mean(shares))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark section-chunked vs whole-text SBERT encoding')
+    parser.add_argument('--n', type=int, default=200, help='Resumes to score')
+    parser.add_argument('--repeat', type=int, default=3, help='Synthetic resumes joined into each long resume')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='SentenceTransformer model name')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(args.model)
+
+    pool = make_corpus(args.n * args.repeat, seed=args.seed)
+    resumes = ['\n\n'.join(pool[i:i + args.repeat]) for i in range(0, len(pool), args.repeat)]
+    jd = make_job_description(random.Random(args.seed), long=True)
+    model.encode(['warm up'])
+
+    cleaned = [clean_text(text) for text in resumes]
+    chunks = [chunk_resume(text) for text in resumes]
+    chunk_texts = [c.text for resume in chunks for c in resume]
+    print(f'n={args.n} repeat={args.repeat} words/resume={np.mean([len(t.split()) for t in cleaned]):.0f} '
+          f'chunks/resume={len(chunk_texts) / args.n:.1f}')
+    print(f'coverage  whole-text={coverage(cleaned, model):.2f}  chunked={coverage(chunk_texts, model):.2f}')
+
+    whole_time, whole = timed(lambda: whole_text_scores(resumes, jd, model))
+    print(f'single    whole-text  {args.n / whole_time:7.1f} resumes/s')
+    for pooling in POOLING_MODES:
+        seconds, scores = timed(lambda: [chunked_relevance(text, [jd], model, pooling=pooling)[0][0]
+                                         for text in resumes])
+        rho = np.corrcoef(whole, scores)[0, 1]
+        print(f'single    {pooling:<11} {args.n / seconds:7.1f} resumes/s  corr(whole-text)={rho:.3f}')
+
+    seconds, _ = timed(lambda: model.encode(cleaned, normalize_embeddings=True))
+    print(f'bulk      whole-text  {args.n / seconds:7.1f} resumes/s')
+    seconds, _ = timed(lambda: encode_sorted(chunk_texts, model))
+    print(f'bulk      chunked     {args.n / seconds:7.1f} resumes/s')
+
+
+if __name__ == '__main__':
+    main()
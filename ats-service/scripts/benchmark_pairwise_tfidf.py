@@ -0,0 +1,69 @@
+"""
+Pairwise TF-IDF Benchmark
+
+Measures the latency of one resume/JD similarity with the lightweight
+Counter-based path (compute_relevance_tfidf) against the sklearn path
+(compute_relevance_tfidf_sklearn), for short and full-length texts, and
+checks that both give the same values.
+
+Tokenization is shared and cached per text; by default the cache is
+cleared before every call so each measurement includes tokenizing both
+texts, as for a newly uploaded resume. --warm keeps the cache.
+
+Usage (from the ats-service/ directory):
+    python scripts/benchmark_pairwise_tfidf.py --pairs 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_corpus import make_corpus
+from app.services.scoring_engine import compute_relevance_tfidf, compute_relevance_tfidf_sklearn
+from app.utils.text_cleaner import analyze
+
+
+def percentile_us(samples, p):
+    return round(float(np.percentile(samples, p)) * 1e6, 1)
+
+
+def measure(fn, pairs, warm):
+    times, values = [], []
+    for resume, jd in pairs:
+        if not warm:
+            analyze.cache_clear()
+        start = time.perf_counter()
+        values.append(fn(resume, jd))
+        times.append(time.perf_counter() - start)
+    return times, np.array(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pairwise TF-IDF similarity')
+    parser.add_argument('--pairs', type=int, default=500, help='Pairs per text length')
+    parser.add_argument('--warm', action='store_true', help='Keep the token cache between calls')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(200, seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    full = [(corpus[i], corpus[j]) for i, j in rng.integers(0, len(corpus), size=(args.pairs, 2))]
+    short = [(resume[:300], jd[:200]) for resume, jd in full]
+
+    for label, pairs in (('short', short), ('full', full)):
+        light_times, light = measure(compute_relevance_tfidf, pairs, args.warm)
+        sk_times, sk = measure(compute_relevance_tfidf_sklearn, pairs, args.warm)
+        print(f'{label:<5} pairs={len(pairs)} max|diff|={np.abs(light - sk).max():.1e}')
+        print(f'  sklearn      p50={percentile_us(sk_times, 50)}us p95={percentile_us(sk_times, 95)}us')
+        print(f'  lightweight  p50={percentile_us(light_times, 50)}us p95={percentile_us(light_times, 95)}us '
+              f'({np.median(sk_times) / np.median(light_times):.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
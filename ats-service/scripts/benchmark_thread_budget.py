@@ -0,0 +1,89 @@
+"""
+Thread Budget Benchmark
+
+Runs the same CPU-bound scoring workload (BLAS matrix products, like SBERT
+scoring, plus a TF-IDF ranking pass) in several worker processes at once,
+first with every native pool left at its default (one thread per core),
+then with the per-worker budget from app/thread_budget.py. Reports the
+combined throughput of each run.
+
+On a single-core host both runs are the same; the gap grows with cores x
+workers, which is where the default oversubscribes.
+
+Usage (from the ats-service/ directory):
+    python scripts/benchmark_thread_budget.py --workers 4 --duration 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+_THREAD_ENV = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'BLIS_NUM_THREADS',
+               'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS', 'RAYON_NUM_THREADS',
+               'TOKENIZERS_PARALLELISM')
+
+
+def child(duration: float, budgeted: bool) -> None:
+    # Must run before NumPy is imported for the env limits to apply
+    if budgeted:
+        from app.thread_budget import apply_thread_budget
+        apply_thread_budget()
+
+    import numpy as np
+    sys.path.insert(0, os.path.dirname(__file__))
+    from synthetic_corpus import make_corpus
+    from app.services.ranking import relevance_scores_tfidf
+
+    rng = np.random.default_rng(os.getpid())
+    embeddings = rng.normal(size=(2000, 384)).astype(np.float32)
+    queries = rng.normal(size=(384, 256)).astype(np.float32)
+    corpus = make_corpus(200)
+
+    ops = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        embeddings @ queries
+        relevance_scores_tfidf(corpus[ops % len(corpus)], corpus)
+        ops += 1
+    print(json.dumps({'ops': ops}))
+
+
+def run(workers: int, duration: float, budgeted: bool) -> float:
+    env = {k: v for k, v in os.environ.items() if k not in _THREAD_ENV}
+    env['ATS_WORKERS'] = str(workers)
+    cmd = [sys.executable, __file__, '--child', '--duration', str(duration)]
+    if budgeted:
+        cmd.append('--budgeted')
+    procs = [subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, text=True) for _ in range(workers)]
+    total = sum(json.loads(p.communicate()[0].strip().splitlines()[-1])['ops'] for p in procs)
+    return total / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-worker thread budgets')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent worker processes')
+    parser.add_argument('--duration', type=float, default=20.0, help='Seconds per run')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--budgeted', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.duration, args.budgeted)
+        return
+
+    from app.thread_budget import compute_thread_budget
+    budget = compute_thread_budget(workers=args.workers)
+    print(f'cpus={budget.cpus} workers={args.workers} budget={budget.threads} thread(s)/pool')
+    default = run(args.workers, args.duration, budgeted=False)
+    print(f'default   {default:8.2f} ops/s')
+    budgeted = run(args.workers, args.duration, budgeted=True)
+    print(f'budgeted  {budgeted:8.2f} ops/s  ({budgeted / default:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Two-Stage Ranking Benchmark
+
+Ranks a synthetic resume pool against job descriptions exhaustively with
+SBERT, then two-stage (TF-IDF top-M re-ranked with SBERT) for a range of
+M values, and reports per-query latency and the overlap of each top-k
+with the exhaustive SBERT top-k.
+
+By default resumes are encoded per query, as /rank does for inline
+resumes. --stored-fraction precomputes embeddings for part of the pool,
+as for resumes in the embedding store. Those are never re-encoded, and
+the prefilter is skipped once at most M resumes are left to encode
+(exhaustive SBERT is then cheaper than the TF-IDF pass).
+
+Usage (from the ats-service/ directory):
+    python scripts/benchmark_two_stage.py --n 2000 --queries 20 --k 10 --m 50,100,200,500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_corpus import make_corpus, make_job_description
+from app.services.ranking import embed_resumes, rank_resumes
+
+
+def percentile_ms(samples, p):
+    return round(float(np.percentile(samples, p)) * 1000, 1)
+
+
+def run(jds, corpus, k, model, prefilter, lookup):
+    times, results, method = [], [], None
+    for jd in jds:
+        start = time.perf_counter()
+        ranked, method = rank_resumes(jd, corpus, k, model, True, prefilter=prefilter, lookup=lookup)
+        times.append(time.perf_counter() - start)
+        results.append([index for index, _ in ranked])
+    return times, results, method
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark two-stage TF-IDF -> SBERT ranking')
+    parser.add_argument('--n', type=int, default=2000, help='Resumes in the pool')
+    parser.add_argument('--queries', type=int, default=20, help='Job descriptions to rank against')
+    parser.add_argument('--k', type=int, default=10, help='Results per query')
+    parser.add_argument('--m', default='50,100,200,500', help='Comma-separated prefilter sizes')
+    parser.add_argument('--stored-fraction', type=float, default=0.0,
+                        help='Share of the pool with precomputed embeddings')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='SentenceTransformer model name')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(args.model)
+
+    corpus = make_corpus(args.n, seed=args.seed)
+    rng = random.Random(args.seed)
+    jds = [make_job_description(rng) for _ in range(args.queries)]
+
+    lookup = None
+    stored_count = int(args.n * args.stored_fraction)
+    if stored_count:
+        stored = embed_resumes(corpus[:stored_count], model)
+        lookup = lambda indices: {i: stored[i] for i in indices if i < stored_count}
+
+    exact_times, exact, _ = run(jds, corpus, args.k, model, 0, lookup)
+    print(f'n={args.n} queries={args.queries} k={args.k} stored={stored_count}')
+    print(f'exhaustive SBERT    p50={percentile_ms(exact_times, 50)}ms p95={percentile_ms(exact_times, 95)}ms')
+
+    for m in (int(value) for value in args.m.split(',')):
+        times, results, method = run(jds, corpus, args.k, model, m, lookup)
+        overlap = np.mean([len(set(a) & set(b)) / len(b) for a, b in zip(results, exact) if b])
+        print(f'prefilter M={m:<5}  p50={percentile_ms(times, 50)}ms p95={percentile_ms(times, 95)}ms '
+              f'({np.median(exact_times) / np.median(times):.1f}x) overlap@{args.k}={overlap:.3f} [{method}]')
+
+
+if __name__ == '__main__':
+    main()
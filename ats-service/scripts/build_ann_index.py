@@ -0,0 +1,98 @@
+"""
+Build / Update the Resume ANN Index
+
+Encodes stored resumes with SBERT and writes the IVF index used by
+POST /nearest-resumes (see app/services/ann_index.py). Running workers
+pick up the new file automatically.
+
+Embeddings are kept in the shared embedding store (see
+app/services/embedding_store.py), so a rebuild only has to encode resumes
+that have no stored embedding yet; /parse also stores embeddings for
+resumes it sees while SBERT is enabled.
+
+Requires sentence-transformers.
+
+Usage (from the ats-service/ directory):
+    # Full rebuild: retrain the quantizer over every stored embedding
+    python scripts/build_ann_index.py
+
+    # Incremental: add resumes missing from the index and drop ids that
+    # are no longer in the resume store
+    python scripts/build_ann_index.py --update
+
+    # Re-encode every resume (e.g. after changing --model)
+    python scripts/build_ann_index.py --reencode
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.config import ANN_INDEX_PATH, ANN_N_LISTS
+from app.services.ann_index import IVFIndex
+from app.services.embedding_store import get_embedding_store
+from app.services.ranking import embed_resumes
+from app.services.resume_store import get_resume_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the resume ANN index')
+    parser.add_argument('--update', action='store_true', help='Only add new / remove stale resumes')
+    parser.add_argument('--reencode', action='store_true', help='Re-encode resumes that already have embeddings')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='SentenceTransformer model name')
+    parser.add_argument('--block-size', type=int, default=256, help='Resumes encoded per batch')
+    parser.add_argument('--output', default=ANN_INDEX_PATH, help='Index file to write')
+    args = parser.parse_args()
+
+    store = get_resume_store()
+    embeddings = get_embedding_store()
+
+    resume_ids = set(store.all_ids())
+    stale = [i for i in embeddings.ids() if i not in resume_ids]
+    if stale:
+        print(f'Dropping {embeddings.delete(stale)} stale embedding(s)')
+
+    # Step 1: encode resumes without a stored embedding
+    embedded = set() if args.reencode else set(embeddings.ids())
+    model = None
+    for ids, texts in store.iter_blocks(args.block_size):
+        pending = [(i, t) for i, t in zip(ids, texts) if i not in embedded]
+        if not pending:
+            continue
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(args.model)
+        embeddings.put([p[0] for p in pending], embed_resumes([p[1] for p in pending], model))
+        print(f'Encoded {len(pending)} resume(s)')
+
+    if not len(embeddings):
+        print('Resume store is empty — nothing to index')
+        return
+
+    # Step 2: build the index from the embedding store
+    index = None
+    if args.update and os.path.exists(args.output):
+        index = IVFIndex.load(args.output)
+        removed = index.remove([i for i in index.ids() if i not in resume_ids])
+        print(f'Removed {removed} stale resume(s) from the index')
+
+    for ids, vectors in embeddings.iter_blocks(args.block_size * 16):
+        if index is None:
+            index = IVFIndex(vectors.shape[1], ANN_N_LISTS)
+        if args.update and not args.reencode:
+            keep = [n for n, i in enumerate(ids) if i not in index]
+            ids, vectors = [ids[n] for n in keep], vectors[keep]
+        if ids:
+            index.add(ids, vectors)
+
+    if not index.is_trained or not args.update:
+        index.train(index.stored_vectors())
+
+    index.save(args.output)
+    print(f'Wrote {len(index)} vector(s) to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
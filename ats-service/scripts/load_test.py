@@ -0,0 +1,283 @@
+"""
+ATS Service Load Test
+
+Launches the service locally with uvicorn for each requested worker
+count and drives /parse, /similarity and /health concurrently through an
+async HTTP client (httpx), using the synthetic resume corpus from
+scripts/synthetic_corpus.py.
+
+Per worker count it reports throughput, p50/p95/p99 latency and error
+rate (overall and per endpoint) plus the CPU used by the server process
+tree during the measured window (Linux /proc; null elsewhere). Results
+are written as JSON so runs can be compared.
+
+Usage (from the ats-service/ directory):
+    python scripts/load_test.py --workers 1,2,4 --duration 30 --concurrency 32
+
+    # Mostly parsing, long job descriptions only
+    python scripts/load_test.py --mix parse=8,similarity=1,health=1 --jd-mix long=1
+
+    # Against an already running service (no launch, no CPU numbers)
+    python scripts/load_test.py --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_corpus import make_corpus, make_job_description, render_docx, render_pdf
+
+SERVICE_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def parse_weights(spec: str, allowed) -> Dict[str, float]:
+    weights = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        if name not in allowed:
+            raise SystemExit(f'Unknown mix entry {name!r} (expected one of {", ".join(allowed)})')
+        weights[name] = float(weight or 1)
+    return weights
+
+
+# ── Server process ─────────────────────────────────────────────────
+
+def launch_server(workers: int, port: int, log_path: str) -> subprocess.Popen:
+    cmd = [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1',
+           '--port', str(port), '--workers', str(workers), '--log-level', 'warning']
+    with open(log_path, 'ab') as log:
+        return subprocess.Popen(cmd, cwd=SERVICE_DIR, stdout=log, stderr=subprocess.STDOUT)
+
+
+async def wait_until_healthy(url: str, timeout: float = 180.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f'{url}/health', timeout=2.0)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f'Service at {url} did not become healthy within {timeout:.0f}s')
+
+
+def process_tree_cpu(pid: int) -> Optional[float]:
+    """
+    CPU seconds (user + system) used so far by pid and its descendants.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    ticks = os.sysconf('SC_CLK_TCK')
+    total, pending = 0.0, [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/stat') as fh:
+                fields = fh.read().rsplit(')', 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / ticks
+            with open(f'/proc/{current}/task/{current}/children') as fh:
+                pending.extend(int(c) for c in fh.read().split())
+        except OSError:
+            continue
+    return total
+
+
+# ── Load generation ────────────────────────────────────────────────
+
+class Workload:
+    """
+    Pre-rendered request payloads, picked at random per request.
+    """
+
+    def __init__(self, corpus_size: int, jd_mix: Dict[str, float], seed: int):
+        self.rng = random.Random(seed)
+        self.texts = make_corpus(corpus_size, seed)
+        self.files = []
+        for i, text in enumerate(self.texts):
+            if i % 2:
+                self.files.append((f'resume_{i}.docx', render_docx(text),
+                                   'application/vnd.openxmlformats-officedocument.wordprocessingml.document'))
+            else:
+                self.files.append((f'resume_{i}.pdf', render_pdf(text), 'application/pdf'))
+        jd_rng = random.Random(seed + 1)
+        self.jds = {
+            'none': [None],
+            'short': [make_job_description(jd_rng) for _ in range(20)],
+            'long': [make_job_description(jd_rng, long=True) for _ in range(20)],
+        }
+        self.jd_kinds = list(jd_mix)
+        self.jd_weights = list(jd_mix.values())
+
+    def job_description(self) -> Optional[str]:
+        kind = self.rng.choices(self.jd_kinds, self.jd_weights)[0]
+        return self.rng.choice(self.jds[kind])
+
+
+async def send_request(client: httpx.AsyncClient, endpoint: str, workload: Workload) -> int:
+    if endpoint == 'health':
+        response = await client.get('/health')
+    elif endpoint == 'parse':
+        name, data, mime = workload.rng.choice(workload.files)
+        form = {}
+        jd = workload.job_description()
+        if jd:
+            form['job_description'] = jd
+        response = await client.post('/parse', files={'file': (name, data, mime)}, data=form)
+    else:
+        jd = workload.job_description() or workload.jds['short'][0]
+        response = await client.post('/similarity', data={'resume_text': workload.rng.choice(workload.texts),
+                                                          'job_description': jd})
+    return response.status_code
+
+
+async def run_load(url: str, workload: Workload, mix: Dict[str, float],
+                   concurrency: int, duration: float, warmup: float,
+                   on_measure_start=None) -> Dict[str, List]:
+    endpoints, weights = list(mix), list(mix.values())
+    samples: Dict[str, List] = {name: [] for name in endpoints}
+    start = time.monotonic()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+
+    async def user(client: httpx.AsyncClient):
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            endpoint = workload.rng.choices(endpoints, weights)[0]
+            began = time.perf_counter()
+            try:
+                status = await send_request(client, endpoint, workload)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latency = time.perf_counter() - began
+            if now >= measure_from:
+                samples[endpoint].append((latency, status))
+
+    async def clock():
+        await asyncio.sleep(warmup)
+        if on_measure_start:
+            on_measure_start()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=120.0, limits=limits) as client:
+        await asyncio.gather(clock(), *(user(client) for _ in range(concurrency)))
+    return samples
+
+
+def summarise(samples: List, duration: float) -> Dict:
+    latencies = np.array([s[0] for s in samples]) * 1000
+    errors = sum(1 for _, status in samples if status != 200)
+    if not samples:
+        return {'requests': 0, 'errors': 0, 'error_rate': 0.0, 'throughput_rps': 0.0}
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4),
+        'throughput_rps': round(len(samples) / duration, 2),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 1),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 1),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 1),
+    }
+
+
+async def measure(args, workers: Optional[int], workload: Workload, mix: Dict[str, float]) -> Dict:
+    server = None
+    url = args.url
+    if url is None:
+        server = launch_server(workers, args.port, args.server_log)
+        url = f'http://127.0.0.1:{args.port}'
+    try:
+        await wait_until_healthy(url)
+        cpu = {}
+
+        def mark_start():
+            cpu['start'] = process_tree_cpu(server.pid) if server else None
+            cpu['wall'] = time.monotonic()
+
+        samples = await run_load(url, workload, mix, args.concurrency, args.duration,
+                                 args.warmup, on_measure_start=mark_start)
+        wall = time.monotonic() - cpu['wall']
+        cpu_end = process_tree_cpu(server.pid) if server else None
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=60)
+
+    every = [s for endpoint_samples in samples.values() for s in endpoint_samples]
+    result = {
+        'workers': workers,
+        'overall': summarise(every, wall),
+        'endpoints': {name: summarise(s, wall) for name, s in samples.items()},
+        'cpu_seconds': None,
+        'cpu_cores_used': None,
+    }
+    if cpu.get('start') is not None and cpu_end is not None:
+        result['cpu_seconds'] = round(cpu_end - cpu['start'], 2)
+        result['cpu_cores_used'] = round((cpu_end - cpu['start']) / wall, 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the ATS service')
+    parser.add_argument('--workers', default='1,2', help='Comma-separated uvicorn worker counts')
+    parser.add_argument('--url', help='Target an already running service instead of launching one')
+    parser.add_argument('--port', type=int, default=8765, help='Port for the launched service')
+    parser.add_argument('--duration', type=float, default=30.0, help='Measured seconds per run')
+    parser.add_argument('--warmup', type=float, default=5.0, help='Unmeasured seconds before each run')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent simulated clients')
+    parser.add_argument('--mix', default='parse=6,similarity=3,health=1', help='Endpoint weights')
+    parser.add_argument('--jd-mix', default='none=1,short=2,long=2', help='Job description weights')
+    parser.add_argument('--corpus-size', type=int, default=50, help='Synthetic resumes to cycle through')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--server-log', default=os.path.join('.cache', 'loadtest', 'server.log'),
+                        help='Where the launched service writes its logs')
+    parser.add_argument('--output', help='JSON results file (default: .cache/loadtest/<timestamp>.json)')
+    args = parser.parse_args()
+
+    mix = parse_weights(args.mix, ('parse', 'similarity', 'health'))
+    jd_mix = parse_weights(args.jd_mix, ('none', 'short', 'long'))
+    workload = Workload(args.corpus_size, jd_mix, args.seed)
+    os.makedirs(os.path.dirname(args.server_log) or '.', exist_ok=True)
+    worker_counts = [None] if args.url else [int(w) for w in args.workers.split(',')]
+
+    runs = []
+    for workers in worker_counts:
+        result = asyncio.run(measure(args, workers, workload, mix))
+        overall = result['overall']
+        print(f"workers={workers or '?'} rps={overall['throughput_rps']} "
+              f"p50={overall.get('p50_ms')}ms p95={overall.get('p95_ms')}ms p99={overall.get('p99_ms')}ms "
+              f"errors={overall['error_rate']:.2%} cpu_cores={result['cpu_cores_used']}")
+        runs.append(result)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'host': {'platform': platform.platform(), 'python': platform.python_version(), 'cpus': os.cpu_count()},
+        'config': {key: getattr(args, key) for key in
+                   ('url', 'duration', 'warmup', 'concurrency', 'corpus_size', 'seed')},
+        'mix': mix,
+        'jd_mix': jd_mix,
+        'runs': runs,
+    }
+    output = args.output or os.path.join('.cache', 'loadtest', time.strftime('%Y%m%dT%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as fh:
+        json.dump(report, fh, indent=2)
+    print(f'Wrote results to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Similarity Matrix CLI
+
+Computes TF-IDF relevance for every resume against every job description
+in bounded memory (see app/services/similarity_matrix.py).
+
+Inputs are JSON Lines files with one {"id": ..., "text": ...} object per
+line. Resumes default to everything in the service's resume store.
+
+Usage (from the ats-service/ directory):
+    # Top 20 resumes per JD, one JSON line per JD
+    python scripts/similarity_matrix.py --jds jds.jsonl --top-k 20 > top.jsonl
+
+    # Full matrix as a compressed sparse .npz (+ .ids.json sidecar)
+    python scripts/similarity_matrix.py --jds jds.jsonl --resumes resumes.jsonl \\
+        --matrix-out scores.npz --min-score 0.05
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.resume_store import get_resume_store
+from app.services.similarity_matrix import (
+    DEFAULT_BLOCK_SIZE,
+    top_k_per_jd,
+    similarity_matrix,
+    save_similarity_matrix,
+)
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def jsonl_blocks(path, block_size):
+    """Stream (ids, texts) blocks from a JSON Lines file."""
+    def blocks():
+        ids, texts = [], []
+        with open(path, encoding='utf-8') as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                ids.append(str(item['id']))
+                texts.append(item['text'])
+                if len(ids) >= block_size:
+                    yield ids, texts
+                    ids, texts = [], []
+        if ids:
+            yield ids, texts
+    return blocks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JD x resume TF-IDF similarity matrix')
+    parser.add_argument('--jds', required=True, help='JSON Lines file of job descriptions')
+    parser.add_argument('--resumes', help='JSON Lines file of resumes (default: resume store)')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+                        help='Resumes held in memory at once')
+    parser.add_argument('--top-k', type=int, default=10, help='Matches per JD (top-k mode)')
+    parser.add_argument('--matrix-out', help='Write the full sparse matrix to this .npz instead')
+    parser.add_argument('--min-score', type=float, default=0.0,
+                        help='Drop scores at or below this from the matrix')
+    args = parser.parse_args()
+
+    jds = read_jsonl(args.jds)
+    jd_ids = [str(jd['id']) for jd in jds]
+    jd_texts = [jd['text'] for jd in jds]
+
+    if args.resumes:
+        blocks = jsonl_blocks(args.resumes, args.block_size)
+    else:
+        store = get_resume_store()
+        blocks = lambda: store.iter_blocks(args.block_size)
+
+    if args.matrix_out:
+        matrix, resume_ids = similarity_matrix(jd_texts, blocks, args.min_score)
+        save_similarity_matrix(args.matrix_out, matrix, jd_ids, resume_ids)
+        return
+
+    for jd_id, matches in zip(jd_ids, top_k_per_jd(jd_texts, blocks, args.top_k)):
+        print(json.dumps({
+            'jdId': jd_id,
+            'matches': [{'id': rid, 'score': score} for rid, score in matches]
+        }))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Synthetic Resume Corpus
+
+Generates realistic-looking (but entirely fake) resumes and job
+descriptions for benchmarks and load tests, so no real candidate data is
+needed. Resumes can be rendered as plain text, DOCX (python-docx) or PDF
+(a minimal hand-written PDF using the built-in Helvetica font, which
+pdfminer extracts like any text PDF).
+
+Usage (from the ats-service/ directory):
+    # Write 200 resumes (PDF + DOCX) and 20 job descriptions
+    python scripts/synthetic_corpus.py --out .cache/corpus --n 200 --jds 20
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+from typing import List
+
+FIRST_NAMES = ['Alex', 'Priya', 'Jordan', 'Wei', 'Maria', 'Samuel', 'Aisha', 'Noah', 'Elena', 'Ravi']
+LAST_NAMES = ['Sharma', 'Nguyen', 'Garcia', 'Smith', 'Okafor', 'Kim', 'Patel', 'Muller', 'Rossi', 'Chen']
+DEGREES = ['B.Tech in Computer Science', 'Bachelor of Science in Information Technology',
+           'M.Tech in Software Engineering', 'Master of Science in Data Science',
+           'Diploma in Electronics', 'PhD in Computer Science', 'B.E. in Mechanical Engineering']
+SCHOOLS = ['IIT Delhi', 'NIT Trichy', 'Stanford University', 'State University', 'MIT',
+           'University of Toronto', 'Community College']
+COMPANIES = ['Google', 'Microsoft', 'Infosys', 'Acme Corp', 'Amazon', 'a fintech startup',
+             'TCS', 'Globex', 'Flipkart', 'Initech']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Analyst', 'Backend Developer',
+          'Frontend Developer', 'ML Engineer', 'DevOps Engineer', 'Tech Lead', 'Intern']
+SKILLS = ['Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Node.js', 'SQL', 'PostgreSQL',
+          'MongoDB', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'Django', 'FastAPI', 'Flask',
+          'TensorFlow', 'PyTorch', 'Pandas', 'Git', 'Linux', 'Redis', 'Kafka', 'GraphQL',
+          'C++', 'Go', 'Rust', 'Spark', 'Tableau', 'Figma']
+VERBS = ['Developed', 'Led', 'Designed', 'Implemented', 'Built', 'Optimized', 'Automated',
+         'Migrated', 'Launched', 'Improved', 'Reduced', 'Managed']
+OBJECTS = ['a payments API', 'the data pipeline', 'an internal dashboard', 'CI/CD workflows',
+           'a recommendation service', 'the search backend', 'a mobile onboarding flow',
+           'monitoring and alerting', 'a microservices platform', 'ETL jobs']
+IMPACTS = ['reducing latency by {n}%', 'serving {n}k daily users', 'cutting costs by {n}%',
+           'improving conversion by {n}%', 'saving {n} hours per week']
+
+JD_ROLES = ['Backend Engineer', 'Data Scientist', 'Full Stack Developer', 'DevOps Engineer',
+            'Machine Learning Engineer', 'Frontend Engineer']
+
+
+def make_resume_text(rng: random.Random) -> str:
+    """
+    Return one synthetic resume as plain text with the usual sections.
+    """
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    handle = name.lower().replace(' ', '')
+    lines = [
+        name,
+        f'{handle}@example.com | +1-555-{rng.randint(1000, 9999)} | linkedin.com/in/{handle} | github.com/{handle}',
+        '',
+        'Education',
+    ]
+    for _ in range(rng.randint(1, 2)):
+        year = rng.randint(2008, 2023)
+        lines.append(f'{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)} ({year - 4} - {year})')
+
+    lines += ['', 'Experience']
+    year = 2024
+    for _ in range(rng.randint(1, 4)):
+        start = year - rng.randint(1, 4)
+        lines.append(f'{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({start} - {year})')
+        for _ in range(rng.randint(2, 5)):
+            impact = rng.choice(IMPACTS).format(n=rng.randint(5, 80))
+            lines.append(f'- {rng.choice(VERBS)} {rng.choice(OBJECTS)}, {impact}')
+        year = start
+
+    lines += ['', 'Skills', ', '.join(rng.sample(SKILLS, rng.randint(5, 14)))]
+
+    lines += ['', 'Projects']
+    for _ in range(rng.randint(0, 3)):
+        tech = ', '.join(rng.sample(SKILLS, 3))
+        lines.append(f'- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {tech} '
+                     f'(github.com/{handle}/project{rng.randint(1, 99)})')
+    return '\n'.join(lines)
+
+
+def make_job_description(rng: random.Random, long: bool = False) -> str:
+    """
+    Return one synthetic job description; long ones add duties and perks.
+    """
+    role = rng.choice(JD_ROLES)
+    must = ', '.join(rng.sample(SKILLS, 5))
+    text = (f'We are hiring a {role} with {rng.randint(1, 8)}+ years of experience. '
+            f'Required skills: {must}.')
+    if long:
+        nice = ', '.join(rng.sample(SKILLS, 4))
+        duties = ' '.join(f'{rng.choice(VERBS)} {rng.choice(OBJECTS)}.' for _ in range(8))
+        text += (f' Nice to have: {nice}. Responsibilities: {duties} '
+                 'You will work with product, design and data teams, mentor junior engineers, '
+                 'and own services end to end in production. We offer remote-friendly hours, '
+                 'learning budget and health cover.')
+    return text
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(text: str, lines_per_page: int = 60) -> bytes:
+    """
+    Render text as a minimal multi-page PDF (Helvetica, one line per row).
+    """
+    lines = text.split('\n')
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects = {1: b'<< /Type /Catalog /Pages 2 0 R >>',
+               3: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'}
+    kids = []
+    for n, page_lines in enumerate(pages):
+        page_obj, content_obj = 4 + 2 * n, 5 + 2 * n
+        kids.append(f'{page_obj} 0 R')
+        body = ''.join(f'({_pdf_escape(line)}) Tj T*\n' for line in page_lines)
+        stream = f'BT /F1 10 Tf 12 TL 50 800 Td\n{body}ET'.encode('latin-1')
+        objects[page_obj] = (f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                             f'/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj} 0 R >>').encode()
+        objects[content_obj] = b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream)
+    objects[2] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {len(kids)} >>'.encode()
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = out.tell()
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (number, objects[number]))
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for number in sorted(objects):
+        out.write(b'%010d 00000 n \n' % offsets[number])
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def render_docx(text: str) -> bytes:
+    """
+    Render text as a DOCX document, one paragraph per line.
+    """
+    from docx import Document
+    document = Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def make_corpus(n: int, seed: int = 0) -> List[str]:
+    """
+    Return n synthetic resume texts (deterministic for a given seed).
+    """
+    rng = random.Random(seed)
+    return [make_resume_text(rng) for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic resume corpus')
+    parser.add_argument('--out', default=os.path.join('.cache', 'corpus'), help='Output directory')
+    parser.add_argument('--n', type=int, default=200, help='Number of resumes')
+    parser.add_argument('--jds', type=int, default=20, help='Number of job descriptions')
+    parser.add_argument('--formats', default='pdf,docx', help='Comma-separated: pdf, docx, txt')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    formats = args.formats.split(',')
+    for i, text in enumerate(make_corpus(args.n, args.seed)):
+        base = os.path.join(args.out, f'resume_{i:05d}')
+        if 'txt' in formats:
+            with open(base + '.txt', 'w', encoding='utf-8') as fh:
+                fh.write(text)
+        if 'pdf' in formats:
+            with open(base + '.pdf', 'wb') as fh:
+                fh.write(render_pdf(text))
+        if 'docx' in formats:
+            with open(base + '.docx', 'wb') as fh:
+                fh.write(render_docx(text))
+
+    rng = random.Random(args.seed + 1)
+    jds = [make_job_description(rng, long=i % 2 == 1) for i in range(args.jds)]
+    with open(os.path.join(args.out, 'job_descriptions.json'), 'w', encoding='utf-8') as fh:
+        json.dump(jds, fh, indent=2)
+    print(f'Wrote {args.n} resume(s) and {len(jds)} job description(s) to {args.out}')
+
+
+if __name__ == '__main__':
+    main()
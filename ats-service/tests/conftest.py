@@ -0,0 +1,31 @@
+import zlib
+
+import numpy as np
+import pytest
+
+
+class HashingEncoder:
+    """
+    Deterministic stand-in for a SentenceTransformer: hashed bag of words.
+    """
+
+    def __init__(self, dim=64):
+        self.dim = dim
+        self.calls = 0
+
+    def encode(self, texts, normalize_embeddings=False):
+        self.calls += len(texts)
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                out[row, zlib.crc32(word.encode()) % self.dim] += 1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.where(norms > 0, norms, 1.0)
+
+
+@pytest.fixture
+def hashing_encoder():
+    """
+    Factory for HashingEncoder; each call returns a fresh encoder.
+    """
+    return HashingEncoder
@@ -0,0 +1,92 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+
+import numpy as np
+import pytest
+
+from app.services import ann_index
+from app.services.ann_index import IVFIndex, get_ann_index
+
+DIM = 16
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+
+
+@pytest.fixture
+def index():
+    vectors = _vectors(300)
+    built = IVFIndex(DIM, n_lists=8)
+    built.train(vectors)
+    built.add([f'r{i}' for i in range(300)], vectors)
+    return built
+
+
+def test_add_replace_remove_and_compact(index):
+    queries = _vectors(5, seed=1)
+    index.add(['r0'], queries[:1])  # replaces r0's vector
+    assert len(index) == 300
+    assert index.exact_search(queries[0], 1)[0][0] == 'r0'
+
+    assert index.remove(['r1', 'r2', 'unknown']) == 2
+    assert len(index) == 298 and 'r1' not in index
+    before = [index.exact_search(q, 10) for q in queries]
+    assert not any(rid in ('r1', 'r2') for result in before for rid, _ in result)
+
+    index.compact()
+    assert len(index) == 298 and index.stored_vectors().shape == (298, DIM)
+    assert [index.exact_search(q, 10) for q in queries] == before
+    assert [index.search(q, 10, n_probe=index.n_lists) for q in queries] == before
+
+
+def test_probing_every_list_is_exact(index):
+    for query in _vectors(20, seed=2):
+        assert index.search(query, 10, n_probe=index.n_lists) == index.exact_search(query, 10)
+    # Fewer probes only ever return a subset of the candidates
+    approximate = index.search(_vectors(1, seed=3)[0], 10, n_probe=1)
+    assert 0 < len(approximate) <= 10
+
+
+def test_untrained_index_searches_exhaustively():
+    vectors = _vectors(20)
+    untrained = IVFIndex(DIM)
+    untrained.add([f'r{i}' for i in range(20)], vectors)
+    assert untrained.search(vectors[3], 3) == untrained.exact_search(vectors[3], 3)
+    assert untrained.search(vectors[3], 1)[0][0] == 'r3'
+
+
+def test_save_load_round_trip(tmp_path, index):
+    index.remove(['r5'])
+    path = str(tmp_path / 'ann.npz')
+    index.save(path)
+    loaded = IVFIndex.load(path)
+
+    assert loaded.is_trained and loaded.n_lists == index.n_lists
+    assert sorted(loaded.ids()) == sorted(index.ids()) and 'r5' not in loaded
+    for query in _vectors(5, seed=4):
+        expected = index.search(query, 10, n_probe=3)
+        found = loaded.search(query, 10, n_probe=3)
+        assert [rid for rid, _ in found] == [rid for rid, _ in expected]
+        # Loading normalises the stored vectors once more
+        np.testing.assert_allclose([s for _, s in found], [s for _, s in expected], atol=1e-6)
+
+
+def test_get_ann_index_reloads_when_the_file_changes(tmp_path, monkeypatch, index):
+    monkeypatch.setattr(ann_index, '_index', None)
+    monkeypatch.setattr(ann_index, '_index_mtime', None)
+    path = str(tmp_path / 'ann.npz')
+    assert get_ann_index(path) is None
+
+    index.save(path)
+    first = get_ann_index(path)
+    assert len(first) == 300 and get_ann_index(path) is first
+
+    index.remove(['r0'])
+    index.save(path)
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+    reloaded = get_ann_index(path)
+    assert reloaded is not first and len(reloaded) == 299
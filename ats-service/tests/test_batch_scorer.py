@@ -0,0 +1,108 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from app.config import RUBRIC_PATH
+from app.services.feature_extractor import FEATURE_VERSION
+from app.services.rubric import compile_rubric, get_rubric
+from app.services.scoring_engine import score_features, normalize_score
+from app.services.batch_scorer import features_to_matrix, score_feature_matrix, score_feature_records
+
+
+def _random_record(rng):
+    return {
+        'version': FEATURE_VERSION,
+        'education_present': rng.random() < 0.8,
+        'degree_level': rng.randint(0, 4),
+        'relevant_field': rng.random() < 0.5,
+        'top_school': rng.random() < 0.3,
+        'experience_present': rng.random() < 0.8,
+        'duration_months': rng.choice([0.0, 0.5, 1.0, 2.0, 3.0, 5.5, 6.0, 24.0, 1.5 * 12]),
+        'distinct_years': rng.randint(0, 4),
+        'mentions_present': rng.random() < 0.5,
+        'long_experience_text': rng.random() < 0.5,
+        'action_verb_count': rng.randint(0, 12),
+        'metric_count': rng.randint(0, 8),
+        'seniority_count': rng.randint(0, 4),
+        'top_company': rng.random() < 0.3,
+        'skill_count': rng.randint(0, 40),
+        'projects_present': rng.random() < 0.7,
+        'tech_count': rng.randint(0, 10),
+        'impact_count': rng.randint(0, 6),
+        'link_count': rng.randint(0, 5),
+        'project_mentions': rng.randint(0, 5),
+        'has_email': rng.random() < 0.8,
+        'has_phone': rng.random() < 0.7,
+        'has_linkedin': rng.random() < 0.5,
+        'has_github': rng.random() < 0.5,
+        'has_portfolio': rng.random() < 0.3,
+        'parsing_error_count': rng.choice([0, 0, 0, 1, 2, 3]),
+        'parsing_errors': [],
+    }
+
+
+def _custom_rubric():
+    with open(RUBRIC_PATH, encoding='utf-8') as fh:
+        data = json.load(fh)
+    weights = data['weights']
+    data['version'] = 'test-custom-curves'
+    weights['experience']['duration'] = {
+        'months': [{'min': 2, 'points': 1.5}, {'min': 12, 'points': 5.0}],
+        'multiple_years': 3.0, 'year_and_present': 3.5, 'single_year': 1.0, 'long_text': 0.5,
+    }
+    weights['skills'] = {
+        'tiers': [{'up_to': 30, 'base': 6.0, 'from': 10, 'per_skill': 0.15},
+                  {'up_to': 10, 'base': 1.0, 'from': 0, 'per_skill': 0.45}],
+        'above': 9.5,
+    }
+    weights['projects']['mentions'] = [{'min': 4, 'points': 1.5}, {'min': 1, 'points': 0.25}]
+    weights['parsing'] = {'per_error': 3.0, 'max': 7.5}
+    weights['contact']['email'] = 4.5
+    return compile_rubric(data)
+
+
+@pytest.mark.parametrize('rubric', [get_rubric(), _custom_rubric()], ids=['bundled', 'custom'])
+def test_batch_matches_scalar_path(rubric):
+    rng = random.Random(1234)
+    records = [_random_record(rng) for _ in range(5000)]
+    relevance = [rng.choice([None, 0.0, 0.3, 0.6, rng.random()]) for _ in records]
+
+    matrix = features_to_matrix(records)
+    scores = score_feature_matrix(
+        matrix, np.array([np.nan if r is None else r for r in relevance]), rubric
+    )
+
+    for row, (record, rel) in enumerate(zip(records, relevance)):
+        heur_score, _, heur_breakdown = score_features(record, rubric)
+        final_score, norm_breakdown = normalize_score(heur_score, rel)
+        expected = {**heur_breakdown, **norm_breakdown}
+
+        assert scores['atsScore'][row] == final_score
+        assert scores['heuristicScore'][row] == heur_score
+        for key in ('education', 'experience', 'skills', 'projects', 'contact',
+                    'parsingPenalty', 'heuristics', 'relevance'):
+            assert scores[key][row] == expected[key], (row, key)
+
+
+def test_custom_rubric_curves_change_the_scores():
+    rubric = _custom_rubric()
+    record = {**_random_record(random.Random(0)), 'skill_count': 40, 'parsing_error_count': 3,
+              'experience_present': True, 'duration_months': 24.0}
+    _, _, breakdown = score_features(record, rubric)
+    assert breakdown['skills'] == 9.5 and breakdown['parsingPenalty'] == -7.5
+    assert score_features({**record, 'skill_count': 8}, rubric)[2]['skills'] == round(1.0 + 8 * 0.45, 1)
+
+
+def test_score_feature_records_rejects_stale_version():
+    record = _random_record(random.Random(0))
+    record['version'] = FEATURE_VERSION - 1
+    try:
+        score_feature_records([record])
+    except ValueError:
+        return
+    raise AssertionError('stale feature record was accepted')
@@ -0,0 +1,69 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_job_description, make_resume_text
+from app.services.chunked_encoding import (
+    CHUNK_WORDS,
+    POOLING_MODES,
+    chunk_resume,
+    chunked_relevance,
+    pooled_embeddings,
+    split_sections,
+)
+from app.services.ranking import rank_resumes
+
+
+def test_resume_is_split_at_section_headers():
+    resume = make_resume_text(random.Random(3))
+    sections = [name for name, _ in split_sections(resume)]
+    assert sections == ['header', 'education', 'experience', 'skills', 'projects'][:len(sections)]
+    assert split_sections('Jane Doe\n\nWork Experience:\nEngineer at Acme')[1][0] == 'experience'
+
+
+def test_long_sections_are_cut_to_the_chunk_size():
+    resume = 'Experience\n' + ' '.join(f'word{i}' for i in range(CHUNK_WORDS * 2 + 5))
+    chunks = chunk_resume(resume)
+    assert [c.words for c in chunks] == [CHUNK_WORDS, CHUNK_WORDS, 5]
+    assert {c.section for c in chunks} == {'experience'}
+
+
+@pytest.mark.parametrize('pooling', POOLING_MODES)
+def test_every_pooling_scores_document_and_sections(pooling, hashing_encoder):
+    rng = random.Random(5)
+    resume = make_resume_text(rng)
+    jds = [make_job_description(rng), '', resume]
+    scores, sections = chunked_relevance(resume, jds, hashing_encoder(), pooling=pooling)
+    assert all(0.0 <= s <= 1.0 for s in scores)
+    assert scores[1] == 0.0 and sections[1] == {}
+    assert set(sections[0]) == {name for name, _ in split_sections(resume)}
+    assert scores[2] > scores[0]
+
+
+def test_unknown_pooling_is_rejected(hashing_encoder):
+    with pytest.raises(ValueError):
+        chunked_relevance('Skills\nPython', ['Python developer'], hashing_encoder(), pooling='median')
+
+
+def test_ranking_scores_match_mean_pooled_relevance(hashing_encoder):
+    rng = random.Random(7)
+    jd = make_job_description(rng)
+    # Long resumes span several chunks, which a whole-text encode would cut
+    resumes = [make_resume_text(rng) * 3 for _ in range(4)] + ['']
+    expected = [chunked_relevance(resume, [jd], hashing_encoder(), pooling='mean')[0][0] for resume in resumes]
+
+    ranked, method = rank_resumes(jd, resumes, len(resumes), hashing_encoder(), True)
+    assert method == 'SBERT'
+    scores = dict(ranked)
+    np.testing.assert_allclose([scores[i] for i in range(len(resumes))], expected, atol=1e-6)
+
+    stored = pooled_embeddings(resumes, hashing_encoder())
+    assert not stored[-1].any()
+    np.testing.assert_allclose(np.linalg.norm(stored[:-1], axis=1), 1.0, atol=1e-6)
@@ -0,0 +1,94 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_job_description, make_resume_text, render_docx, render_pdf
+from app.config import SBERT_MODEL
+from app.routes import score
+from app.services.deadline import (
+    DEGRADED_EMBEDDING,
+    DEGRADED_FEEDBACK,
+    DEGRADED_SBERT,
+    Deadline,
+)
+from app.services.embedding_store import EmbeddingStore
+from app.services.resume_store import ResumeStore
+from app.services.similarity_backend import SimilarityBackend
+from app.services.extraction_sandbox import extract_document
+from app.services.resume_parser import count_pdf_pages
+
+
+def test_unbounded_request_never_degrades():
+    deadline = Deadline()
+    assert not deadline.should_degrade(DEGRADED_SBERT, 3600)
+    assert deadline.page_cap() is None and deadline.degradations == []
+
+
+def test_exhausted_budget_degrades_once_per_kind():
+    deadline = Deadline(0.001)
+    assert deadline.should_degrade(DEGRADED_FEEDBACK, 0.01)
+    assert deadline.should_degrade(DEGRADED_FEEDBACK, 0.0)
+    assert deadline.degradations == [DEGRADED_FEEDBACK]
+    assert deadline.page_cap() == 1
+
+
+def test_stage_keeps_time_for_higher_priority_stages_to_come():
+    deadline = Deadline(10)
+    assert deadline.should_degrade(DEGRADED_EMBEDDING, 1, reserve=100)
+    assert not deadline.should_degrade(DEGRADED_SBERT, 1)
+    assert deadline.degradations == [DEGRADED_EMBEDDING]
+
+
+def test_lower_priority_stages_are_given_up_after_a_higher_one():
+    deadline = Deadline(10)
+    deadline.record(DEGRADED_SBERT)
+    assert deadline.should_degrade(DEGRADED_FEEDBACK, 0.0)
+    assert deadline.should_degrade(DEGRADED_EMBEDDING, 0.0)
+    assert deadline.degradations == [DEGRADED_SBERT, DEGRADED_FEEDBACK, DEGRADED_EMBEDDING]
+
+
+@pytest.fixture
+def sbert_pipeline(tmp_path, monkeypatch, hashing_encoder):
+    backend = SimilarityBackend(hashing_encoder(), SBERT_MODEL)
+    embeddings = EmbeddingStore(str(tmp_path / 'embeddings'))
+    monkeypatch.setattr(score, 'get_similarity_backend', lambda: backend)
+    monkeypatch.setattr(score, 'get_resume_store', lambda: ResumeStore(str(tmp_path / 'resumes.db')))
+    monkeypatch.setattr(score, 'get_embedding_store', lambda: embeddings)
+    return embeddings
+
+
+# Estimated costs (SBERT per text, feedback) against a 50 s budget; the
+# embedding is one text and /parse relevance encodes two
+@pytest.mark.parametrize('costs, expected', [
+    ((0.0, 1000.0), [DEGRADED_FEEDBACK]),
+    ((20.0, 0.0), [DEGRADED_EMBEDDING, DEGRADED_FEEDBACK]),
+    ((100.0, 0.0), [DEGRADED_EMBEDDING, DEGRADED_SBERT, DEGRADED_FEEDBACK]),
+])
+def test_parse_gives_stages_up_lowest_priority_first(sbert_pipeline, monkeypatch, costs, expected):
+    monkeypatch.setattr(score, 'DEADLINE_SBERT_SECONDS_PER_TEXT', costs[0])
+    monkeypatch.setattr(score, 'DEADLINE_FEEDBACK_SECONDS', costs[1])
+    rng = random.Random(46)
+    resume = render_docx(make_resume_text(rng))
+
+    result = score._parse_and_score(resume, 'resume.docx', make_job_description(rng), 'r1',
+                                    Deadline(50), use_cache=False)
+    assert result['degradations'] == expected
+    assert result['similarity_method'] == ('TF-IDF' if DEGRADED_SBERT in expected else 'SBERT')
+    assert (sbert_pipeline.ids() == []) == (DEGRADED_EMBEDDING in expected)
+
+
+def test_page_cap_reads_only_leading_pages():
+    pdf = render_pdf('\n'.join(f'Line {i}' for i in range(6)), lines_per_page=1)
+    assert count_pdf_pages(pdf) == 6 and count_pdf_pages(pdf, 3) == 3
+
+    text, errors, _ = extract_document(pdf, 'long.pdf', max_pages=2)
+    full, _, _ = extract_document(pdf, 'long.pdf')
+    assert not errors
+    assert 'Line 1' in text and 'Line 2' not in text
+    assert full.startswith(text) and 'Line 5' in full
@@ -0,0 +1,93 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+
+import numpy as np
+import pytest
+
+from app.services.embedding_store import EmbeddingStore
+
+DIM = 32
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+
+
+@pytest.mark.parametrize('dtype', ['float16', 'int8'])
+def test_put_get_delete(tmp_path, dtype):
+    store = EmbeddingStore(str(tmp_path), dtype=dtype)
+    vectors = _vectors(10)
+    store.put([f'r{i}' for i in range(10)], vectors)
+    store.put(['r3'], vectors[:1])  # overwrite re-points r3
+
+    ids, found = store.get(['r3', 'unknown', 'r7'])
+    assert ids == ['r3', 'r7'] and found.shape == (2, DIM)
+    np.testing.assert_allclose(found, vectors[[0, 7]], atol=0.05)
+
+    assert store.delete(['r7', 'unknown']) == 1
+    assert len(store) == 9 and 'r7' not in store.ids()
+    assert store.get(['r7'])[0] == []
+
+
+def test_float16_round_trip_error(tmp_path):
+    store = EmbeddingStore(str(tmp_path), dtype='float16')
+    vectors = _vectors(200, seed=1)
+    store.put([f'r{i}' for i in range(200)], vectors)
+    _, found = store.get([f'r{i}' for i in range(200)])
+    # float16 keeps 11 significant bits
+    assert np.all(np.abs(found - vectors) <= np.abs(vectors) * 2 ** -11 + 1e-7)
+
+
+def test_int8_round_trip_error(tmp_path):
+    store = EmbeddingStore(str(tmp_path), dtype='int8')
+    vectors = _vectors(200, seed=2)
+    store.put([f'r{i}' for i in range(200)], vectors)
+    _, found = store.get([f'r{i}' for i in range(200)])
+    # One scale per row: at most half a quantization step off
+    step = np.abs(vectors).max(axis=1, keepdims=True) / 127.0
+    assert np.all(np.abs(found - vectors) <= step / 2 + 1e-6)
+
+
+@pytest.mark.parametrize('dtype', ['float16', 'int8'])
+def test_compact_keeps_live_rows(tmp_path, dtype):
+    store = EmbeddingStore(str(tmp_path), dtype=dtype)
+    store.put([f'r{i}' for i in range(50)], _vectors(50))
+    store.put([f'r{i}' for i in range(10)], _vectors(10, seed=3))
+    store.delete([f'r{i}' for i in range(40, 50)])
+    before = dict(zip(*store.get(store.ids())))
+
+    store.compact()
+    assert sorted(os.listdir(str(tmp_path)))[-1] == 'vectors.1.bin'
+    assert not os.path.exists(os.path.join(str(tmp_path), 'vectors.0.bin'))
+    assert os.path.getsize(os.path.join(str(tmp_path), 'vectors.1.bin')) == 40 * store._row_bytes()
+
+    ids, vectors = store.get(list(before))
+    assert ids == list(before)
+    np.testing.assert_array_equal(vectors, np.stack(list(before.values())))
+    streamed = {i: v for block_ids, block in store.iter_blocks(16) for i, v in zip(block_ids, block)}
+    assert streamed.keys() == before.keys()
+    assert all(np.array_equal(streamed[i], before[i]) for i in before)
+
+
+def test_reader_survives_compaction_between_metadata_and_mmap(tmp_path):
+    writer = EmbeddingStore(str(tmp_path))
+    writer.put([f'r{i}' for i in range(20)], _vectors(20))
+    writer.delete(['r0'])
+    reader = EmbeddingStore(str(tmp_path))
+
+    # The writer compacts right after the reader has read the metadata
+    # of generation 0, removing vectors.0.bin before it is mapped
+    map_matrix = reader._matrix
+    compacted = []
+
+    def matrix_after_compaction(generation, rows):
+        if not compacted:
+            compacted.append(writer.compact())
+        return map_matrix(generation, rows)
+
+    reader._matrix = matrix_after_compaction
+    ids, vectors = reader.get(['r1', 'r19'])
+    assert compacted and ids == ['r1', 'r19']
+    np.testing.assert_array_equal(vectors, writer.get(['r1', 'r19'])[1])
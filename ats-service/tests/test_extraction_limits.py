@@ -0,0 +1,115 @@
+import sys
+sys.path.insert(0, '..')
+
+import io
+import os
+import zipfile
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus, render_pdf, render_docx
+from app.services.extraction_sandbox import check_document_limits, run_sandboxed
+
+
+# ── Pathological corpus ────────────────────────────────────────────
+
+def _raw_pdf(content: bytes, extra_objects: int = 0, flate: bool = False) -> bytes:
+    """
+    One-page PDF with the given content stream, optionally Flate-encoded
+    and padded with extra (unused) objects.
+    """
+    stream_dict = b'/Length %d' % len(content)
+    if flate:
+        stream_dict += b' /Filter /FlateDecode'
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+        b'/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>',
+        b'<< ' + stream_dict + b' >>\nstream\n' + content + b'\nendstream',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ] + [b'null'] * extra_objects
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    out.write(b''.join(b'%010d 00000 n \n' % offset for offset in offsets))
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def many_pages_pdf(pages=120):
+    return render_pdf('\n'.join(f'Line {i}' for i in range(pages)), lines_per_page=1)
+
+
+def many_objects_pdf(objects=5000):
+    return _raw_pdf(b'BT /F1 10 Tf 50 800 Td (hello) Tj ET', extra_objects=objects)
+
+
+def slow_content_pdf(operators=400000):
+    # Hundreds of thousands of text-showing operators keep pdfminer busy
+    return _raw_pdf(b'BT /F1 1 Tf ' + b'(x) Tj ' * operators + b'ET')
+
+
+def flate_bomb_pdf(expanded_bytes=768 * 1024 * 1024):
+    compressor = zlib.compressobj(9)
+    chunk = b' ' * (16 * 1024 * 1024)
+    data = b''.join(compressor.compress(chunk) for _ in range(expanded_bytes // len(chunk)))
+    return _raw_pdf(data + compressor.flush(), flate=True)
+
+
+def zip_bomb_docx(expanded_bytes=8 * 1024 * 1024):
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml', b'\0' * expanded_bytes)
+    return out.getvalue()
+
+
+# ── Tests ──────────────────────────────────────────────────────────
+
+def test_normal_documents_pass_through():
+    text = make_corpus(1)[0]
+    for filename, data in (('resume.pdf', render_pdf(text)), ('resume.docx', render_docx(text))):
+        extracted, errors, cacheable, _, _ = run_sandboxed(data, filename)
+        assert errors == [] and cacheable
+        assert 'Education' in extracted
+
+
+def test_page_limit():
+    text, errors, cacheable, _, _ = run_sandboxed(many_pages_pdf(), 'pages.pdf')
+    assert text == '' and cacheable
+    assert errors == ['PDF parsing error: limit exceeded (more than 50 pages)']
+
+
+def test_object_limit():
+    error = check_document_limits(many_objects_pdf(), 'objects.pdf', max_objects=1000)
+    assert error is not None and 'objects' in error
+
+
+def test_docx_expansion_limit():
+    error = check_document_limits(zip_bomb_docx(), 'bomb.docx', max_docx_bytes=1024 * 1024)
+    assert error is not None and error.startswith('DOCX parsing error: limit exceeded')
+
+
+def test_timeout_kills_extractor():
+    text, errors, cacheable, _, _ = run_sandboxed(slow_content_pdf(), 'slow.pdf', timeout=1.0)
+    assert text == '' and not cacheable
+    assert errors == ['PDF parsing error: limit exceeded (timeout after 1s)']
+
+
+def test_memory_limit():
+    text, errors, _, _, _ = run_sandboxed(flate_bomb_pdf(), 'bomb.pdf', memory_limit=128 * 1024 * 1024)
+    assert text == ''
+    assert len(errors) == 1 and errors[0].startswith('PDF parsing error: limit exceeded')
+
+
+def test_garbage_is_an_ordinary_parsing_error():
+    text, errors, cacheable, _, _ = run_sandboxed(b'%PDF-1.4 not really', 'junk.pdf')
+    assert text == '' and cacheable
+    assert len(errors) == 1 and errors[0].startswith('PDF parsing error')
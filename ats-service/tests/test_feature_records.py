@@ -0,0 +1,121 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import SKILL_DICTIONARY_PATH
+from app.routes.score import router
+from app.services.feature_extractor import FEATURE_VERSION, extract_features
+from app.services.rubric import get_rubric
+from app.services.skill_dictionary import get_skill_dictionary
+from app.services.scoring_engine import score_features
+from app.services.skill_dictionary import compile_skill_dictionary
+
+# compute_heuristics() outputs recorded before it was split into
+# extract_features() + score_features(), with the text and sections fed in
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'heuristics_baseline.json')
+
+
+def _baseline_cases():
+    with open(BASELINE_PATH, encoding='utf-8') as fh:
+        return json.load(fh)['cases']
+
+
+def _per_spelling_dictionary():
+    """
+    The bundled skill dictionary with every alias as its own skill, which
+    is how skills were counted when the baseline was recorded.
+    """
+    with open(SKILL_DICTIONARY_PATH, encoding='utf-8') as fh:
+        data = json.load(fh)
+    spellings = [spelling
+                 for entries in data['skills'].values()
+                 for entry in entries
+                 for spelling in ([entry] if isinstance(entry, str) else [entry['name']] + entry.get('aliases', []))]
+    return compile_skill_dictionary({'version': data['version'], 'skills': {'all': spellings}})
+
+
+@pytest.fixture
+def client():
+    api = FastAPI()
+    api.include_router(router)
+    return TestClient(api)
+
+
+@pytest.mark.parametrize('case', _baseline_cases(), ids=lambda case: str(len(case['text'])))
+def test_scoring_features_matches_baseline_heuristics(case):
+    features = extract_features(case['text'], case['parsed'], case['parsingErrors'],
+                                skill_dictionary=_per_spelling_dictionary())
+    score, feedback, breakdown = score_features(features)
+    assert (score, breakdown, feedback) == (case['heuristicScore'], case['breakdown'], case['feedback'])
+
+
+def _features(text):
+    return extract_features(text, {'education': text, 'experience': text}, [])
+
+
+def test_stale_version_is_rejected_per_record(client):
+    record = _features('Python developer, 5 years experience\njane@example.com')
+    stale = {**record, 'version': FEATURE_VERSION - 1}
+    response = client.post('/rescore-features', json={'records': [{'features': stale}, {'features': record}]})
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert 'unsupported feature version' in results[0]['error']
+    assert results[1]['index'] == 1 and 'atsScore' in results[1]
+
+
+def test_record_carries_its_matcher_provenance():
+    record = _features('Python developer\njane@example.com')
+    rubric = get_rubric()
+    assert record['version'] == FEATURE_VERSION
+    assert record['rubric_version'] == rubric.version
+    assert record['rubric_matchers'] == rubric.matchers_digest
+    assert record['skill_dictionary_version'] == get_skill_dictionary().version
+
+
+def test_counts_from_other_keyword_lists_are_rejected(client):
+    record = _features('Python developer, 5 years experience\njane@example.com')
+    records = [
+        {**record, 'skill_dictionary_version': 'older'},
+        {**record, 'rubric_version': 'older', 'rubric_matchers': '0' * 16},
+        # Only the weights changed since: the counts are still valid
+        {**record, 'rubric_version': 'older'},
+    ]
+    body = client.post('/rescore-features', json={'records': [{'features': r} for r in records]}).json()
+    assert body['skillDictionaryVersion'] == get_skill_dictionary().version
+    results = body['results']
+    assert "skill dictionary 'older'" in results[0]['error']
+    assert "keyword lists of rubric 'older'" in results[1]['error']
+    assert 'atsScore' in results[2]
+
+
+def test_missing_field_is_rejected_per_record(client):
+    record = _features('Python developer\njane@example.com')
+    partial = {name: value for name, value in record.items() if name != 'skill_count'}
+    response = client.post('/rescore-features', json={'records': [{'features': partial, 'relevance': 0.5}]})
+    assert response.status_code == 200
+    assert response.json()['results'] == [
+        {'index': 0, 'error': "Invalid feature record: missing fields ['skill_count']"}
+    ]
+
+
+@pytest.mark.parametrize('bad_value', ['abc', None, float('nan')])
+def test_non_numeric_field_only_rejects_its_record(client, bad_value):
+    record = _features('Python developer, 5 years experience\njane@example.com')
+    bad = {**record, 'skill_count': bad_value}
+    body = json.dumps({'records': [{'features': record}, {'features': bad}]}, allow_nan=True)
+    headers = {'content-type': 'application/json'}
+
+    results = client.post('/rescore-features', content=body, headers=headers).json()['results']
+    assert 'atsScore' in results[0]
+    assert results[1] == {'index': 1, 'error': "Invalid feature record: non-numeric fields ['skill_count']"}
+
+    streamed = client.post('/rescore-features', content=body,
+                           headers={**headers, 'accept': 'application/x-ndjson'})
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert {line['index']: line for line in lines[1:]} == {item['index']: item for item in results}
@@ -0,0 +1,27 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus
+from app.services.ranking import pairwise_relevance_tfidf, relevance_to_many
+from app.services.scoring_engine import compute_relevance_tfidf
+
+
+def test_pairwise_tfidf_matches_per_pair_fit():
+    corpus = make_corpus(30)
+    jds = corpus[:20] + ['', 'the and of', 'Python developer with Docker and AWS']
+    for resume in corpus[20:] + ['', 'a the']:
+        expected = [compute_relevance_tfidf(resume, jd) for jd in jds]
+        np.testing.assert_allclose(pairwise_relevance_tfidf(resume, jds), expected, rtol=0, atol=1e-12)
+
+
+def test_relevance_to_many_without_sbert():
+    scores, method = relevance_to_many('Python and Docker', ['Docker engineer', 'Chef'])
+    assert method == 'TF-IDF'
+    assert scores[0] > 0 and scores[1] == 0
+    assert len(relevance_to_many('Python', [])[0]) == 0
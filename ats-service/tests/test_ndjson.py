@@ -0,0 +1,44 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
+
+
+def _client(lines):
+    api = FastAPI()
+
+    @api.get('/stream')
+    def stream():
+        async def generate():
+            for line in lines:
+                if isinstance(line, Exception):
+                    raise line
+                yield line
+        return ndjson_response(generate())
+
+    return TestClient(api)
+
+
+def test_lines_are_streamed_in_generation_order():
+    response = _client([{'total': 2}, {'index': 1, 'score': 0.5}, {'index': 0, 'score': 0.7}]).get('/stream')
+    assert response.headers['content-type'] == NDJSON_MEDIA_TYPE
+    assert [json.loads(line) for line in response.text.splitlines()] == \
+        [{'total': 2}, {'index': 1, 'score': 0.5}, {'index': 0, 'score': 0.7}]
+
+
+def test_failure_midway_ends_with_error_line():
+    response = _client([{'total': 2}, RuntimeError('store unavailable')]).get('/stream')
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == \
+        [{'total': 2}, {'error': 'store unavailable'}]
+
+
+def test_accept_negotiation():
+    assert wants_ndjson('application/x-ndjson')
+    assert wants_ndjson('application/json;q=0.5, application/x-ndjson')
+    assert not wants_ndjson('application/json') and not wants_ndjson(None)
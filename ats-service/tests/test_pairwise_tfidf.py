@@ -0,0 +1,26 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus
+from app.services.scoring_engine import compute_relevance_tfidf, compute_relevance_tfidf_sklearn
+
+EDGE_CASES = ['', 'the and of', 'Python', 'C++ C# .NET node.js', 'Python python PYTHON developer']
+
+
+def test_lightweight_path_matches_sklearn():
+    corpus = make_corpus(40)
+    texts = corpus + EDGE_CASES
+    jds = corpus[:10] + EDGE_CASES
+    for text in texts:
+        for jd in jds:
+            expected = compute_relevance_tfidf_sklearn(text, jd)
+            assert abs(compute_relevance_tfidf(text, jd) - expected) < 1e-12, (text[:40], jd[:40])
+
+
+def test_identical_and_disjoint_texts():
+    assert abs(compute_relevance_tfidf('python docker aws', 'python docker aws') - 1.0) < 1e-12
+    assert compute_relevance_tfidf('python docker', 'kubernetes terraform') == 0.0
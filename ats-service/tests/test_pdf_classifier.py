@@ -0,0 +1,70 @@
+import sys
+sys.path.insert(0, '..')
+
+import io
+import os
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus, render_pdf
+from app.services.pdf_classifier import classify_pdf, KIND_TEXT, KIND_IMAGE_ONLY, KIND_MIXED
+from app.services.extraction_sandbox import extract_document
+
+
+def _image_pdf(pages=2, text_on_page=None):
+    """
+    PDF whose pages each draw one full-page image (a 'scan'); optionally
+    one page also shows text.
+    """
+    pixels = zlib.compress(b'\xff' * (100 * 100))
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        3: b'<< /Type /XObject /Subtype /Image /Width 100 /Height 100 /ColorSpace /DeviceGray '
+           b'/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream' % (len(pixels), pixels),
+        4: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    }
+    kids = []
+    for n in range(pages):
+        page, content = 5 + 2 * n, 6 + 2 * n
+        kids.append(b'%d 0 R' % page)
+        body = b'q 595 0 0 842 0 0 cm /Im1 Do Q'
+        if n == text_on_page:
+            body += b' BT /F1 10 Tf 50 800 Td (Experience) Tj ET'
+        body = zlib.compress(body)
+        objects[page] = (b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                         b'/Resources << /XObject << /Im1 3 0 R >> /Font << /F1 4 0 R >> >> /Contents %d 0 R >>' % content)
+        objects[content] = b'<< /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream' % (len(body), body)
+    objects[2] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(kids), pages)
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = out.tell()
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (number, objects[number]))
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    out.write(b''.join(b'%010d 00000 n \n' % offsets[n] for n in sorted(objects)))
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def test_classification():
+    assert classify_pdf(render_pdf(make_corpus(1)[0]))['kind'] == KIND_TEXT
+    assert classify_pdf(_image_pdf())['kind'] == KIND_IMAGE_ONLY
+    assert classify_pdf(_image_pdf(text_on_page=1))['kind'] == KIND_MIXED
+
+
+def test_classification_is_fast():
+    data = render_pdf('\n'.join(make_corpus(20)))
+    start = time.perf_counter()
+    classify_pdf(data)
+    assert time.perf_counter() - start < 0.05
+
+
+def test_image_only_pdf_short_circuits():
+    text, errors, kind = extract_document(_image_pdf(), 'scan.pdf')
+    assert text == '' and kind == KIND_IMAGE_ONLY
+    assert errors == ['PDF parsing error: image-only (scanned) PDF, no text layer found']
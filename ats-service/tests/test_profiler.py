@@ -0,0 +1,81 @@
+import sys
+sys.path.insert(0, '..')
+
+import pstats
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app as ats_app
+from app import warmup
+from app.routes import admin
+from app.utils.profiler import ProfilingMiddleware
+
+TOKEN = 'test-admin-token'
+
+
+def _middleware_classes(api):
+    return [m.cls for m in api.user_middleware]
+
+
+@pytest.fixture
+def no_startup_work(monkeypatch):
+    monkeypatch.setattr(ats_app, 'initialize_nlp_resources', lambda: set())
+    monkeypatch.setattr(warmup, 'start_warmup', lambda: None)
+
+
+def test_middleware_is_only_installed_with_an_admin_token(monkeypatch, no_startup_work):
+    monkeypatch.setattr(ats_app, 'ADMIN_TOKEN', '')
+    assert ProfilingMiddleware not in _middleware_classes(ats_app.create_app())
+
+    monkeypatch.setattr(ats_app, 'ADMIN_TOKEN', TOKEN)
+    assert ProfilingMiddleware in _middleware_classes(ats_app.create_app())
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(admin, 'ADMIN_TOKEN', TOKEN)
+    monkeypatch.setattr(admin, 'PROFILE_DIR', str(tmp_path))
+
+    api = FastAPI()
+    api.include_router(admin.router)
+
+    @api.get('/work')
+    def work():
+        return {'total': sum(i * i for i in range(20000))}
+
+    api.add_middleware(ProfilingMiddleware, admin_token=TOKEN, output_dir=str(tmp_path), interval=0.001)
+    return TestClient(api)
+
+
+def test_admin_endpoints_need_the_token(client, monkeypatch):
+    assert client.get('/admin/profiles').status_code == 403
+    assert client.get('/admin/profiles', headers={'X-Admin-Token': 'wrong'}).status_code == 403
+    assert client.get('/admin/profiles', headers={'X-Admin-Token': TOKEN}).status_code == 200
+
+    monkeypatch.setattr(admin, 'ADMIN_TOKEN', '')
+    assert client.get('/admin/profiles', headers={'X-Admin-Token': TOKEN}).status_code == 404
+
+
+def test_profile_request_with_a_wrong_token_is_not_profiled(client, tmp_path):
+    response = client.get('/work?profile=1', headers={'X-Admin-Token': 'wrong'})
+    assert response.status_code == 200 and 'x-ats-profile-id' not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled_request_is_listed_and_downloadable(client, tmp_path):
+    response = client.get('/work', headers={'X-ATS-Profile': '1', 'X-Admin-Token': TOKEN})
+    profile_id = response.headers['x-ats-profile-id']
+    assert response.json()['total'] > 0
+    assert f'</admin/profiles/{profile_id}.pstats>' in response.headers['link']
+
+    listed = client.get('/admin/profiles', headers={'X-Admin-Token': TOKEN}).json()['profiles']
+    assert sorted(listed) == [f'{profile_id}.collapsed', f'{profile_id}.pstats']
+
+    download = client.get(f'/admin/profiles/{profile_id}.pstats', headers={'X-Admin-Token': TOKEN})
+    assert download.status_code == 200
+    assert pstats.Stats(str(tmp_path / f'{profile_id}.pstats')).total_calls > 0
+
+    missing = client.get('/admin/profiles/../secret.pstats', headers={'X-Admin-Token': TOKEN})
+    assert missing.status_code == 404
@@ -0,0 +1,123 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+import random
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_job_description, make_resume_text
+from app.routes import score
+from app.services.ranking import top_k_indices
+from app.services.resume_store import ResumeStore
+from app.services.scoring_engine import compute_relevance_tfidf
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    resume_store = ResumeStore(str(tmp_path / 'resumes.db'))
+    monkeypatch.setattr(score, 'get_resume_store', lambda: resume_store)
+    return resume_store
+
+
+@pytest.fixture
+def client(store):
+    api = FastAPI()
+    api.include_router(score.router)
+    return TestClient(api)
+
+
+# ── top_k_indices ──────────────────────────────────────────────────
+
+def test_top_k_is_best_first():
+    scores = np.array([0.1, 0.7, 0.3, 0.9, 0.5])
+    assert top_k_indices(scores, 3).tolist() == [3, 1, 4]
+    assert top_k_indices(scores, 10).tolist() == [3, 1, 4, 2, 0]
+    assert top_k_indices(scores, 0).tolist() == [] and top_k_indices(np.zeros(0), 3).tolist() == []
+
+
+def test_ties_are_ordered_by_index():
+    scores = np.array([0.5, 0.9, 0.5, 0.9, 0.5, 0.1])
+    for k in range(len(scores) + 1):
+        assert top_k_indices(scores, k).tolist() == np.argsort(-scores, kind='stable')[:k].tolist()
+
+    rng = np.random.default_rng(7)
+    many = rng.integers(0, 3, 1000).astype(float)
+    assert top_k_indices(many, 50).tolist() == np.argsort(-many, kind='stable')[:50].tolist()
+
+
+# ── ResumeStore ────────────────────────────────────────────────────
+
+def test_store_returns_known_ids_only(store):
+    store.put('a', 'Python developer')
+    store.put('b', 'Java developer')
+    store.put('a', 'Senior Python developer')
+    assert store.get_many(['a', 'missing', 'b', 'a']) == {'a': 'Senior Python developer', 'b': 'Java developer'}
+    assert sorted(store.all_ids()) == ['a', 'b']
+
+
+def test_store_streams_blocks(store):
+    ids = [f'r{i:04d}' for i in range(1203)]
+    for rid in ids:
+        store.put(rid, f'text {rid}')
+
+    blocks = list(store.iter_blocks(500))
+    assert [len(block_ids) for block_ids, _ in blocks] == [500, 500, 203]
+    assert [rid for block_ids, _ in blocks for rid in block_ids] == ids
+
+    wanted = ids[::2] + ['unknown']
+    found = {rid: text for block_ids, texts in store.iter_blocks(400, wanted)
+             for rid, text in zip(block_ids, texts)}
+    assert found == {rid: f'text {rid}' for rid in ids[::2]}
+
+
+# ── POST /rank ─────────────────────────────────────────────────────
+
+def test_rank_reports_missing_ids_and_mixes_inline_resumes(client, store):
+    store.put('stored-python', 'Python developer building FastAPI services with Docker')
+    store.put('stored-java', 'Java developer working on Spring applications')
+    response = client.post('/rank', json={
+        'job_description': 'Python FastAPI developer with Docker',
+        'resume_ids': ['stored-python', 'unknown-1', 'stored-java', 'unknown-2'],
+        'resumes': [{'id': 'inline-python', 'text': 'Python and Docker engineer'}],
+        'top_k': 2,
+    })
+    body = response.json()
+    assert response.status_code == 200
+    assert body['method'] == 'TF-IDF' and body['candidates'] == 3
+    assert body['missingIds'] == ['unknown-1', 'unknown-2']
+    assert [r['id'] for r in body['results']] == ['stored-python', 'inline-python']
+    assert [r['rank'] for r in body['results']] == [1, 2]
+
+
+def test_single_candidate_score_matches_pairwise_relevance(client):
+    rng = random.Random(11)
+    jd = make_job_description(rng)
+    for _ in range(5):
+        resume = make_resume_text(rng)
+        result = client.post('/rank', json={'job_description': jd,
+                                            'resumes': [{'id': 'r', 'text': resume}]}).json()['results']
+        assert result[0]['score'] == pytest.approx(compute_relevance_tfidf(resume, jd), abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_ranking_agrees_with_pairwise_relevance_on_clear_matches(client, store, seed):
+    # The pool-fitted IDF differs from a per-pair fit, so only resumes that
+    # clearly stand out must come out on top in both
+    rng = random.Random(seed)
+    jd = make_job_description(rng)
+    texts = {f'r{i}': make_resume_text(rng) for i in range(30)}
+    planted = {f'match{copies}' for copies in (1, 2, 3)}
+    for rid in planted:
+        texts[rid] = make_resume_text(rng) + ('\n' + jd) * int(rid[-1])
+    for rid, text in texts.items():
+        store.put(rid, text)
+
+    results = client.post('/rank', json={'job_description': jd, 'resume_ids': list(texts), 'top_k': 3}).json()['results']
+    pairwise = sorted(texts, key=lambda rid: -compute_relevance_tfidf(texts[rid], jd))
+    assert {r['id'] for r in results} == set(pairwise[:3]) == planted
@@ -0,0 +1,124 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+import time
+
+import pytest
+
+from app.config import RUBRIC_PATH
+from app.services.hot_reload import HotReloadable
+from app.services.rubric import compile_rubric, get_rubric, load_rubric, reload_rubric
+from app.services.feature_extractor import extract_features
+from app.services.scoring_engine import score_features
+
+RESUME = ('Education\nB.Tech Computer Science, IIT\n\nExperience\nSenior engineer at Google, '
+          'led and deployed services for 2 years, 10000 users\n\njane@example.com +1 555 0100 1234\n'
+          'linkedin.com/in/jane github.com/jane')
+
+
+def _rubric_data():
+    with open(RUBRIC_PATH, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def test_bundled_rubric_compiles():
+    rubric = load_rubric()
+    assert rubric.version
+    assert rubric.matchers['top_schools'].any_in('iit delhi')
+    assert rubric.matchers['action_verbs'].count_in('led and deployed') == 2
+
+
+def test_invalid_rubric_is_rejected():
+    data = _rubric_data()
+    del data['weights']['contact']['email']
+    with pytest.raises(ValueError):
+        compile_rubric(data)
+
+
+@pytest.mark.parametrize('path, value', [
+    (('matchers',), ['iit']),
+    (('weights',), [1, 2]),
+    (('weights', 'education'), [1, 2]),
+    (('weights', 'education', 'degree'), 'phd'),
+])
+def test_misshapen_rubric_is_rejected(path, value):
+    data = _rubric_data()
+    parent = data
+    for key in path[:-1]:
+        parent = parent[key]
+    parent[path[-1]] = value
+    with pytest.raises(ValueError, match='must be an object'):
+        compile_rubric(data)
+
+
+@pytest.mark.parametrize('path, value, message', [
+    (('weights', 'skills', 'tiers'), [], 'non-empty list'),
+    (('weights', 'skills', 'tiers'), [{'up_to': 5, 'base': 2.0, 'from': 0}], r'tiers\[0\]\.per_skill'),
+    (('weights', 'skills', 'tiers'), [{'up_to': 5, 'base': 2.0, 'from': 0, 'per_skill': 0.2}] * 2,
+     'must not repeat'),
+    (('weights', 'experience', 'duration', 'months'), [{'min': 6}], r'months\[0\]\.points'),
+    (('weights', 'experience', 'duration', 'single_year'), 'high', 'must be a number'),
+    (('weights', 'projects', 'mentions'), None, 'non-empty list'),
+    (('weights', 'parsing', 'per_error'), None, 'must be a number'),
+])
+def test_invalid_curves_are_rejected(path, value, message):
+    data = _rubric_data()
+    parent = data
+    for key in path[:-1]:
+        parent = parent[key]
+    parent[path[-1]] = value
+    with pytest.raises(ValueError, match=message):
+        compile_rubric(data)
+
+
+def test_watcher_survives_unexpected_loader_errors(tmp_path):
+    class Loaded:
+        def __init__(self, version):
+            self.version = version
+
+    def loader(path):
+        text = open(path, encoding='utf-8').read()
+        if text == 'broken':
+            raise AttributeError("'list' object has no attribute 'get'")
+        return Loaded(text)
+
+    path = tmp_path / 'data.txt'
+    path.write_text('v1', encoding='utf-8')
+    watched = HotReloadable('test file', str(path), loader)
+    watched.start_watcher(0.01)
+
+    path.write_text('broken', encoding='utf-8')
+    time.sleep(0.2)
+    assert watched.get().version == 'v1' and watched._watcher.is_alive()
+
+    path.write_text('v2', encoding='utf-8')
+    deadline = time.monotonic() + 5
+    while watched.get().version != 'v2' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert watched.get().version == 'v2'
+
+
+def test_reload_swaps_atomically(tmp_path):
+    data = _rubric_data()
+    data['version'] = 'test-double-email'
+    data['weights']['contact']['email'] = 6.0
+    path = tmp_path / 'rubric.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+    in_flight = get_rubric()
+    try:
+        reloaded = reload_rubric(str(path))
+        assert get_rubric() is reloaded and reloaded.version == 'test-double-email'
+
+        features = extract_features(RESUME, {}, [], in_flight)
+        _, _, old_breakdown = score_features(features, in_flight)
+        _, _, new_breakdown = score_features(features)
+        assert new_breakdown['contact'] == min(10.0, old_breakdown['contact'] + 3.0)
+
+        path.write_text('{"version": ', encoding='utf-8')
+        with pytest.raises(ValueError):
+            reload_rubric(str(path))
+        assert get_rubric() is reloaded
+    finally:
+        reload_rubric()
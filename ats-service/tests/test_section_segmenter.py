@@ -0,0 +1,87 @@
+import sys
+sys.path.insert(0, '..')
+
+import io
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from pdfminer.high_level import extract_text
+
+import pytest
+
+from synthetic_corpus import make_corpus, render_docx, render_pdf
+from app.services import extraction_sandbox
+from app.services.resume_parser import (
+    extract_contact_info,
+    find_section,
+    iter_pdf_pages,
+    safe_extract_text,
+)
+from app.services.extraction_sandbox import run_in_process, run_sandboxed
+from app.services.section_segmenter import REQUIRED_SECTIONS, SectionSegmenter
+
+
+def _expected_sections(text):
+    return {key: find_section(text, names) for key, names in REQUIRED_SECTIONS.items()}
+
+
+def test_pages_concatenate_to_extract_text():
+    for text in make_corpus(5, seed=1):
+        pdf = render_pdf(text, lines_per_page=8)
+        assert ''.join(iter_pdf_pages(pdf)) == extract_text(io.BytesIO(pdf))
+
+
+def test_streamed_segmentation_matches_whole_text():
+    for text in make_corpus(10, seed=2):
+        pages = list(iter_pdf_pages(render_pdf(text, lines_per_page=5)))
+        segmenter = SectionSegmenter()
+        for page in pages:
+            segmenter.feed(page)
+        segmenter.close()
+        full = ''.join(pages)
+        assert segmenter.sections == _expected_sections(full)
+        assert segmenter.contact == extract_contact_info(full)
+
+
+def test_contact_split_across_pages_is_not_cut_short():
+    segmenter = SectionSegmenter()
+    segmenter.feed('Call +1 555 01')
+    assert segmenter.contact['phone'] is None
+    segmenter.feed('23 4567 today')
+    assert segmenter.contact['phone'] == '+1 555 0123 4567'
+
+
+def test_early_stop_skips_trailing_pages():
+    text = make_corpus(1, seed=4)[0] + '\n\n' + '\n'.join(f'Publication {i}' for i in range(300))
+    pdf = render_pdf(text, lines_per_page=20)
+    segmenter = SectionSegmenter()
+    stopped, errors = safe_extract_text(pdf, 'long.pdf', segmenter=segmenter)
+    full, _ = safe_extract_text(pdf, 'long.pdf')
+
+    assert errors == [] and segmenter.stopped_early
+    assert segmenter.chunks_read < len(list(iter_pdf_pages(pdf)))
+    assert full.startswith(stopped)
+    assert _expected_sections(stopped) == _expected_sections(full)
+    assert extract_contact_info(stopped) == extract_contact_info(full)
+
+
+@pytest.mark.parametrize('extract', [run_in_process, run_sandboxed])
+def test_extraction_returns_the_segmenter_results(monkeypatch, extract):
+    monkeypatch.setattr(extraction_sandbox, 'STREAMING_EARLY_STOP', True)
+    text = make_corpus(1, seed=5)[0]
+    documents = [
+        ('long.pdf', render_pdf(text + '\n\n' + '\n'.join(f'Talk {i}' for i in range(200)), lines_per_page=20)),
+        ('short.pdf', render_pdf(text, lines_per_page=200)),
+        ('resume.docx', render_docx(text)),
+        # Never complete (no phone): the segmenter is closed at the end
+        ('no-phone.docx', render_docx('Jane Doe\n\nSkills\nPython, SQL\n\nContact: jane@example.com')),
+    ]
+    for filename, data in documents:
+        outcome = extract(data, filename)
+        assert outcome.errors == [] and outcome.segments is not None
+        assert outcome.segments.sections == _expected_sections(outcome.text)
+        assert outcome.segments.contact == extract_contact_info(outcome.text)
+
+    failed = extract(b'not a pdf', 'broken.pdf')
+    assert failed.errors and failed.segments is None
@@ -0,0 +1,79 @@
+import sys
+sys.path.insert(0, '..')
+
+import threading
+import types
+
+import pytest
+
+from app.config import SBERT_MODEL
+from app.services import similarity_backend
+from app.services.similarity_backend import (
+    TFIDF_BACKEND,
+    describe_similarity_backend,
+    get_similarity_backend,
+    load_sbert_backend,
+    start_sbert_loader,
+)
+
+
+@pytest.fixture
+def fake_models(monkeypatch, hashing_encoder):
+    """
+    sentence_transformers stand-in; loading a model named 'missing'
+    fails, and loads block while the returned event is cleared.
+    """
+    release = threading.Event()
+    release.set()
+
+    def load(name):
+        release.wait(5)
+        if name == 'missing':
+            raise OSError(f"{name} not found")
+        return hashing_encoder()
+
+    module = types.ModuleType('sentence_transformers')
+    module.SentenceTransformer = load
+    monkeypatch.setitem(sys.modules, 'sentence_transformers', module)
+    monkeypatch.setattr(similarity_backend, '_active', TFIDF_BACKEND)
+    monkeypatch.setattr(similarity_backend, '_last_error', None)
+    return release
+
+
+def test_switches_from_tfidf_once_the_model_is_warm(fake_models):
+    before = get_similarity_backend()
+    assert before.method == 'TF-IDF' and describe_similarity_backend()['state'] == 'disabled'
+
+    backend = load_sbert_backend(SBERT_MODEL)
+    assert get_similarity_backend() is backend and backend.uses_stored_embeddings
+    assert backend.model.calls == 2  # warmup encodes
+    assert describe_similarity_backend()['state'] == 'ready'
+    # A request that fetched the backend earlier keeps its own
+    assert before.model is None
+
+
+def test_failed_swap_keeps_the_current_model(fake_models):
+    current = load_sbert_backend(SBERT_MODEL)
+    with pytest.raises(OSError):
+        load_sbert_backend('missing')
+    assert get_similarity_backend() is current
+    assert describe_similarity_backend()['lastError'].startswith('missing')
+
+    other = load_sbert_backend('other-model')
+    assert other.enabled and not other.uses_stored_embeddings
+
+
+def test_background_load_is_visible_and_exclusive(fake_models):
+    fake_models.clear()
+    assert start_sbert_loader('next-model')
+    assert not start_sbert_loader('another-model')
+    status = describe_similarity_backend()
+    assert status['state'] == 'loading' and status['loading'] == 'next-model'
+    assert get_similarity_backend().method == 'TF-IDF'
+
+    fake_models.set()
+    for thread in threading.enumerate():
+        if thread.name == 'sbert-loader':
+            thread.join(5)
+    assert get_similarity_backend().model_name == 'next-model'
+    assert describe_similarity_backend()['loading'] is None
@@ -0,0 +1,84 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+import os
+import random
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_job_description, make_resume_text
+from app.services.similarity_matrix import (
+    TopKAccumulator,
+    blocks_from_pairs,
+    save_similarity_matrix,
+    similarity_matrix,
+    top_k_per_jd,
+)
+from app.utils.text_cleaner import tfidf_terms
+
+BLOCK_SIZE = 7
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = random.Random(30)
+    jds = [make_job_description(rng) for _ in range(4)] + ['']
+    resumes = [(f'r{i:02d}', make_resume_text(rng)) for i in range(40)]
+    return jds, resumes
+
+
+def _dense_cosine(jds, resumes):
+    """
+    Reference: one TfidfVectorizer fitted on every JD and resume.
+    """
+    matrix = TfidfVectorizer(analyzer=tfidf_terms).fit_transform(jds + [text for _, text in resumes])
+    return (matrix[:len(jds)] @ matrix[len(jds):].T).toarray()
+
+
+def test_matrix_matches_dense_tfidf(corpus):
+    jds, resumes = corpus
+    matrix, resume_ids = similarity_matrix(jds, blocks_from_pairs(resumes, BLOCK_SIZE))
+    assert resume_ids == [rid for rid, _ in resumes]
+    np.testing.assert_allclose(matrix.toarray(), _dense_cosine(jds, resumes), atol=1e-9)
+
+
+def test_top_k_matches_dense_tfidf(corpus):
+    jds, resumes = corpus
+    dense = _dense_cosine(jds, resumes)
+    per_jd = top_k_per_jd(jds, blocks_from_pairs(resumes, BLOCK_SIZE), 5)
+
+    for row, matches in enumerate(per_jd[:-1]):
+        expected = np.argsort(-dense[row], kind='stable')[:5]
+        assert [rid for rid, _ in matches] == [resumes[i][0] for i in expected]
+        np.testing.assert_allclose([score for _, score in matches], dense[row, expected], atol=1e-9)
+    # An empty JD matches nothing
+    assert all(score == 0.0 for _, score in per_jd[-1])
+
+
+def test_accumulator_keeps_k_across_blocks():
+    acc = TopKAccumulator(2, 2)
+    acc.add(['a', 'b'], np.array([[0.1, 0.9], [0.5, 0.2]]))
+    acc.add(['c'], np.array([[0.4], [0.8]]))
+    acc.add(['d', 'e'], np.array([[0.95, 0.0], [0.1, 0.3]]))
+    assert acc.results() == [[('d', 0.95), ('b', 0.9)], [('c', 0.8), ('a', 0.5)]]
+
+
+def test_saved_matrix_round_trips_with_its_ids(tmp_path, corpus):
+    jds, resumes = corpus
+    matrix, resume_ids = similarity_matrix(jds, blocks_from_pairs(resumes, BLOCK_SIZE), min_score=0.05)
+    assert matrix.nnz and matrix.data.min() > 0.05
+
+    path = str(tmp_path / 'matrix')
+    save_similarity_matrix(path, matrix, [f'jd{i}' for i in range(len(jds))], resume_ids)
+    loaded = sp.load_npz(path + '.npz')
+    with open(path + '.npz.ids.json', encoding='utf-8') as fh:
+        ids = json.load(fh)
+
+    assert (loaded != matrix).nnz == 0
+    assert ids == {'jdIds': [f'jd{i}' for i in range(len(jds))], 'resumeIds': resume_ids}
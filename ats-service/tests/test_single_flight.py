@@ -0,0 +1,99 @@
+import sys
+sys.path.insert(0, '..')
+
+import asyncio
+
+import pytest
+
+from app.services import metrics
+from app.services.single_flight import SingleFlight, request_key
+
+
+def _coalesced(name):
+    return metrics.snapshot().get('ats_coalesced_requests_total', {}).get((('endpoint', name),), 0)
+
+
+def test_concurrent_duplicates_share_one_computation():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'score': 42}
+
+    async def scenario():
+        flights = SingleFlight('test-share', enabled=True)
+        key = request_key(b'%PDF', 'resume.pdf', 'python developer', None)
+        results = await asyncio.gather(*(flights.run(key, compute) for _ in range(3)))
+        other = await flights.run(request_key(b'%PDF', 'resume.pdf', 'go developer', None), compute)
+        return results, other, len(flights)
+
+    before = _coalesced('test-share')
+    results, other, in_flight = asyncio.run(scenario())
+    assert results == [{'score': 42}] * 3 and other == {'score': 42}
+    assert len(calls) == 2 and in_flight == 0
+    assert _coalesced('test-share') - before == 2
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def scenario():
+        flights = SingleFlight('test-cancel', enabled=True)
+        started = asyncio.Event()
+
+        async def compute():
+            started.set()
+            await asyncio.sleep(0.05)
+            return 'done'
+
+        first = asyncio.ensure_future(flights.run('k', compute))
+        second = asyncio.ensure_future(flights.run('k', compute))
+        await started.wait()
+        first.cancel()
+        result = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return result
+
+    assert asyncio.run(scenario()) == 'done'
+
+
+def test_computation_is_cancelled_when_every_caller_left():
+    async def scenario():
+        flights = SingleFlight('test-abandon', enabled=True)
+        cancelled = asyncio.Event()
+
+        async def compute():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(flights.run('k', compute))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return len(flights)
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_errors_reach_every_caller_and_are_not_remembered():
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError('corrupt file')
+
+    async def scenario():
+        flights = SingleFlight('test-error', enabled=True)
+        outcomes = await asyncio.gather(flights.run('k', failing), flights.run('k', failing),
+                                        return_exceptions=True)
+        with pytest.raises(ValueError):
+            await flights.run('k', failing)
+        return outcomes
+
+    outcomes = asyncio.run(scenario())
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert len(attempts) == 2
@@ -0,0 +1,65 @@
+import sys
+sys.path.insert(0, '..')
+
+import json
+
+import pytest
+
+from app.config import SKILL_DICTIONARY_PATH
+from app.services.skill_dictionary import (
+    compile_skill_dictionary,
+    get_skill_dictionary,
+    load_skill_dictionary,
+    reload_skill_dictionary,
+)
+from app.services.skill_extractor import extract_skills_from_resume
+
+
+def _dictionary_data():
+    with open(SKILL_DICTIONARY_PATH, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def test_bundled_dictionary_has_no_duplicate_spellings():
+    spellings = []
+    for entries in _dictionary_data()['skills'].values():
+        for entry in entries:
+            if isinstance(entry, str):
+                spellings.append(entry)
+            else:
+                spellings += [entry['name']] + entry.get('aliases', [])
+    assert len(spellings) == len(set(spellings))
+    assert load_skill_dictionary().describe()['spellings'] == len(spellings)
+
+
+def test_aliases_count_once_with_word_boundaries():
+    text = 'Built Node.js and NodeJS services on K8s and Kubernetes; reaction times in Golang'
+    assert extract_skills_from_resume(text) == ['Golang', 'Node.js', 'K8s']
+
+
+def test_reload_swaps_atomically(tmp_path):
+    data = _dictionary_data()
+    data['version'] = 'test-new-skill'
+    data['skills']['Other'].append({'name': 'zig', 'aliases': ['ziglang']})
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+    text = 'Systems work in Ziglang and Rust'
+    in_flight = get_skill_dictionary()
+    try:
+        reloaded = reload_skill_dictionary(str(path))
+        assert get_skill_dictionary() is reloaded and reloaded.version == 'test-new-skill'
+        assert 'Ziglang' not in extract_skills_from_resume(text, in_flight)
+        assert 'Ziglang' in extract_skills_from_resume(text)
+
+        path.write_text('{"version": "x", "skills": {"Other": [42]}}', encoding='utf-8')
+        with pytest.raises(ValueError):
+            reload_skill_dictionary(str(path))
+        assert get_skill_dictionary() is reloaded
+    finally:
+        reload_skill_dictionary()
+
+
+def test_invalid_dictionary_is_rejected():
+    with pytest.raises(ValueError):
+        compile_skill_dictionary({'version': '1', 'skills': {'Languages': 'python'}})
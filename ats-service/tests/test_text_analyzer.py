@@ -0,0 +1,41 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from synthetic_corpus import make_corpus
+from app.utils.text_cleaner import analyze, clean_text, tfidf_terms
+
+SAMPLES = make_corpus(10, seed=7) + ['Naïve café_x python3, C++ & React.js — İstanbul 12 a b']
+
+
+def _regex_clean_text(text, stop_words=None):
+    # clean_text() before the shared tokenizer
+    text = re.sub(r'\s+', ' ', re.sub(r'[^a-z\s]', ' ', text.lower())).strip()
+    if stop_words:
+        text = ' '.join(word for word in text.split() if word not in stop_words)
+    return text
+
+
+def test_tfidf_terms_match_sklearn_word_analyzer():
+    sklearn_analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+    for text in SAMPLES:
+        assert tfidf_terms(text) == sklearn_analyzer(text)
+
+
+def test_clean_text_unchanged():
+    stop_words = {'and', 'with', 'the'}
+    for text in SAMPLES:
+        assert clean_text(text) == _regex_clean_text(text)
+        assert clean_text(text, stop_words) == _regex_clean_text(text, stop_words)
+
+
+def test_document_is_analysed_once():
+    text = SAMPLES[0]
+    assert analyze(text) is analyze(text)
+    assert analyze(text).tokens is analyze(text).tokens
@@ -0,0 +1,98 @@
+import sys
+sys.path.insert(0, '..')
+
+import itertools
+import os
+import sqlite3
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus, render_pdf
+from app.services import text_cache
+from app.services.extraction_sandbox import ExtractionOutcome
+from app.services.text_cache import TextCache, cached_extract_document
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Cache timestamps that advance past the touch interval on every call.
+    """
+    ticks = itertools.count(start=1000, step=100)
+    monkeypatch.setattr(text_cache.time, 'time', lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    store = TextCache(str(tmp_path / 'text_cache.db'), 1 << 20)
+    monkeypatch.setattr(text_cache, 'get_text_cache', lambda: store)
+    return store
+
+
+def test_put_then_get_round_trip(tmp_path):
+    store = TextCache(str(tmp_path / 'text_cache.db'), 1 << 20)
+    key = store.make_key(b'%PDF-1.4 ...', 'resume.pdf')
+    assert store.get(key) is None
+
+    store.put(key, 'Jane Doe\nPython', ['PDF parsing warning'], 'text')
+    assert store.get(key) == ('Jane Doe\nPython', ['PDF parsing warning'], 'text')
+    assert store.make_key(b'%PDF-1.4 ...', 'resume.docx') != key
+    assert store.stats()['entries'] == 1
+
+
+def test_database_without_pdf_kind_is_migrated(tmp_path):
+    path = str(tmp_path / 'text_cache.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE extracted_text (key TEXT PRIMARY KEY, text TEXT NOT NULL, '
+                     'errors TEXT NOT NULL, size INTEGER NOT NULL, created_at REAL NOT NULL, '
+                     'last_access REAL NOT NULL)')
+        conn.execute("INSERT INTO extracted_text VALUES ('old', 'Old text', '[]', 8, 0, 0)")
+
+    store = TextCache(path, 1 << 20)
+    assert store.get('old') == ('Old text', [], None)
+    store.put('new', 'New text', [], 'mixed')
+    assert store.get('new') == ('New text', [], 'mixed')
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    store = TextCache(str(tmp_path / 'text_cache.db'), 100)
+    text = 'x' * 38  # 40 bytes with the '[]' errors list
+    store.put('a', text, [])
+    store.put('b', text, [])
+    assert store.get('a') is not None  # now more recent than 'b'
+    store.put('c', text, [])
+
+    assert store.get('b') is None
+    assert store.get('a') is not None and store.get('c') is not None
+    assert store.stats()['bytes'] <= 100
+
+
+def test_cached_extract_document_hits_on_second_call(cache):
+    pdf = render_pdf(make_corpus(1)[0])
+    first = cached_extract_document(pdf, 'resume.pdf')
+    second = cached_extract_document(pdf, 'resume.pdf')
+    assert not first.cache_hit and second.cache_hit
+    assert second.text == first.text and second.pdf_kind == first.pdf_kind
+
+    uncached = cached_extract_document(pdf, 'resume.pdf', use_cache=False)
+    assert not uncached.cache_hit and uncached.text == first.text
+
+
+@pytest.mark.parametrize('error', [
+    'PDF parsing error: limit exceeded (timeout after 10s)',
+    'PDF parsing error: limit exceeded (extractor crashed, exit code -9)',
+])
+def test_transient_failures_are_not_cached(cache, monkeypatch, error):
+    calls = []
+
+    def failing_extract(file_bytes, filename, max_pages=None):
+        calls.append(filename)
+        return ExtractionOutcome('', [error], False, None)
+
+    monkeypatch.setattr(text_cache, '_extract', failing_extract)
+    for _ in range(2):
+        document = cached_extract_document(b'%PDF-1.4 slow', 'resume.pdf')
+        assert document.errors == [error] and not document.cache_hit
+    assert len(calls) == 2 and cache.stats()['entries'] == 0
@@ -0,0 +1,15 @@
+import sys
+sys.path.insert(0, '..')
+
+from app.thread_budget import compute_thread_budget
+
+
+def test_cores_are_divided_between_workers():
+    assert compute_thread_budget(workers=4, threads=0, cpus=16).threads == 4
+    assert compute_thread_budget(workers=3, threads=0, cpus=8).threads == 2
+    assert compute_thread_budget(workers=8, threads=0, cpus=2).threads == 1
+
+
+def test_explicit_thread_count_wins():
+    budget = compute_thread_budget(workers=4, threads=3, cpus=16)
+    assert budget.threads == 3 and budget.source == 'ATS_THREADS_PER_WORKER'
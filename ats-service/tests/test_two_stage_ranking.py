@@ -0,0 +1,73 @@
+import sys
+sys.path.insert(0, '..')
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from synthetic_corpus import make_corpus, make_job_description, make_resume_text
+from app.services.chunked_encoding import chunk_resume
+from app.services.ranking import embed_resumes, rank_resumes, relevance_scores_tfidf, top_k_indices
+
+
+def _encoded_texts(jd, corpus, m):
+    """
+    Texts encoded when the TF-IDF top-m are re-ranked: their chunks and the JD.
+    """
+    candidates = top_k_indices(relevance_scores_tfidf(jd, corpus), m)
+    return sum(len(chunk_resume(corpus[i])) for i in candidates) + 1
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_two_stage_recovers_the_exhaustive_top_k(seed, hashing_encoder):
+    # Five resumes that repeat the JD are the known top-5 for both
+    # TF-IDF and SBERT; the prefilter only sees 15 of 65 resumes
+    rng = random.Random(seed)
+    jd = make_job_description(rng)
+    corpus = make_corpus(60, seed) + [make_resume_text(rng) + ('\n' + jd) * copies for copies in range(2, 7)]
+    planted = set(range(60, 65))
+
+    exhaustive, method = rank_resumes(jd, corpus, 5, hashing_encoder(), True)
+    assert method == 'SBERT' and {i for i, _ in exhaustive} == planted
+    model = hashing_encoder()
+    two_stage, method = rank_resumes(jd, corpus, 5, model, True, prefilter=15)
+    assert method == 'TF-IDF+SBERT' and model.calls == _encoded_texts(jd, corpus, 15)
+
+    overlap = {i for i, _ in two_stage} & {i for i, _ in exhaustive}
+    assert len(overlap) == 5
+    assert [i for i, _ in two_stage] == [i for i, _ in exhaustive]
+    np.testing.assert_allclose([s for _, s in two_stage], [s for _, s in exhaustive], atol=1e-6)
+
+
+def test_only_tfidf_top_m_are_encoded(hashing_encoder):
+    corpus = make_corpus(60)
+    jd = corpus[1]
+    model = hashing_encoder()
+    ranked, method = rank_resumes(jd, corpus, 5, model, True, prefilter=20)
+    assert method == 'TF-IDF+SBERT' and len(ranked) == 5
+    assert model.calls == _encoded_texts(jd, corpus, 20)
+    allowed = set(top_k_indices(relevance_scores_tfidf(jd, corpus), 20).tolist())
+    assert {index for index, _ in ranked} <= allowed
+
+
+def test_stored_embeddings_are_not_encoded_again(hashing_encoder):
+    corpus = make_corpus(40)
+    stored = embed_resumes(corpus, hashing_encoder())
+    exhaustive, _ = rank_resumes(corpus[2], corpus, 5, hashing_encoder(), True)
+
+    # Everything stored: exhaustive SBERT is one matmul, no prefilter
+    model = hashing_encoder()
+    ranked, method = rank_resumes(corpus[2], corpus, 5, model, True, prefilter=15,
+                                  lookup=lambda indices: {i: stored[i] for i in indices})
+    assert method == 'SBERT' and model.calls == 1
+    assert [i for i, _ in ranked] == [i for i, _ in exhaustive]
+
+    # Too many left to encode: two-stage, stored candidates not re-encoded
+    model = hashing_encoder()
+    _, method = rank_resumes(corpus[2], corpus, 5, model, True, prefilter=15,
+                             lookup=lambda indices: {i: stored[i] for i in indices if i < 10})
+    assert method == 'TF-IDF+SBERT' and model.calls < _encoded_texts(corpus[2], corpus, 15)
@@ -0,0 +1,48 @@
+import sys
+sys.path.insert(0, '..')
+
+import threading
+
+from app.config import WARMUP_DIR
+from app.services import metrics
+from app.warmup import describe_warmup, is_ready, load_samples, run_warmup
+
+
+def test_bundled_samples_cover_pdf_and_docx():
+    samples, job_descriptions = load_samples(WARMUP_DIR)
+    assert sorted(name.rsplit('.', 1)[1] for name, _ in samples) == ['docx', 'pdf']
+    assert job_descriptions
+
+
+def test_warmup_runs_every_sample_and_marks_ready():
+    status = run_warmup(WARMUP_DIR)
+    assert status['ready'] and is_ready() and status['state'] == 'done'
+    assert [s['file'] for s in status['samples']] == [name for name, _ in load_samples(WARMUP_DIR)[0]]
+    assert status['errors'] == []
+
+
+def test_warmup_leaves_the_metrics_untouched():
+    before = metrics.snapshot()
+    run_warmup(WARMUP_DIR)
+    assert metrics.snapshot() == before
+
+
+def test_suppression_only_applies_to_the_calling_thread():
+    def count():
+        return metrics.snapshot().get('ats_test_events_total', {}).get((), 0)
+
+    start = count()
+    with metrics.suppressed():
+        metrics.increment('ats_test_events_total')
+        worker = threading.Thread(target=metrics.increment, args=('ats_test_events_total',))
+        worker.start()
+        worker.join()
+    assert count() == start + 1
+    metrics.increment('ats_test_events_total')
+    assert count() == start + 2
+
+
+def test_missing_samples_are_reported_without_blocking_readiness(tmp_path):
+    status = run_warmup(str(tmp_path))
+    assert status['ready'] and status['samples'] == []
+    assert 'No PDF or DOCX samples' in describe_warmup()['errors'][0]